@@ -0,0 +1,32 @@
+"""Record which extractor or model tier served each enrichment task
+
+Revision ID: 1c7d3e9a5b28
+Revises: f4c81d2b9e63
+Create Date: 2026-10-19 18:52:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c7d3e9a5b28'
+down_revision: Union[str, Sequence[str], None] = 'f4c81d2b9e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('enrichment_tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('served_by', sa.String(length=255), nullable=True))
+        batch_op.create_index(batch_op.f('ix_enrichment_tasks_served_by'), ['served_by'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('enrichment_tasks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_enrichment_tasks_served_by'))
+        batch_op.drop_column('served_by')
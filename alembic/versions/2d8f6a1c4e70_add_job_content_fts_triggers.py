@@ -0,0 +1,36 @@
+"""Keep jobs_fts description in sync with job_content triggers
+
+Revision ID: 2d8f6a1c4e70
+Revises: 9e4a2c6b8d15
+Create Date: 2026-10-19 22:14:07.532916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.models import JOB_CONTENT_FTS_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8f6a1c4e70'
+down_revision: Union[str, Sequence[str], None] = '9e4a2c6b8d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in JOB_CONTENT_FTS_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TRIGGER IF EXISTS job_content_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS job_content_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS job_content_fts_ai")
@@ -0,0 +1,77 @@
+"""Add jobs full-text search index
+
+Revision ID: 3f1c5b7e9a20
+Revises: a8d2f70c21b8
+Create Date: 2026-10-19 09:12:44.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c5b7e9a20'
+down_revision: Union[str, Sequence[str], None] = 'a8d2f70c21b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title,
+            company,
+            location,
+            description,
+            content='jobs',
+            content_rowid='id',
+            prefix='2 3',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts(rowid, title, company, location, description)
+            VALUES (new.id, new.title, new.company, new.location, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+        AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+            INSERT INTO jobs_fts(rowid, title, company, location, description)
+            VALUES (new.id, new.title, new.company, new.location, new.description);
+        END
+        """
+    )
+    op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_ai")
+    op.execute("DROP TABLE IF EXISTS jobs_fts")
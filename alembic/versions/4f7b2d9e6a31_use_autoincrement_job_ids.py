@@ -0,0 +1,43 @@
+"""Stop SQLite reusing the ids of deleted jobs
+
+Revision ID: 4f7b2d9e6a31
+Revises: 6c3a8e1f5d92
+Create Date: 2026-10-20 09:41:12.306518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.models import JOBS_FTS_TRIGGERS_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f7b2d9e6a31'
+down_revision: Union[str, Sequence[str], None] = '6c3a8e1f5d92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_jobs(autoincrement: bool) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table(
+        'jobs',
+        recreate='always',
+        table_kwargs={'sqlite_autoincrement': autoincrement},
+    ):
+        pass
+    # Batch mode recreates jobs, which drops the triggers defined on it.
+    for statement in JOBS_FTS_TRIGGERS_DDL:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_jobs(autoincrement=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_jobs(autoincrement=False)
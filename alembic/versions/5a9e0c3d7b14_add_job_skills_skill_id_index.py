@@ -0,0 +1,29 @@
+"""Add skill_id-first index on job_skills
+
+Revision ID: 5a9e0c3d7b14
+Revises: e2a85f17c3b9
+Create Date: 2026-10-19 15:03:41.287765
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9e0c3d7b14'
+down_revision: Union[str, Sequence[str], None] = 'e2a85f17c3b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('job_skills', schema=None) as batch_op:
+        batch_op.create_index('ix_job_skills_skill_id_job_id', ['skill_id', 'job_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('job_skills', schema=None) as batch_op:
+        batch_op.drop_index('ix_job_skills_skill_id_job_id')
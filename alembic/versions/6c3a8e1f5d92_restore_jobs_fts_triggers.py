@@ -0,0 +1,41 @@
+"""Restore jobs_fts triggers dropped by the locations migration
+
+Revision ID: 6c3a8e1f5d92
+Revises: 2d8f6a1c4e70
+Create Date: 2026-10-19 23:05:51.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.models import JOBS_FTS_TRIGGERS_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c3a8e1f5d92'
+down_revision: Union[str, Sequence[str], None] = '2d8f6a1c4e70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in JOBS_FTS_TRIGGERS_DDL:
+        op.execute(statement)
+    # Jobs written while the triggers were missing are absent or stale.
+    op.execute("DELETE FROM jobs_fts")
+    op.execute(
+        "INSERT INTO jobs_fts(rowid, title, company, location, description) "
+        "SELECT jobs.id, jobs.title, jobs.company, jobs.location, "
+        "job_content_text(job_content.description, job_content.codec) "
+        "FROM jobs LEFT OUTER JOIN job_content ON job_content.job_id = jobs.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The triggers belong to the earlier schema too; nothing to undo.
+    pass
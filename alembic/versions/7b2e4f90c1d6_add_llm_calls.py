@@ -0,0 +1,48 @@
+"""Add llm_calls table for persisted LLM call telemetry
+
+Revision ID: 7b2e4f90c1d6
+Revises: 1c7d3e9a5b28
+Create Date: 2026-10-19 19:49:23.474915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4f90c1d6'
+down_revision: Union[str, Sequence[str], None] = '1c7d3e9a5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('llm_calls',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('model', sa.String(length=255), nullable=False),
+    sa.Column('outcome', sa.String(length=30), nullable=False),
+    sa.Column('latency_ms', sa.Float(), nullable=False),
+    sa.Column('load_ms', sa.Float(), nullable=True),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+    sa.Column('completion_tokens', sa.Integer(), nullable=True),
+    sa.Column('prompt_eval_ms', sa.Float(), nullable=True),
+    sa.Column('eval_ms', sa.Float(), nullable=True),
+    sa.Column('prompt_version', sa.String(length=20), server_default='', nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('llm_calls', schema=None) as batch_op:
+        batch_op.create_index('ix_llm_calls_model_created_at', ['model', 'created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_llm_calls_outcome'), ['outcome'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('llm_calls', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_llm_calls_outcome'))
+        batch_op.drop_index('ix_llm_calls_model_created_at')
+
+    op.drop_table('llm_calls')
@@ -0,0 +1,102 @@
+"""Add locations dimension and jobs.location_id
+
+Revision ID: 8b17f4e2a6c5
+Revises: 5a9e0c3d7b14
+Create Date: 2026-10-19 15:48:27.903312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.models import JOBS_FTS_TRIGGERS_DDL
+from src.services.location_service import parse_location
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b17f4e2a6c5'
+down_revision: Union[str, Sequence[str], None] = '5a9e0c3d7b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill_location_ids() -> None:
+    bind = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('location', sa.String),
+        sa.column('location_id', sa.Integer),
+    )
+    locations = sa.table(
+        'locations',
+        sa.column('id', sa.Integer),
+        sa.column('city', sa.String),
+        sa.column('region', sa.String),
+        sa.column('country', sa.String),
+        sa.column('is_remote', sa.Boolean),
+    )
+
+    location_ids = {}
+    raws = bind.execute(
+        sa.select(jobs.c.location).where(jobs.c.location.is_not(None)).distinct()
+    ).scalars().all()
+    for raw in raws:
+        parsed = parse_location(raw)
+        if parsed is None:
+            continue
+        if parsed not in location_ids:
+            location_ids[parsed] = bind.execute(
+                sa.insert(locations).values(**parsed._asdict()).returning(locations.c.id)
+            ).scalar_one()
+        bind.execute(
+            sa.update(jobs)
+            .where(jobs.c.location == raw)
+            .values(location_id=location_ids[parsed])
+        )
+
+
+def _restore_fts_triggers() -> None:
+    # Batch mode recreates jobs, which drops the triggers defined on it.
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in JOBS_FTS_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('locations',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('city', sa.String(length=255), server_default='', nullable=False),
+    sa.Column('region', sa.String(length=255), server_default='', nullable=False),
+    sa.Column('country', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('is_remote', sa.Boolean(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('city', 'region', 'country', 'is_remote', name='uq_locations_parts')
+    )
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_locations_country'), ['country'], unique=False)
+        batch_op.create_index(batch_op.f('ix_locations_region'), ['region'], unique=False)
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('location_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_jobs_location_id'), ['location_id'], unique=False)
+        batch_op.create_foreign_key('fk_jobs_location_id_locations', 'locations', ['location_id'], ['id'])
+    _restore_fts_triggers()
+
+    _backfill_location_ids()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_jobs_location_id_locations', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_jobs_location_id'))
+        batch_op.drop_column('location_id')
+    _restore_fts_triggers()
+
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_locations_region'))
+        batch_op.drop_index(batch_op.f('ix_locations_country'))
+
+    op.drop_table('locations')
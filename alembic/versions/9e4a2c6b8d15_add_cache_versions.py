@@ -0,0 +1,32 @@
+"""Add cache_versions table for cross-process cache invalidation
+
+Revision ID: 9e4a2c6b8d15
+Revises: 7b2e4f90c1d6
+Create Date: 2026-10-19 21:02:41.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a2c6b8d15'
+down_revision: Union[str, Sequence[str], None] = '7b2e4f90c1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
@@ -0,0 +1,45 @@
+"""Bump a cache version on every jobs / job_skills write
+
+Revision ID: a3c5e7f9b1d2
+Revises: 4f7b2d9e6a31
+Create Date: 2026-10-20 11:02:45.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.models import JOB_SKILLS_VERSION_TRIGGERS_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d2'
+down_revision: Union[str, Sequence[str], None] = '4f7b2d9e6a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGGERS = (
+    'jobs_version_ai',
+    'jobs_version_ad',
+    'jobs_version_au',
+    'job_skills_version_ai',
+    'job_skills_version_ad',
+    'job_skills_version_au',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in JOB_SKILLS_VERSION_TRIGGERS_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for trigger in reversed(_TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DELETE FROM cache_versions WHERE name = 'job_skills'")
@@ -0,0 +1,207 @@
+"""Move job description and raw HTML to compressed job_content table
+
+Revision ID: b41e6d2c8f53
+Revises: 3f1c5b7e9a20
+Create Date: 2026-10-19 11:02:17.530418
+
+"""
+from typing import Sequence, Union
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.models import JOBS_FTS_TABLE_DDL, JOBS_FTS_TRIGGERS_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e6d2c8f53'
+down_revision: Union[str, Sequence[str], None] = '3f1c5b7e9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _compress(value):
+    if value is None:
+        return None
+    return zlib.compress(value.encode("utf-8"), 6)
+
+
+def _decompress(value, codec):
+    if value is None:
+        return None
+    if codec == "zlib":
+        return zlib.decompress(value).decode("utf-8")
+    if codec == "identity":
+        return bytes(value).decode("utf-8")
+    raise RuntimeError(f"Cannot downgrade job_content stored with codec {codec!r}")
+
+
+def _drop_fts() -> None:
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS jobs_fts_ai")
+    op.execute("DROP TABLE IF EXISTS jobs_fts")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    is_sqlite = bind.dialect.name == "sqlite"
+
+    if is_sqlite:
+        _drop_fts()
+        op.execute(JOBS_FTS_TABLE_DDL)
+        op.execute(
+            "INSERT INTO jobs_fts(rowid, title, company, location) "
+            "SELECT id, title, company, location FROM jobs"
+        )
+
+    op.create_table('job_content',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('codec', sa.String(length=20), server_default='zlib', nullable=False),
+    sa.Column('description', sa.LargeBinary(), nullable=True),
+    sa.Column('raw_html', sa.LargeBinary(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+
+    select_batch = sa.text(
+        "SELECT id, description, raw_html FROM jobs "
+        "WHERE id > :last_id "
+        "AND (description IS NOT NULL OR raw_html IS NOT NULL) "
+        "ORDER BY id LIMIT :limit"
+    )
+    insert_content = sa.text(
+        "INSERT INTO job_content (job_id, codec, description, raw_html) "
+        "VALUES (:job_id, 'zlib', :description, :raw_html)"
+    )
+    update_fts = sa.text(
+        "UPDATE jobs_fts SET description = :description WHERE rowid = :job_id"
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            select_batch, {"last_id": last_id, "limit": BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            insert_content,
+            [
+                {
+                    "job_id": row.id,
+                    "description": _compress(row.description),
+                    "raw_html": _compress(row.raw_html),
+                }
+                for row in rows
+            ],
+        )
+        if is_sqlite:
+            described = [
+                {"job_id": row.id, "description": row.description}
+                for row in rows
+                if row.description is not None
+            ]
+            if described:
+                bind.execute(update_fts, described)
+        last_id = rows[-1].id
+
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('raw_html')
+        batch_op.drop_column('description')
+
+    # Recreating the table in batch mode dropped any triggers on jobs.
+    if is_sqlite:
+        for statement in JOBS_FTS_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    is_sqlite = bind.dialect.name == "sqlite"
+
+    if is_sqlite:
+        _drop_fts()
+
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('description', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('raw_html', sa.Text(), nullable=True))
+
+    select_batch = sa.text(
+        "SELECT job_id, codec, description, raw_html FROM job_content "
+        "WHERE job_id > :last_id ORDER BY job_id LIMIT :limit"
+    )
+    update_job = sa.text(
+        "UPDATE jobs SET description = :description, raw_html = :raw_html "
+        "WHERE id = :job_id"
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            select_batch, {"last_id": last_id, "limit": BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            update_job,
+            [
+                {
+                    "job_id": row.job_id,
+                    "description": _decompress(row.description, row.codec),
+                    "raw_html": _decompress(row.raw_html, row.codec),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].job_id
+
+    op.drop_table('job_content')
+
+    if is_sqlite:
+        op.execute(
+            """
+            CREATE VIRTUAL TABLE jobs_fts USING fts5(
+                title,
+                company,
+                location,
+                description,
+                content='jobs',
+                content_rowid='id',
+                prefix='2 3',
+                tokenize='porter unicode61 remove_diacritics 2'
+            )
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, title, company, location, description)
+                VALUES (new.id, new.title, new.company, new.location, new.description);
+            END
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+                VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+            END
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER jobs_fts_au
+            AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+                VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+                INSERT INTO jobs_fts(rowid, title, company, location, description)
+                VALUES (new.id, new.title, new.company, new.location, new.description);
+            END
+            """
+        )
+        op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
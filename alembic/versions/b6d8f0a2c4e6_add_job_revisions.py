@@ -0,0 +1,49 @@
+"""Track edits to job text in job_revisions
+
+Revision ID: b6d8f0a2c4e6
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-20 13:27:51.904362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.models import JOB_REVISION_TRIGGERS_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d8f0a2c4e6'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGGERS = (
+    'job_content_revision_ai',
+    'job_content_revision_au',
+    'jobs_revision_au',
+    'jobs_revision_ad',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_revisions',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in JOB_REVISION_TRIGGERS_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for trigger in reversed(_TRIGGERS):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DELETE FROM cache_versions WHERE name = 'job_content'")
+    op.drop_table('job_revisions')
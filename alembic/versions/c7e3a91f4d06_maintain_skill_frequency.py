@@ -0,0 +1,54 @@
+"""Maintain skills.frequency as an indexed job counter
+
+Revision ID: c7e3a91f4d06
+Revises: b41e6d2c8f53
+Create Date: 2026-10-19 13:40:52.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a91f4d06'
+down_revision: Union[str, Sequence[str], None] = 'b41e6d2c8f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.alter_column(
+            'frequency',
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            server_default='0',
+        )
+        batch_op.create_index(
+            batch_op.f('ix_skills_frequency'), ['frequency'], unique=False
+        )
+
+    op.execute(
+        """
+        UPDATE skills SET frequency = (
+            SELECT count(*) FROM job_skills
+            JOIN jobs ON jobs.id = job_skills.job_id
+            WHERE job_skills.skill_id = skills.id AND jobs.status = 'active'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skills_frequency'))
+        batch_op.alter_column(
+            'frequency',
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            server_default='1',
+        )
@@ -0,0 +1,78 @@
+"""Add skill taxonomy: aliases, categories and closure table
+
+Revision ID: d93b6a1e0f47
+Revises: 8b17f4e2a6c5
+Create Date: 2026-10-19 16:31:55.472810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93b6a1e0f47'
+down_revision: Union[str, Sequence[str], None] = '8b17f4e2a6c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('skill_categories',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['parent_id'], ['skill_categories.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    with op.batch_alter_table('skill_categories', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skill_categories_parent_id'), ['parent_id'], unique=False)
+
+    op.create_table('skill_category_closure',
+    sa.Column('ancestor_id', sa.Integer(), nullable=False),
+    sa.Column('descendant_id', sa.Integer(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['skill_categories.id'], ),
+    sa.ForeignKeyConstraint(['descendant_id'], ['skill_categories.id'], ),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    with op.batch_alter_table('skill_category_closure', schema=None) as batch_op:
+        batch_op.create_index('ix_skill_category_closure_descendant', ['descendant_id', 'ancestor_id'], unique=False)
+
+    op.create_table('skill_aliases',
+    sa.Column('alias', sa.String(length=255), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ),
+    sa.PrimaryKeyConstraint('alias')
+    )
+    with op.batch_alter_table('skill_aliases', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skill_aliases_skill_id'), ['skill_id'], unique=False)
+
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('category_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_skills_category_id'), ['category_id'], unique=False)
+        batch_op.create_foreign_key('fk_skills_category_id_skill_categories', 'skill_categories', ['category_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_skills_category_id_skill_categories', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_skills_category_id'))
+        batch_op.drop_column('category_id')
+
+    with op.batch_alter_table('skill_aliases', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skill_aliases_skill_id'))
+
+    op.drop_table('skill_aliases')
+    with op.batch_alter_table('skill_category_closure', schema=None) as batch_op:
+        batch_op.drop_index('ix_skill_category_closure_descendant')
+
+    op.drop_table('skill_category_closure')
+    with op.batch_alter_table('skill_categories', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skill_categories_parent_id'))
+
+    op.drop_table('skill_categories')
@@ -0,0 +1,54 @@
+"""Add skill_demand_daily rollup
+
+Revision ID: e2a85f17c3b9
+Revises: c7e3a91f4d06
+Create Date: 2026-10-19 14:22:09.604131
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a85f17c3b9'
+down_revision: Union[str, Sequence[str], None] = 'c7e3a91f4d06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('skill_demand_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.Column('source_platform', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ),
+    sa.PrimaryKeyConstraint('day', 'skill_id', 'source_platform')
+    )
+    with op.batch_alter_table('skill_demand_daily', schema=None) as batch_op:
+        batch_op.create_index('ix_skill_demand_daily_skill_day', ['skill_id', 'day'], unique=False)
+
+    if op.get_bind().dialect.name == 'sqlite':
+        job_day = "date(coalesce(jobs.posted_date, jobs.scraped_at))"
+    else:
+        job_day = "coalesce(jobs.posted_date, CAST(jobs.scraped_at AS DATE))"
+    op.execute(
+        f"""
+        INSERT INTO skill_demand_daily (day, skill_id, source_platform, count)
+        SELECT {job_day}, job_skills.skill_id, coalesce(jobs.source_platform, ''),
+               count(*)
+        FROM job_skills JOIN jobs ON jobs.id = job_skills.job_id
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('skill_demand_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_skill_demand_daily_skill_day')
+
+    op.drop_table('skill_demand_daily')
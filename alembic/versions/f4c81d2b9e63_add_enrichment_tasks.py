@@ -0,0 +1,55 @@
+"""Add enrichment_tasks queue for skill extraction
+
+Revision ID: f4c81d2b9e63
+Revises: d93b6a1e0f47
+Create Date: 2026-10-19 18:04:12.391027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c81d2b9e63'
+down_revision: Union[str, Sequence[str], None] = 'd93b6a1e0f47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('enrichment_tasks',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('leased_by', sa.String(length=100), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    with op.batch_alter_table('enrichment_tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_enrichment_tasks_status_next_attempt', ['status', 'next_attempt_at'], unique=False)
+
+    # Jobs that already have skills are done; everything else is queued.
+    op.execute(
+        """
+        INSERT INTO enrichment_tasks (job_id, status)
+        SELECT jobs.id,
+               CASE WHEN EXISTS (
+                   SELECT 1 FROM job_skills WHERE job_skills.job_id = jobs.id
+               ) THEN 'done' ELSE 'pending' END
+        FROM jobs
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('enrichment_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_enrichment_tasks_status_next_attempt')
+
+    op.drop_table('enrichment_tasks')
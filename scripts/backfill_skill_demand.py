@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.database.session import SessionLocal
+from src.services.skill_stats_service import SkillStatsService
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the skill_demand_daily rollup from stored jobs"
+    )
+    parser.add_argument("--start", type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day (YYYY-MM-DD)")
+    return parser.parse_args()
+
+
+def backfill(start: date | None = None, end: date | None = None) -> int:
+    session = SessionLocal()
+    try:
+        rows = SkillStatsService(session).backfill_demand(start=start, end=end)
+        session.commit()
+        return rows
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    print(f"Wrote {backfill(args.start, args.end)} skill demand rows")
@@ -0,0 +1,192 @@
+"""Benchmark skill enrichment against the fake Ollama server.
+
+For each job count, seeds a scratch SQLite database with queued jobs, then
+drains the queue through ``JobService.process_new_jobs_with_ai`` and reports
+jobs per second, SQL statements per job and CPU time per job. The fake
+server runs in a child process, so the CPU time is our own overhead
+(prompting, HTTP, JSON, matching, saves) without any model time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import ollama
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.fake_ollama import FAKE_SKILLS, FakeOllamaServer
+from src.ai.circuit_breaker import CircuitBreaker
+from src.ai.llm_client import LLMClient
+from src.ai.telemetry import LLMTelemetry
+from src.database.models import Base, EnrichmentTask, Job
+from src.database.session import configure_sqlite_engine
+from src.services.enrichment_queue import EnrichmentQueue
+from src.services.job_service import JobService
+from src.services.skill_service import SkillService
+
+_FILLER = (
+    "You will work with a friendly cross-functional team.",
+    "We ship small changes often and review each other's code.",
+    "Experience building production systems is expected.",
+    "You will own services end to end, from design to on-call.",
+    "Mentoring junior engineers is part of the role.",
+)
+_SEED_CHUNK = 2_000
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure skill enrichment throughput against a fake Ollama"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Job counts to benchmark",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0, help="Fake model latency per request"
+    )
+    parser.add_argument(
+        "--server-concurrency", type=int, default=4, help="Fake OLLAMA_NUM_PARALLEL"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests failing"
+    )
+    parser.add_argument(
+        "--claim-limit", type=int, default=100, help="Jobs claimed per processing call"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Client LLM_CONCURRENCY override"
+    )
+    return parser.parse_args()
+
+
+def _serve(url_queue, latency_ms: float, concurrency: int, error_rate: float) -> None:
+    server = FakeOllamaServer(
+        latency_ms=latency_ms, max_concurrency=concurrency, error_rate=error_rate
+    )
+    url_queue.put(server.url)
+    server.serve_forever()
+
+
+def _description(rng: random.Random, index: int) -> str:
+    skills = rng.sample(FAKE_SKILLS, rng.randint(3, 6))
+    lines = [f"Engineer {index}", f"Requirements: {', '.join(skills)}."]
+    lines += rng.sample(_FILLER, 3)
+    return "\n".join(lines)
+
+
+def _seed(session_factory, count: int) -> None:
+    rng = random.Random(count)
+    for start in range(0, count, _SEED_CHUNK):
+        with session_factory() as session:
+            for index in range(start, min(count, start + _SEED_CHUNK)):
+                job = Job(
+                    company=f"Company {index % 500}",
+                    title=f"Engineer {index}",
+                    url=f"https://jobs.example.com/bench/{index}",
+                    description=_description(rng, index),
+                )
+                job.enrichment_task = EnrichmentTask()
+                session.add(job)
+            session.commit()
+
+
+def run_benchmark(
+    count: int, ollama_url: str, claim_limit: int, concurrency: int | None
+) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/bench.db")
+        configure_sqlite_engine(engine)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+        _seed(session_factory, count)
+
+        statements = 0
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _count(*_args) -> None:
+            nonlocal statements
+            statements += 1
+
+        telemetry = LLMTelemetry(persist=False)
+        llm_client = LLMClient(
+            models=["fake"],
+            client=ollama.Client(host=ollama_url),
+            circuit_breaker=CircuitBreaker(),
+            telemetry=telemetry,
+        )
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        while True:
+            with session_factory() as session:
+                claimed = JobService(session).process_new_jobs_with_ai(
+                    SkillService(session, llm_client), claim_limit, concurrency
+                )
+                session.commit()
+            if not claimed:
+                break
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+
+        with session_factory() as session:
+            done = EnrichmentQueue(session).stats().done
+        engine.dispose()
+
+    llm_calls = sum(stats.calls for stats in telemetry.snapshot().values())
+    return {
+        "jobs": count,
+        "done": done,
+        "seconds": wall,
+        "jobs_per_second": done / wall if wall else 0.0,
+        "statements_per_job": statements / count,
+        "cpu_ms_per_job": cpu * 1000 / count,
+        "llm_calls": llm_calls,
+    }
+
+
+def main() -> None:
+    args = _parse_args()
+    url_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(url_queue, args.latency_ms, args.server_concurrency, args.error_rate),
+        daemon=True,
+    )
+    server.start()
+    ollama_url = url_queue.get(timeout=10)
+    try:
+        print(
+            f"{'jobs':>8} {'done':>8} {'seconds':>9} {'jobs/s':>9} "
+            f"{'stmts/job':>10} {'cpu ms/job':>11} {'llm calls':>10}"
+        )
+        for count in args.jobs:
+            result = run_benchmark(
+                count, ollama_url, args.claim_limit, args.concurrency
+            )
+            print(
+                f"{result['jobs']:>8} {result['done']:>8} {result['seconds']:>9.2f} "
+                f"{result['jobs_per_second']:>9.1f} "
+                f"{result['statements_per_job']:>10.2f} "
+                f"{result['cpu_ms_per_job']:>11.2f} {result['llm_calls']:>10}"
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
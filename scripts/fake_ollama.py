@@ -0,0 +1,230 @@
+"""Stand-in Ollama HTTP server for tests and benchmarks.
+
+``FakeOllamaServer`` speaks enough of the Ollama API (``/api/chat``,
+``/api/generate``, ``/api/tags``) for ``LLMClient``: it answers skill
+prompts with deterministic skill JSON (single-job and batched), streams
+NDJSON like the real server, and can add latency, cap parallel requests
+like ``OLLAMA_NUM_PARALLEL`` (extra requests queue) and fail a fraction of
+requests with a 500.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+
+FAKE_SKILLS = (
+    "python", "sql", "aws", "docker", "kubernetes", "react", "typescript",
+    "java", "go", "rust", "postgresql", "redis", "kafka", "spark", "airflow",
+    "terraform", "linux", "git", "django", "fastapi", "pandas", "numpy",
+    "pytorch", "tensorflow", "graphql", "azure", "gcp", "snowflake", "dbt",
+    "tableau",
+)  # fmt: skip
+
+_JOB_HEADER_RE = re.compile(r"^Job (\d+):$", re.MULTILINE)
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*")
+_CHUNK_CHARS = 16
+_MIN_SKILLS = 3
+
+
+def fake_skills(description: str) -> list[str]:
+    """Known skills mentioned in ``description``, padded deterministically
+    from its hash so every job gets at least a few.
+    """
+    words = set(_WORD_RE.findall(description.lower()))
+    skills = [skill for skill in FAKE_SKILLS if skill in words]
+    seed = int.from_bytes(hashlib.sha256(description.encode()).digest()[:8], "big")
+    index = seed % len(FAKE_SKILLS)
+    while len(skills) < _MIN_SKILLS:
+        skill = FAKE_SKILLS[index % len(FAKE_SKILLS)]
+        if skill not in skills:
+            skills.append(skill)
+        index += 7
+    return skills
+
+
+def fake_reply(prompt: str) -> dict[str, Any]:
+    """Skill JSON for a single-job or batched skill prompt."""
+    headers = list(_JOB_HEADER_RE.finditer(prompt))
+    if not headers:
+        return {"skills": fake_skills(prompt.partition("Job description:")[2])}
+    reply = {}
+    for header, following in zip(headers, headers[1:] + [None]):
+        end = following.start() if following else len(prompt)
+        reply[header.group(1)] = {"skills": fake_skills(prompt[header.end() : end])}
+    return reply
+
+
+class FakeOllamaServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0,
+        max_concurrency: int = 4,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeOllamaServer:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-ollama", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            self.errors += failed
+            return failed
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path == "/api/tags":
+                    self._send_json(200, {"models": []})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if self.path == "/api/generate":
+                    self._send_json(200, server._generate(body))
+                elif self.path == "/api/chat":
+                    with server._slots:
+                        server._track(1)
+                        try:
+                            self._chat(body)
+                        finally:
+                            server._track(-1)
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def _chat(self, body: dict[str, Any]) -> None:
+                started = time.perf_counter()
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                if server._should_fail():
+                    self._send_json(500, {"error": "fake server error"})
+                    return
+                prompt = body["messages"][-1]["content"]
+                content = json.dumps(fake_reply(prompt))
+                final = server._final_chunk(body, prompt, content, started)
+                if not body.get("stream", True):
+                    self._send_json(200, {**final, "message": _message(content)})
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for start in range(0, len(content), _CHUNK_CHARS):
+                        piece = content[start : start + _CHUNK_CHARS]
+                        self._send_chunk(_chunk(body, piece))
+                    self._send_chunk(final)
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client cancelled the stream.
+                    self.close_connection = True
+
+            def _send_chunk(self, payload: dict[str, Any]) -> None:
+                line = json.dumps(payload).encode() + b"\n"
+                self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                self.wfile.flush()
+
+            def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def _track(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _generate(self, body: dict[str, Any]) -> dict[str, Any]:
+        return {**_chunk(body, ""), "response": "", "done": True, "done_reason": "load"}
+
+    def _final_chunk(
+        self, body: dict[str, Any], prompt: str, content: str, started: float
+    ) -> dict[str, Any]:
+        total_ns = int((time.perf_counter() - started) * 1e9)
+        return {
+            **_chunk(body, ""),
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": total_ns,
+            "load_duration": 0,
+            "prompt_eval_count": len(prompt) // 4 + 1,
+            "prompt_eval_duration": total_ns // 4,
+            "eval_count": len(content) // 4 + 1,
+            "eval_duration": total_ns - total_ns // 4,
+        }
+
+
+def _message(content: str) -> dict[str, str]:
+    return {"role": "assistant", "content": content}
+
+
+def _chunk(body: dict[str, Any], content: str) -> dict[str, Any]:
+    return {
+        "model": body.get("model", ""),
+        "created_at": datetime.now(UTC).isoformat(),
+        "message": _message(content),
+        "done": False,
+    }
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.fake_ollama import FakeOllamaServer
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Serve deterministic skill JSON on the Ollama API"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=11435, help="Port to listen on")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0, help="Added latency per chat request"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Chat requests served in parallel; the rest queue",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for injected errors")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    server = FakeOllamaServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        max_concurrency=args.concurrency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Fake Ollama listening on {server.url} (OLLAMA_HOST={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -9,6 +9,7 @@ if str(ROOT_DIR) not in sys.path:
 
 from src.database.models import Application, Job, JobSkill, Skill
 from src.database.session import SessionLocal
+from src.services.skill_stats_service import SkillStatsService
 
 
 def _database_has_data(session) -> bool:
@@ -36,6 +37,8 @@ def seed_database() -> None:
         ]
 
         session.add_all([job, python_skill, sql_skill])
+        session.flush()
+        SkillStatsService(session).reconcile_frequencies()
         session.commit()
     finally:
         session.close()
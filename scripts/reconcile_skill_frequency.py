@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.database.session import SessionLocal
+from src.services.skill_stats_service import SkillStatsService
+
+
+def reconcile() -> int:
+    session = SessionLocal()
+    try:
+        fixed = SkillStatsService(session).reconcile_frequencies()
+        session.commit()
+        return fixed
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    print(f"Reconciled {reconcile()} skill frequency counters")
@@ -13,11 +13,18 @@ if str(ROOT_DIR) not in sys.path:
 
 from src.automation.scheduler import JobScheduler
 from src.ai.llm_client import LLMClient
-from src.database.session import SessionLocal
+from src.ai.response_cache import get_response_cache
+from src.ai.telemetry import get_llm_telemetry
+from src.config import settings
+from src.database.session import SessionLocal, get_async_sessionmaker
+from src.database.writer import get_write_coordinator
 from src.logger import get_logger
 from src.scrapers.linkedin import LinkedInScraper
-from src.services.job_service import JobService
-from src.services.skill_service import SkillService
+from src.services.embedding_service import run_embedding
+from src.services.job_service import AsyncJobService
+from src.services.relevance_index import refresh_relevance_index
+from src.services.retention_service import run_scheduled_retention
+from src.services.skill_service import AsyncSkillService
 
 
 def _parse_args() -> argparse.Namespace:
@@ -29,6 +36,12 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--hour", type=int, default=8, help="Daily run hour.")
     parser.add_argument("--minute", type=int, default=0, help="Daily run minute.")
+    parser.add_argument(
+        "--retention-hour",
+        type=int,
+        default=3,
+        help="Daily retention run hour (when RETENTION_ENABLED is set).",
+    )
     parser.add_argument("--keywords", default="Python", help="Search keywords.")
     parser.add_argument("--location", default="Remote", help="Search location.")
     parser.add_argument(
@@ -44,9 +57,10 @@ def _parse_args() -> argparse.Namespace:
 async def main() -> None:
     args = _parse_args()
     logger = get_logger("run_scraper")
-    db_session = SessionLocal()
+    db_session = get_async_sessionmaker()()
     request_session = requests.Session()
-    job_service = JobService(db_session)
+    writer = get_write_coordinator()
+    job_service = AsyncJobService(db_session, writer=writer)
     scraper = LinkedInScraper(request_session, logger)
     scheduler = JobScheduler()
 
@@ -61,7 +75,8 @@ async def main() -> None:
                 }
             )
             logger.info("Scraped %s job cards", len(results))
-            for index, result in enumerate(results, start=1):
+            upserts = []
+            for result in results:
                 company = result.get("company")
                 title = result.get("title")
                 if not company or not title:
@@ -76,29 +91,54 @@ async def main() -> None:
                     "url": result.get("url"),
                     "source_platform": "linkedin",
                 }
-                job_service.upsert_job(payload)
-                logger.info(
-                    "Upserted job %s/%s: %s",
-                    index,
-                    len(results),
-                    result.get("title"),
-                )
-            llm_client = LLMClient()
-            skill_service = SkillService(db_session, llm_client)
+                upserts.append(job_service.upsert_job(payload))
+            # Submitted together so the writer can group-commit them.
+            outcomes = await asyncio.gather(*upserts, return_exceptions=True)
+            failed = [item for item in outcomes if isinstance(item, Exception)]
+            for error in failed:
+                logger.warning("Failed to upsert job: %s", error)
+            logger.info("Upserted %s jobs", len(outcomes) - len(failed))
+            llm_client = LLMClient(cache=get_response_cache())
+            skill_service = AsyncSkillService(db_session, llm_client, writer=writer)
             logger.info("Starting AI processing for new jobs")
-            processed = job_service.process_new_jobs_with_ai(skill_service)
+            processed = await job_service.process_new_jobs_with_ai(skill_service)
             logger.info("AI processing complete: %s jobs processed", processed)
-            db_session.commit()
+            if settings.embeddings_enabled:
+                # Reads committed jobs through its own session, off the loop.
+                await asyncio.to_thread(run_embedding, SessionLocal, llm_client)
+            await asyncio.to_thread(refresh_relevance_index, SessionLocal)
+            telemetry = get_llm_telemetry()
+            telemetry.log_summary()
+            if telemetry.persist:
+                await writer.execute_async(telemetry.flush)
+            # Writes are committed by the writer; end the read transaction.
+            await db_session.commit()
             logger.info("LinkedIn scraping run complete")
         except Exception:
             logger.exception("LinkedIn scraping run failed")
-            db_session.rollback()
+            await db_session.rollback()
+
+    async def run_retention_task() -> None:
+        logger.info("Starting retention run")
+        try:
+            result = await asyncio.to_thread(run_scheduled_retention, SessionLocal)
+        except Exception:
+            logger.exception("Retention run failed")
+            return
+        logger.info(
+            "Retention run removed %s jobs (%s archived)",
+            result.deleted,
+            result.archived,
+        )
 
     try:
         if args.now:
             await run_scraping_task()
 
         scheduler.add_daily_job(run_scraping_task, hour=args.hour, minute=args.minute)
+        if settings.retention_enabled:
+            scheduler.add_daily_job(run_retention_task, hour=args.retention_hour)
+            logger.info("Retention scheduled: daily at %02d:00", args.retention_hour)
         scheduler.start()
         logger.info("Scheduler started: daily at %02d:%02d", args.hour, args.minute)
         await asyncio.Event().wait()
@@ -106,8 +146,9 @@ async def main() -> None:
         logger.info("Shutdown requested")
     finally:
         scheduler.stop()
+        writer.stop()
         request_session.close()
-        db_session.close()
+        await db_session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.database.session import SessionLocal
+from src.services.skill_taxonomy import SkillTaxonomyService, TaxonomySyncResult
+
+
+def sync() -> TaxonomySyncResult:
+    session = SessionLocal()
+    try:
+        result = SkillTaxonomyService(session).sync()
+        session.commit()
+        return result
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    result = sync()
+    print(
+        f"Synced {result.categories} categories, {result.skills} skills and "
+        f"{result.aliases} aliases; merged {result.merged} duplicate skills"
+    )
@@ -0,0 +1,97 @@
+"""Circuit breaker that stops calling an Ollama server that is down.
+
+After ``failure_threshold`` consecutive transient failures (timeouts,
+refused connections, 5xx) the breaker opens and calls fail fast for
+``reset_seconds``. Then one probe call is let through (half-open): success
+closes the breaker, failure opens it for another ``reset_seconds``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from src.config import settings
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int | None = None,
+        reset_seconds: float | None = None,
+    ) -> None:
+        self.failure_threshold = (
+            failure_threshold or settings.llm_circuit_failure_threshold
+        )
+        self.reset_seconds = (
+            settings.llm_circuit_reset_seconds if reset_seconds is None else reset_seconds
+        )
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._cooled_down():
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead; claims the probe slot when half-open."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self._cooled_down():
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("LLM circuit closed")
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "LLM circuit opened after %s failures; pausing for %ss",
+                        self._failures,
+                        self.reset_seconds,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def _cooled_down(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.reset_seconds
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str | None = None) -> CircuitBreaker:
+    """Process-wide breaker per Ollama host, shared across runs."""
+    with _breakers_lock:
+        key = host or ""
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker()
+        return _breakers[key]
+
+
+def clear_circuit_breakers() -> None:
+    with _breakers_lock:
+        _breakers.clear()
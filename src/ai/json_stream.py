@@ -0,0 +1,210 @@
+"""Incremental validation of streamed JSON completions.
+
+``JSONStreamValidator`` is fed the completion piece by piece and raises
+``MalformedJSONError`` as soon as the text can no longer become valid JSON
+(prose instead of an object, a stray character, an endless run of
+whitespace), so the request can be cancelled instead of generated to the
+end. With ``max_items`` it stops once any array holds that many complete
+elements; ``text`` is then the prefix closed off into a valid document.
+"""
+
+from __future__ import annotations
+
+import json
+
+_WHITESPACE = frozenset(" \t\r\n")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_LITERALS = ("true", "false", "null")
+# JSON mode sometimes pads forever with newlines instead of closing.
+_MAX_WHITESPACE_RUN = 64
+
+# What a container (or the document) accepts next.
+_VALUE = "value"
+_VALUE_OR_END = "value or ]"
+_KEY = "key"
+_KEY_OR_END = "key or }"
+_COLON = ":"
+_COMMA_OR_END = ", or close"
+_END = "end of document"
+
+
+class MalformedJSONError(ValueError):
+    pass
+
+
+class _Frame:
+    __slots__ = ("closer", "expect", "items")
+
+    def __init__(self, closer: str, expect: str) -> None:
+        self.closer = closer
+        self.expect = expect
+        self.items = 0
+
+
+class JSONStreamValidator:
+    def __init__(self, max_items: int | None = None, require_object: bool = True) -> None:
+        self.max_items = max_items
+        self.require_object = require_object
+        self.done = False
+        self.truncated = False
+        self._parts: list[str] = []
+        self._length = 0
+        self._stack: list[_Frame] = []
+        self._expect = _VALUE
+        self._in_string = False
+        self._string_is_key = False
+        self._escaped = False
+        self._scalar = ""
+        self._whitespace_run = 0
+        self._cut: int | None = None
+        self._closers = ""
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far, or the closed prefix once cut off."""
+        text = "".join(self._parts)
+        if self._cut is None:
+            return text
+        return text[: self._cut] + self._closers
+
+    def feed(self, chunk: str) -> bool:
+        """Consume ``chunk``; True once the document is complete or cut off."""
+        if self.done or not chunk:
+            return self.done
+        start = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        for offset, char in enumerate(chunk):
+            self._consume(char, start + offset)
+            if self.done:
+                break
+        return self.done
+
+    def _consume(self, char: str, pos: int) -> None:
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    self._set_expect(_COLON)
+                else:
+                    self._value_done(pos)
+            return
+
+        if self._scalar:
+            if char in _NUMBER_CHARS or char.isalpha():
+                self._scalar += char
+                self._check_scalar(final=False)
+                return
+            self._check_scalar(final=True)
+            self._scalar = ""
+            self._value_done(pos - 1)
+            if self.done:
+                return
+
+        if char in _WHITESPACE:
+            self._whitespace_run += 1
+            if self._whitespace_run > _MAX_WHITESPACE_RUN:
+                raise MalformedJSONError("runaway whitespace")
+            return
+        self._whitespace_run = 0
+
+        expect = self._current_expect()
+        if expect in (_VALUE, _VALUE_OR_END):
+            if char == "]" and expect == _VALUE_OR_END:
+                self._close(pos)
+            else:
+                self._start_value(char)
+        elif expect in (_KEY, _KEY_OR_END):
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = True
+            elif char == "}" and expect == _KEY_OR_END:
+                self._close(pos)
+            else:
+                self._unexpected(char, expect)
+        elif expect == _COLON:
+            if char != ":":
+                self._unexpected(char, expect)
+            self._set_expect(_VALUE)
+        elif expect == _COMMA_OR_END:
+            frame = self._stack[-1]
+            if char == ",":
+                frame.expect = _VALUE if frame.closer == "]" else _KEY
+            elif char == frame.closer:
+                self._close(pos)
+            else:
+                self._unexpected(char, expect)
+        else:
+            self._unexpected(char, expect)
+
+    def _start_value(self, char: str) -> None:
+        if self.require_object and not self._stack and char != "{":
+            raise MalformedJSONError(f"expected a JSON object, got {char!r}")
+        if char == '"':
+            self._set_expect(_COMMA_OR_END)
+            self._in_string = True
+            self._string_is_key = False
+        elif char in "{[":
+            self._set_expect(_COMMA_OR_END)
+            if char == "{":
+                self._stack.append(_Frame("}", _KEY_OR_END))
+            else:
+                self._stack.append(_Frame("]", _VALUE_OR_END))
+        elif char == "-" or char.isdigit() or char in "tfn":
+            self._set_expect(_COMMA_OR_END)
+            self._scalar = char
+            self._check_scalar(final=False)
+        else:
+            self._unexpected(char, _VALUE)
+
+    def _close(self, pos: int) -> None:
+        self._stack.pop()
+        self._value_done(pos)
+
+    def _value_done(self, end: int) -> None:
+        if not self._stack:
+            self.done = True
+            return
+        frame = self._stack[-1]
+        if frame.closer != "]":
+            return
+        frame.items += 1
+        if self.max_items is not None and frame.items >= self.max_items:
+            self._cut = end + 1
+            self._closers = "".join(frame.closer for frame in reversed(self._stack))
+            self.done = True
+            self.truncated = True
+
+    def _check_scalar(self, final: bool) -> None:
+        scalar = self._scalar
+        if scalar[0] in "tfn":
+            ok = scalar in _LITERALS if final else any(
+                literal.startswith(scalar) for literal in _LITERALS
+            )
+        elif final:
+            try:
+                json.loads(scalar)
+                ok = True
+            except json.JSONDecodeError:
+                ok = False
+        else:
+            ok = all(char in _NUMBER_CHARS for char in scalar)
+        if not ok:
+            raise MalformedJSONError(f"invalid literal {scalar!r}")
+
+    def _current_expect(self) -> str:
+        return self._stack[-1].expect if self._stack else self._expect
+
+    def _set_expect(self, expect: str) -> None:
+        if self._stack:
+            self._stack[-1].expect = expect
+        else:
+            self._expect = _END if expect == _COMMA_OR_END else expect
+
+    @staticmethod
+    def _unexpected(char: str, expect: str) -> None:
+        raise MalformedJSONError(f"unexpected {char!r}, expected {expect}")
@@ -1,40 +1,310 @@
+from __future__ import annotations
+
 import json
-from typing import Any
+import random
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
 
 import ollama
 
+from src.ai import telemetry as llm_telemetry
+from src.ai.circuit_breaker import OPEN, CircuitBreaker, get_circuit_breaker
+from src.ai.json_stream import JSONStreamValidator, MalformedJSONError
+from src.ai.response_cache import LLMResponseCache, cache_key
+from src.ai.telemetry import CallTimer, LLMTelemetry, get_llm_telemetry
 from src.config import settings
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Key added to every response naming the model that produced it.
+MODEL_KEY = "_model"
+# Chunks read after a complete document while waiting for the closing one.
+_MAX_PADDING_CHUNKS = 64
+
+
+class _Request(NamedTuple):
+    prompt: str
+    prompt_version: str
+    validate: Callable[[dict[str, Any]], bool] | None
+    schema: dict[str, Any] | None
+    max_items: int | None
+
 
 class LLMClient:
-    def __init__(self, model_name: str | None = None) -> None:
+    """Ollama JSON client with an optional model cascade.
+
+    ``models`` lists models from cheapest to most capable (defaulting to
+    ``OLLAMA_CASCADE_MODELS``, else just ``model_name``). Each prompt goes to
+    the first model; the next one is only tried when the reply is not JSON
+    or the caller's ``validate`` rejects it. Every attempt and cache hit is
+    recorded on ``telemetry``.
+
+    Requests time out after ``LLM_TIMEOUT_SECONDS``, transient failures are
+    retried, and a shared ``CircuitBreaker`` fails calls fast while the
+    server is down. Each request asks Ollama to keep the model loaded for
+    ``LLM_KEEP_ALIVE`` so it is not reloaded between jobs.
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        cache: LLMResponseCache | None = None,
+        models: Sequence[str] | None = None,
+        telemetry: LLMTelemetry | None = None,
+        client: ollama.Client | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_retries: int | None = None,
+        retry_base_seconds: float | None = None,
+    ) -> None:
         self.model_name = model_name or getattr(settings, "OLLAMA_MODEL", "llama3")
+        self.cache = cache
+        if models is None:
+            models = settings.OLLAMA_CASCADE_MODELS if model_name is None else ()
+        self.models = list(models) or [self.model_name]
+        self.telemetry = telemetry or get_llm_telemetry()
+        self.client = client or ollama.Client(
+            host=settings.ollama_host, timeout=settings.llm_timeout_seconds
+        )
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(
+            settings.ollama_host
+        )
+        self.max_retries = (
+            settings.llm_max_retries if max_retries is None else max_retries
+        )
+        self.retry_base_seconds = (
+            settings.llm_retry_base_seconds
+            if retry_base_seconds is None
+            else retry_base_seconds
+        )
+        self.keep_alive = settings.llm_keep_alive
+
+    def generate_json(
+        self,
+        prompt: str,
+        prompt_version: str = "",
+        validate: Callable[[dict[str, Any]], bool] | None = None,
+        schema: dict[str, Any] | None = None,
+        max_items: int | None = None,
+    ) -> dict[str, Any] | None:
+        """JSON reply for ``prompt`` from the cheapest model whose answer
+        passes ``validate``, tagged with ``MODEL_KEY``. With a cache,
+        identical prompts (same models, ``prompt_version``, ``schema`` and
+        ``max_items``) are answered from it; answers that failed validation
+        are not stored.
+
+        ``schema`` constrains the output through Ollama's structured outputs
+        (plain JSON mode otherwise). The reply is streamed and validated as
+        it arrives: malformed output is aborted early, and generation stops
+        once an array holds ``max_items`` elements.
+        """
+        request = _Request(prompt, prompt_version, validate, schema, max_items)
+        if self.cache is None:
+            return self._cascade(request)[0]
 
-    def generate_json(self, prompt: str) -> dict[str, Any] | None:
-        messages = [{"role": "user", "content": prompt}]
+        computed = validated = False
 
+        def compute() -> dict[str, Any] | None:
+            nonlocal computed, validated
+            computed = True
+            response, validated = self._cascade(request)
+            return response
+
+        timer = CallTimer(self.telemetry, ",".join(self.models), prompt_version)
+        key = cache_key(
+            ",".join(self.models), prompt_version, prompt, schema, max_items
+        )
+        response = self.cache.get_or_compute(
+            key, compute, cacheable=lambda _response: validated
+        )
+        if not computed and response is not None:
+            timer.finish(llm_telemetry.CACHE_HIT)
+        return response
+
+    def available(self) -> bool:
+        """False while the circuit breaker is holding calls back."""
+        return self.circuit_breaker.state != OPEN
+
+    def warm_up(self) -> bool:
+        """Load the first model so it stays resident for ``keep_alive``.
+
+        Returns whether the server answered.
+        """
+        model = self.models[0]
+        if not self.circuit_breaker.allow():
+            return False
         try:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=messages,
-                format="json",
+            # A request without a prompt only loads the model.
+            self.client.generate(model=model, keep_alive=self.keep_alive)
+        except Exception as exc:
+            logger.warning("LLM warm-up for %s failed: %s", model, exc)
+            # Like _chat_json, a non-transient error still means the server
+            # answered, which also settles a half-open probe.
+            if llm_telemetry.classify_error(exc) in llm_telemetry.TRANSIENT_OUTCOMES:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            return False
+        self.circuit_breaker.record_success()
+        return True
+
+    def embed(
+        self, texts: Sequence[str], model: str | None = None
+    ) -> list[list[float]] | None:
+        """One embedding per text from ``OLLAMA_EMBEDDING_MODEL``, or ``None``
+        when the request fails.
+        """
+        model = model or settings.ollama_embedding_model
+        timer = CallTimer(self.telemetry, model, "embed")
+        if not self.circuit_breaker.allow():
+            timer.finish(llm_telemetry.CIRCUIT_OPEN)
+            return None
+        try:
+            response = self.client.embed(
+                model=model, input=list(texts), keep_alive=self.keep_alive
             )
-        except Exception:
-            logger.exception("LLM request failed")
+        except Exception as exc:
+            logger.exception("Embedding request failed")
+            outcome = llm_telemetry.classify_error(exc)
+            if outcome in llm_telemetry.TRANSIENT_OUTCOMES:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            timer.finish(outcome)
+            return None
+        self.circuit_breaker.record_success()
+        embeddings = response.get("embeddings")
+        if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+            logger.error("Embedding response has no vector per text")
+            timer.finish(llm_telemetry.MISSING_CONTENT)
             return None
+        timer.finish(llm_telemetry.OK, llm_telemetry.response_metrics(response))
+        return embeddings
+
+    def _cascade(self, request: _Request) -> tuple[dict[str, Any] | None, bool]:
+        """Best reply and whether it passed validation."""
+        response = None
+        for model in self.models:
+            candidate, outcome = self._chat_json(request, model)
+            if outcome == llm_telemetry.CIRCUIT_OPEN:
+                # Every model lives on the same server.
+                break
+            if candidate is None:
+                continue
+            response = {**candidate, MODEL_KEY: model}
+            if outcome == llm_telemetry.OK:
+                return response, True
+            logger.info("Response from %s failed validation, escalating", model)
+        # Nothing passed: the most capable model's answer is still the best.
+        return response, False
+
+    def _chat_json(
+        self, request: _Request, model: str
+    ) -> tuple[dict[str, Any] | None, str]:
+        """Reply from ``model`` and its telemetry outcome.
+
+        Transient failures are retried up to ``max_retries`` times with
+        full-jitter exponential backoff while the circuit stays closed.
+        """
+        outcome = llm_telemetry.UNKNOWN_ERROR
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(
+                    random.uniform(0, self.retry_base_seconds * 2 ** (attempt - 1))
+                )
+            timer = CallTimer(self.telemetry, model, request.prompt_version)
+            if not self.circuit_breaker.allow():
+                timer.finish(llm_telemetry.CIRCUIT_OPEN)
+                return None, llm_telemetry.CIRCUIT_OPEN
+
+            candidate, outcome, metrics = self._chat_once(request, model)
+            if outcome in llm_telemetry.TRANSIENT_OUTCOMES:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            if not isinstance(candidate, dict):
+                candidate = None
+                if outcome == llm_telemetry.OK:
+                    outcome = llm_telemetry.INVALID_JSON
+            elif request.validate is not None and not request.validate(candidate):
+                outcome = llm_telemetry.VALIDATION_FAILED
+            timer.finish(outcome, metrics)
+
+            if outcome not in llm_telemetry.TRANSIENT_OUTCOMES:
+                return candidate, outcome
+            logger.warning(
+                "LLM call to %s failed (%s), attempt %s of %s",
+                model,
+                outcome,
+                attempt + 1,
+                self.max_retries + 1,
+            )
+        return None, outcome
 
-        content = response.get("message", {}).get("content")
-        if isinstance(content, dict):
-            return content
-        if isinstance(content, str):
+    def _chat_once(
+        self, request: _Request, model: str
+    ) -> tuple[Any, str, dict[str, Any] | None]:
+        """Parsed reply, telemetry outcome and response metrics for one
+        streamed call.
+        """
+        messages = [{"role": "user", "content": request.prompt}]
+        validator = JSONStreamValidator(max_items=request.max_items)
+        last_chunk = None
+
+        try:
+            stream = self.client.chat(
+                model=model,
+                messages=messages,
+                format=request.schema or "json",
+                stream=True,
+                keep_alive=self.keep_alive,
+            )
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                logger.error("LLM returned invalid JSON")
-                return None
+                padding = 0
+                for chunk in stream:
+                    if validator.done:
+                        # JSON mode may pad the document with newlines; read a
+                        # little further for the closing chunk with metrics.
+                        if chunk.get("done"):
+                            last_chunk = chunk
+                            break
+                        padding += 1
+                        if padding > _MAX_PADDING_CHUNKS:
+                            break
+                        continue
+                    last_chunk = chunk
+                    content = chunk.get("message", {}).get("content") or ""
+                    if validator.feed(content) and validator.truncated:
+                        break
+            finally:
+                # Closing the stream drops the connection, which stops
+                # generation on the server.
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+        except MalformedJSONError as exc:
+            logger.error("LLM returned invalid JSON, aborted: %s", exc)
+            return (
+                None,
+                llm_telemetry.INVALID_JSON,
+                llm_telemetry.response_metrics(last_chunk),
+            )
+        except Exception as exc:
+            logger.exception("LLM request failed")
+            return None, llm_telemetry.classify_error(exc), None
 
-        logger.error("LLM response missing JSON content")
-        return None
+        metrics = llm_telemetry.response_metrics(last_chunk)
+        if validator.truncated:
+            logger.debug(
+                "LLM reply from %s cut off at %s items", model, request.max_items
+            )
+        text = validator.text
+        if not text.strip():
+            logger.error("LLM response missing JSON content")
+            return None, llm_telemetry.MISSING_CONTENT, metrics
+        try:
+            return json.loads(text), llm_telemetry.OK, metrics
+        except json.JSONDecodeError:
+            logger.error("LLM returned invalid JSON")
+            return None, llm_telemetry.INVALID_JSON, metrics
@@ -0,0 +1,128 @@
+"""Shrink job descriptions before they are sent to the LLM.
+
+``clean_description`` drops boilerplate sections (EEO statements, benefits,
+"about us", application instructions), repeated lines and redundant
+whitespace. ``chunk_description`` splits whatever is still over the token
+budget on line boundaries so each chunk fits in one prompt.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Headings that open a section with no skill content; it runs until the
+# next heading-shaped line or blank line.
+_BOILERPLATE_HEADING_RE = re.compile(
+    r"^(equal (employment )?opportunit|eeo\b|diversity|inclusion|benefits|perks|"
+    r"what we offer|what's in it for you|why (join|work)|about (us|the company)|"
+    r"who we are|our (culture|values)|how to apply|to apply|privacy|disclaimer|"
+    r"salary|compensation|remuneration)"
+)
+# Standalone boilerplate sentences that show up outside any heading.
+_BOILERPLATE_LINE_RE = re.compile(
+    r"equal opportunity employer|regardless of (race|age|gender)|"
+    r"reasonable adjustments?|accommodations? (during|for|to)|"
+    r"aboriginal and torres strait islander|encourage (people|applications) from|"
+    r"privacy (policy|notice)|recruitment agencies|click apply|apply now"
+)
+_BULLET_RE = re.compile(r"^[\-\*•▪·>]+\s*")
+_MAX_HEADING_WORDS = 6
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text.
+    return len(text) // 4 + 1
+
+
+def clean_description(text: str | None) -> str:
+    """Description without boilerplate sections, duplicate lines or extra
+    whitespace.
+    """
+    if not text:
+        return ""
+
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    kept: list[str] = []
+    seen: set[str] = set()
+    in_boilerplate = False
+    # Set between a boilerplate heading and the first line of its body, which
+    # neither blank lines nor a short line can close.
+    awaiting_body = False
+    for index, line in enumerate(lines):
+        if not line:
+            in_boilerplate = in_boilerplate and awaiting_body
+            continue
+        key = _BULLET_RE.sub("", line).lower()
+        following = lines[index + 1] if index + 1 < len(lines) else ""
+        if (
+            not awaiting_body
+            and _is_heading_shaped(line)
+            and (in_boilerplate or _opens_section(key, following))
+        ):
+            in_boilerplate = bool(_BOILERPLATE_HEADING_RE.match(key))
+            awaiting_body = in_boilerplate
+            if in_boilerplate:
+                continue
+        awaiting_body = False
+        if in_boilerplate or _BOILERPLATE_LINE_RE.search(key) or key in seen:
+            continue
+        seen.add(key)
+        kept.append(line)
+    return "\n".join(kept)
+
+
+def chunk_description(text: str, token_budget: int) -> list[str]:
+    """Split ``text`` into pieces of at most ``token_budget`` tokens, breaking
+    between lines where possible and between words otherwise.
+    """
+    if estimate_tokens(text) <= token_budget:
+        return [text]
+
+    max_chars = max(1, token_budget * 4)
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for line in text.splitlines():
+        pieces = _split_long_line(line, max_chars) if len(line) > max_chars else [line]
+        for piece in pieces:
+            if current and size + len(piece) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _is_heading_shaped(line: str) -> bool:
+    if _BULLET_RE.match(line):
+        return False
+    stripped = line.rstrip(":")
+    return (
+        len(stripped.split()) <= _MAX_HEADING_WORDS
+        and not stripped.endswith((".", ",", ";"))
+    ) or (line.endswith(":") and len(line) <= 80)
+
+
+def _opens_section(key: str, following: str) -> bool:
+    # A short line is only a heading if its layout or wording says so;
+    # "Python experience essential" followed by prose is content.
+    return (
+        not following
+        or bool(_BULLET_RE.match(following))
+        or bool(_BOILERPLATE_HEADING_RE.match(key))
+    )
+
+
+def _split_long_line(line: str, max_chars: int) -> list[str]:
+    pieces: list[str] = []
+    current = ""
+    for word in line.split():
+        if current and len(current) + len(word) + 1 > max_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
@@ -0,0 +1,194 @@
+"""Persistent, content-addressed cache of LLM JSON responses.
+
+Entries live in a standalone SQLite file keyed by a SHA-256 of the model
+name, the prompt template version, the output constraints and the
+whitespace-normalized prompt, so a
+reposted job or a re-run after a crash costs a lookup instead of an
+inference. Entries older than ``max_age_days`` are dropped and the least
+recently used ones are evicted beyond ``max_entries``. Concurrent requests
+for the same key share a single in-flight call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_llm_cache_last_used_at ON llm_cache (last_used_at);
+CREATE INDEX IF NOT EXISTS ix_llm_cache_created_at ON llm_cache (created_at);
+"""
+
+
+def cache_key(
+    model_name: str,
+    prompt_version: str,
+    prompt: str,
+    schema: dict[str, Any] | None = None,
+    max_items: int | None = None,
+) -> str:
+    normalized = " ".join(prompt.split())
+    constraints = json.dumps([schema, max_items], sort_keys=True)
+    payload = f"{model_name}\x1f{prompt_version}\x1f{constraints}\x1f{normalized}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10_000,
+        max_age_days: float | None = 30,
+    ) -> None:
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future[dict[str, Any] | None]] = {}
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.executescript(_SCHEMA)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self._expired(created_at, now):
+                self._connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE llm_cache SET last_used_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(response)
+
+    def put(self, key: str, response: dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO llm_cache (key, response, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "response = excluded.response, created_at = excluded.created_at, "
+                "last_used_at = excluded.last_used_at",
+                (key, json.dumps(response), now, now),
+            )
+            self._evict(now)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], dict[str, Any] | None],
+        cacheable: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> dict[str, Any] | None:
+        """Cached response for ``key``, else ``compute()`` run once for all
+        concurrent callers. ``None`` results, and those ``cacheable``
+        rejects, are shared but not stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            # Another caller may have stored it between the miss and now.
+            response = self.get(key)
+            if response is None:
+                response = compute()
+                if response is not None and (cacheable is None or cacheable(response)):
+                    self.put(key, response)
+        except BaseException as error:
+            pending.set_exception(error)
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM llm_cache").fetchone()[0]
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return (
+            self.max_age_days is not None
+            and created_at < now - self.max_age_days * 86_400
+        )
+
+    def _evict(self, now: float) -> None:
+        if self.max_age_days is not None:
+            self._connection.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (now - self.max_age_days * 86_400,),
+            )
+        excess = (
+            self._connection.execute("SELECT count(*) FROM llm_cache").fetchone()[0]
+            - self.max_entries
+        )
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_used_at LIMIT ?)",
+                (excess,),
+            )
+
+
+_default_cache: LLMResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_response_cache() -> LLMResponseCache | None:
+    """Process-wide cache configured by ``LLM_CACHE_PATH`` (unset disables)."""
+    global _default_cache
+    if not settings.llm_cache_path:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = LLMResponseCache(
+                settings.llm_cache_path,
+                max_entries=settings.llm_cache_max_entries,
+                max_age_days=settings.llm_cache_max_age_days,
+            )
+        return _default_cache
@@ -0,0 +1,277 @@
+"""Per-call LLM telemetry: latency, token counts and failure reasons.
+
+``LLMClient`` records one ``LLMCallRecord`` per model attempt (and per cache
+hit). Timings and token counts come from Ollama's response metadata
+(``load_duration``, ``prompt_eval_count``, ``eval_count``, ...). Records are
+aggregated per model into fixed-bucket histograms that ``snapshot`` returns.
+With ``LLM_TELEMETRY_PERSIST`` they are also buffered, and ``flush`` writes
+them to the ``llm_calls`` table in the caller's session.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.database.models import LLMCall
+from src.database.timestamps import utc_now
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+OK = "ok"
+CACHE_HIT = "cache_hit"
+CONNECTION_ERROR = "connection_error"
+TIMEOUT = "timeout"
+MODEL_NOT_FOUND = "model_not_found"
+SERVER_ERROR = "server_error"
+INVALID_JSON = "invalid_json"
+MISSING_CONTENT = "missing_content"
+VALIDATION_FAILED = "validation_failed"
+CIRCUIT_OPEN = "circuit_open"
+UNKNOWN_ERROR = "unknown_error"
+
+# Failures worth retrying and counted by the circuit breaker.
+TRANSIENT_OUTCOMES = frozenset({TIMEOUT, CONNECTION_ERROR, SERVER_ERROR})
+
+# Upper bounds; the last bucket catches everything above.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000)
+TOKEN_BUCKETS = (64, 128, 256, 512, 1_024, 2_048, 4_096, 8_192)
+
+_NS_PER_MS = 1_000_000
+
+
+class LLMCallRecord(NamedTuple):
+    model: str
+    outcome: str
+    latency_ms: float
+    load_ms: float | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    prompt_eval_ms: float | None = None
+    eval_ms: float | None = None
+    prompt_version: str = ""
+    created_at: datetime | None = None
+
+
+class ModelStats(NamedTuple):
+    calls: int
+    outcomes: dict[str, int]
+    latency_histogram: dict[str, int]
+    prompt_token_histogram: dict[str, int]
+    completion_token_histogram: dict[str, int]
+    prompt_tokens: int
+    completion_tokens: int
+    mean_latency_ms: float
+    p50_ms: float
+    p95_ms: float
+    mean_load_ms: float
+    completion_tokens_per_second: float
+
+
+def classify_error(error: BaseException) -> str:
+    name = type(error).__name__.lower()
+    status_code = getattr(error, "status_code", None)
+    if "timeout" in name or isinstance(error, TimeoutError):
+        return TIMEOUT
+    if isinstance(error, ConnectionError) or "connect" in name:
+        return CONNECTION_ERROR
+    if status_code == 404:
+        return MODEL_NOT_FOUND
+    if isinstance(status_code, int) and status_code >= 500:
+        return SERVER_ERROR
+    return UNKNOWN_ERROR
+
+
+def response_metrics(response: Mapping[str, Any] | Any) -> dict[str, Any]:
+    """Token counts and durations (ms) from an Ollama chat response."""
+
+    def field(name: str) -> Any:
+        getter = getattr(response, "get", None)
+        return getter(name) if getter is not None else None
+
+    def ms(name: str) -> float | None:
+        value = field(name)
+        return value / _NS_PER_MS if isinstance(value, (int, float)) else None
+
+    return {
+        "load_ms": ms("load_duration"),
+        "prompt_tokens": field("prompt_eval_count"),
+        "completion_tokens": field("eval_count"),
+        "prompt_eval_ms": ms("prompt_eval_duration"),
+        "eval_ms": ms("eval_duration"),
+    }
+
+
+class _Histogram:
+    def __init__(self, bounds: tuple[int, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+
+    def as_dict(self) -> dict[str, int]:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return dict(zip(labels, self.counts))
+
+
+class _ModelAggregate:
+    def __init__(self, latency_window: int) -> None:
+        self.calls = 0
+        self.outcomes: dict[str, int] = {}
+        self.latency = _Histogram(LATENCY_BUCKETS_MS)
+        self.prompt_tokens_hist = _Histogram(TOKEN_BUCKETS)
+        self.completion_tokens_hist = _Histogram(TOKEN_BUCKETS)
+        self.latencies: deque[float] = deque(maxlen=latency_window)
+        self.latency_total = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.load_total = 0.0
+        self.loads = 0
+        self.eval_ms = 0.0
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.calls += 1
+        self.outcomes[record.outcome] = self.outcomes.get(record.outcome, 0) + 1
+        self.latency.add(record.latency_ms)
+        self.latencies.append(record.latency_ms)
+        self.latency_total += record.latency_ms
+        if record.prompt_tokens is not None:
+            self.prompt_tokens += record.prompt_tokens
+            self.prompt_tokens_hist.add(record.prompt_tokens)
+        if record.completion_tokens is not None:
+            self.completion_tokens += record.completion_tokens
+            self.completion_tokens_hist.add(record.completion_tokens)
+            self.eval_ms += record.eval_ms or 0.0
+        if record.load_ms is not None:
+            self.load_total += record.load_ms
+            self.loads += 1
+
+    def stats(self) -> ModelStats:
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return ModelStats(
+            calls=self.calls,
+            outcomes=dict(self.outcomes),
+            latency_histogram=self.latency.as_dict(),
+            prompt_token_histogram=self.prompt_tokens_hist.as_dict(),
+            completion_token_histogram=self.completion_tokens_hist.as_dict(),
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            mean_latency_ms=self.latency_total / self.calls if self.calls else 0.0,
+            p50_ms=percentile(0.50),
+            p95_ms=percentile(0.95),
+            mean_load_ms=self.load_total / self.loads if self.loads else 0.0,
+            completion_tokens_per_second=(
+                self.completion_tokens / (self.eval_ms / 1000) if self.eval_ms else 0.0
+            ),
+        )
+
+
+class LLMTelemetry:
+    def __init__(
+        self,
+        persist: bool | None = None,
+        latency_window: int = 1000,
+        max_pending: int = 10_000,
+    ) -> None:
+        self.persist = settings.llm_telemetry_persist if persist is None else persist
+        self.latency_window = latency_window
+        self._lock = threading.Lock()
+        self._models: dict[str, _ModelAggregate] = {}
+        self._pending: deque[LLMCallRecord] = deque(maxlen=max_pending)
+
+    def record(self, record: LLMCallRecord) -> None:
+        if record.created_at is None:
+            record = record._replace(created_at=utc_now())
+        with self._lock:
+            aggregate = self._models.get(record.model)
+            if aggregate is None:
+                aggregate = self._models[record.model] = _ModelAggregate(
+                    self.latency_window
+                )
+            aggregate.add(record)
+            if self.persist:
+                self._pending.append(record)
+
+    def snapshot(self) -> dict[str, ModelStats]:
+        """Aggregated stats per model since start (or the last ``reset``)."""
+        with self._lock:
+            return {model: aggregate.stats() for model, aggregate in self._models.items()}
+
+    def flush(self, db_session: Session) -> int:
+        """Add buffered records to ``llm_calls``; the caller commits."""
+        with self._lock:
+            records = list(self._pending)
+            self._pending.clear()
+        if records:
+            db_session.execute(
+                LLMCall.__table__.insert(), [record._asdict() for record in records]
+            )
+        return len(records)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._pending.clear()
+
+    def log_summary(self) -> None:
+        for model, stats in self.snapshot().items():
+            logger.info(
+                "LLM %s: %s calls, p50 %.0f ms, p95 %.0f ms, %.1f tok/s, outcomes %s",
+                model,
+                stats.calls,
+                stats.p50_ms,
+                stats.p95_ms,
+                stats.completion_tokens_per_second,
+                json.dumps(stats.outcomes, sort_keys=True),
+            )
+
+
+class CallTimer:
+    """Times one model call; ``finish`` records it with its outcome."""
+
+    def __init__(self, telemetry: LLMTelemetry, model: str, prompt_version: str) -> None:
+        self.telemetry = telemetry
+        self.model = model
+        self.prompt_version = prompt_version
+        self.started = time.perf_counter()
+
+    def finish(self, outcome: str, metrics: Mapping[str, Any] | None = None) -> None:
+        self.telemetry.record(
+            LLMCallRecord(
+                model=self.model,
+                outcome=outcome,
+                latency_ms=(time.perf_counter() - self.started) * 1000,
+                prompt_version=self.prompt_version,
+                **(metrics or {}),
+            )
+        )
+
+
+_default_telemetry: LLMTelemetry | None = None
+_default_lock = threading.Lock()
+
+
+def get_llm_telemetry() -> LLMTelemetry:
+    """Process-wide telemetry shared by every ``LLMClient``."""
+    global _default_telemetry
+    with _default_lock:
+        if _default_telemetry is None:
+            _default_telemetry = LLMTelemetry()
+        return _default_telemetry
@@ -13,6 +13,216 @@ class Settings(BaseSettings):
         validation_alias="OLLAMA_MODEL",
     )
 
+    ollama_cascade_models: str | None = Field(
+        default=None,
+        validation_alias="OLLAMA_CASCADE_MODELS",
+    )
+
+    llm_cascade_min_skills: int = Field(
+        default=2,
+        validation_alias="LLM_CASCADE_MIN_SKILLS",
+    )
+
+    ollama_embedding_model: str = Field(
+        default="nomic-embed-text",
+        validation_alias="OLLAMA_EMBEDDING_MODEL",
+    )
+
+    embeddings_enabled: bool = Field(
+        default=False,
+        validation_alias="EMBEDDINGS_ENABLED",
+    )
+
+    embedding_store_path: str = Field(
+        default="./job_vectors",
+        validation_alias="EMBEDDING_STORE_PATH",
+    )
+
+    embedding_batch_size: int = Field(
+        default=32,
+        validation_alias="EMBEDDING_BATCH_SIZE",
+    )
+
+    relevance_index_path: str = Field(
+        default="./relevance_index.npz",
+        validation_alias="RELEVANCE_INDEX_PATH",
+    )
+
+    bm25_k1: float = Field(
+        default=1.2,
+        validation_alias="BM25_K1",
+    )
+
+    bm25_b: float = Field(
+        default=0.75,
+        validation_alias="BM25_B",
+    )
+
+    ollama_host: str | None = Field(
+        default=None,
+        validation_alias="OLLAMA_HOST",
+    )
+
+    llm_timeout_seconds: float = Field(
+        default=120,
+        validation_alias="LLM_TIMEOUT_SECONDS",
+    )
+
+    llm_max_retries: int = Field(
+        default=2,
+        validation_alias="LLM_MAX_RETRIES",
+    )
+
+    llm_retry_base_seconds: float = Field(
+        default=1.0,
+        validation_alias="LLM_RETRY_BASE_SECONDS",
+    )
+
+    llm_circuit_failure_threshold: int = Field(
+        default=5,
+        validation_alias="LLM_CIRCUIT_FAILURE_THRESHOLD",
+    )
+
+    llm_circuit_reset_seconds: float = Field(
+        default=60,
+        validation_alias="LLM_CIRCUIT_RESET_SECONDS",
+    )
+
+    llm_keep_alive: str = Field(
+        default="10m",
+        validation_alias="LLM_KEEP_ALIVE",
+    )
+
+    llm_concurrency: int = Field(
+        default=4,
+        validation_alias="LLM_CONCURRENCY",
+    )
+
+    llm_batch_max_jobs: int = Field(
+        default=8,
+        validation_alias="LLM_BATCH_MAX_JOBS",
+    )
+
+    llm_batch_token_budget: int = Field(
+        default=3000,
+        validation_alias="LLM_BATCH_TOKEN_BUDGET",
+    )
+
+    llm_max_skills: int = Field(
+        default=40,
+        validation_alias="LLM_MAX_SKILLS",
+    )
+
+    llm_description_token_budget: int = Field(
+        default=1500,
+        validation_alias="LLM_DESCRIPTION_TOKEN_BUDGET",
+    )
+
+    llm_cache_path: str | None = Field(
+        default=None,
+        validation_alias="LLM_CACHE_PATH",
+    )
+
+    llm_cache_max_entries: int = Field(
+        default=10_000,
+        validation_alias="LLM_CACHE_MAX_ENTRIES",
+    )
+
+    llm_cache_max_age_days: float | None = Field(
+        default=30,
+        validation_alias="LLM_CACHE_MAX_AGE_DAYS",
+    )
+
+    llm_telemetry_persist: bool = Field(
+        default=False,
+        validation_alias="LLM_TELEMETRY_PERSIST",
+    )
+
+    skill_matcher_enabled: bool = Field(
+        default=True,
+        validation_alias="SKILL_MATCHER_ENABLED",
+    )
+
+    skill_matcher_min_skills: int = Field(
+        default=3,
+        validation_alias="SKILL_MATCHER_MIN_SKILLS",
+    )
+
+    skill_matcher_min_confidence: float = Field(
+        default=0.6,
+        validation_alias="SKILL_MATCHER_MIN_CONFIDENCE",
+    )
+
+    skill_matcher_min_vocabulary: int = Field(
+        default=25,
+        validation_alias="SKILL_MATCHER_MIN_VOCABULARY",
+    )
+
+    enrichment_max_attempts: int = Field(
+        default=5,
+        validation_alias="ENRICHMENT_MAX_ATTEMPTS",
+    )
+
+    enrichment_lease_seconds: int = Field(
+        default=900,
+        validation_alias="ENRICHMENT_LEASE_SECONDS",
+    )
+
+    enrichment_retry_base_seconds: int = Field(
+        default=300,
+        validation_alias="ENRICHMENT_RETRY_BASE_SECONDS",
+    )
+
+    sqlite_journal_mode: str = Field(
+        default="WAL",
+        validation_alias="SQLITE_JOURNAL_MODE",
+    )
+
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        validation_alias="SQLITE_BUSY_TIMEOUT_MS",
+    )
+
+    content_codec: str = Field(
+        default="zlib",
+        validation_alias="CONTENT_CODEC",
+    )
+
+    retention_enabled: bool = Field(
+        default=False,
+        validation_alias="RETENTION_ENABLED",
+    )
+
+    retention_max_age_days: int | None = Field(
+        default=90,
+        validation_alias="RETENTION_MAX_AGE_DAYS",
+    )
+
+    retention_drop_past_deadline: bool = Field(
+        default=True,
+        validation_alias="RETENTION_DROP_PAST_DEADLINE",
+    )
+
+    retention_statuses: str = Field(
+        default="archived",
+        validation_alias="RETENTION_STATUSES",
+    )
+
+    retention_keep_location: str | None = Field(
+        default=None,
+        validation_alias="RETENTION_KEEP_LOCATION",
+    )
+
+    retention_archive_path: str | None = Field(
+        default=None,
+        validation_alias="RETENTION_ARCHIVE_PATH",
+    )
+
+    retention_chunk_size: int = Field(
+        default=200,
+        validation_alias="RETENTION_CHUNK_SIZE",
+    )
+
     @property
     def DATABASE_URL(self) -> str:
         return self.database_url
@@ -21,6 +231,18 @@ class Settings(BaseSettings):
     def OLLAMA_MODEL(self) -> str:
         return self.ollama_model
 
+    @property
+    def OLLAMA_CASCADE_MODELS(self) -> list[str]:
+        return [
+            model.strip()
+            for model in (self.ollama_cascade_models or "").split(",")
+            if model.strip()
+        ]
+
+    @property
+    def CONTENT_CODEC(self) -> str:
+        return self.content_codec
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="",
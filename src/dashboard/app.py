@@ -9,12 +9,104 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 import streamlit as st
-from sqlalchemy import func
+from sqlalchemy.orm import Session
 
-from src.database.models import Application, Job, JobSkill, Skill
+from src.database.models import Application
+from src.database.read_models import JobListRow, JobSearchHit, RelevantJob
 from src.database.session import SessionLocal
+from src.database.writer import get_write_coordinator
 from src.services.application_service import ApplicationService
 from src.services.job_service import JobService
+from src.services.location_service import LocationService
+from src.services.skill_facet_index import get_skill_facet_index
+from src.services.skill_stats_service import SkillStatsService
+from src.services.skill_taxonomy import SkillTaxonomyService
+
+
+def track_job(job_id: int) -> bool:
+    """Track a job through the shared writer; True when the application is new."""
+
+    def write(session: Session) -> bool:
+        application = ApplicationService(session).create_application(job_id)
+        return application in session.new
+
+    return get_write_coordinator().execute(write)
+
+
+def archive_job(job_id: int) -> bool:
+    return get_write_coordinator().execute(
+        lambda session: JobService(session).archive_job(job_id)
+    )
+
+
+def delete_job(job_id: int) -> bool:
+    return get_write_coordinator().execute(
+        lambda session: JobService(session).delete_job(job_id)
+    )
+
+
+def cleanup_jobs(keep_location: str) -> int:
+    # One writer request per chunk, so other writes interleave between chunks.
+    writer = get_write_coordinator()
+    deleted = 0
+    while True:
+        removed = writer.execute(
+            lambda session: JobService(session).cleanup_jobs_chunk(keep_location)
+        )
+        if not removed:
+            return deleted
+        deleted += removed
+
+
+def update_application(
+    app_id: int, status: str | None, notes: str | None, notes_changed: bool
+) -> None:
+    def write(session: Session) -> None:
+        service = ApplicationService(session)
+        if status is not None:
+            service.update_application_status(app_id, status)
+        if notes_changed:
+            service.update_application_notes(app_id, notes if notes else None)
+
+    get_write_coordinator().execute(write)
+
+
+def render_skill_filters() -> tuple[list[str], list[str], set[int] | None]:
+    """Skill facet pickers; returns the selections and the matching job ids.
+
+    The ids are ``None`` when no skill filter is active.
+    """
+    facet_index = get_skill_facet_index()
+    with SessionLocal() as db_session:
+        facet_index.refresh(db_session)
+
+    required = st.session_state.get("required_skills", [])
+    excluded = st.session_state.get("excluded_skills", [])
+    matched = facet_index.match(all_of=required, none_of=excluded)
+    counts = facet_index.facet_counts(matched, limit=50)
+    options = list(counts) + [
+        name for name in (*required, *excluded) if name not in counts
+    ]
+
+    def skill_label(name: str) -> str:
+        return f"{name} ({counts.get(name, 0)})"
+
+    required = st.sidebar.multiselect(
+        "Required skills",
+        options=options,
+        format_func=skill_label,
+        key="required_skills",
+    )
+    excluded = st.sidebar.multiselect(
+        "Excluded skills",
+        options=options,
+        format_func=skill_label,
+        key="excluded_skills",
+    )
+    if not required and not excluded:
+        return required, excluded, None
+    matched = facet_index.match(all_of=required, none_of=excluded)
+    return required, excluded, set(facet_index.job_ids(matched))
 
 
 def render_jobs_page() -> None:
@@ -23,35 +115,69 @@ def render_jobs_page() -> None:
     if "page_number" not in st.session_state:
         st.session_state.page_number = 0
 
+    search_query = st.sidebar.text_input(
+        "Search",
+        placeholder="Title, company, location or description",
+    )
+    location_query = st.sidebar.text_input(
+        "Location",
+        placeholder="City, region, or remote",
+    )
+    relevance_query = st.sidebar.text_input(
+        "Sort by relevance to",
+        placeholder="Your skills or a short profile",
+    )
+    required_skills, excluded_skills, skill_matches = render_skill_filters()
+
     with SessionLocal() as db_session:
         job_service = JobService(db_session)
-        application_service = ApplicationService(db_session)
+        location_ids = (
+            LocationService(db_session).matching_ids(location_query)
+            if location_query.strip()
+            else None
+        )
 
         st.sidebar.markdown("### Database Cleanup")
         keep_location = st.sidebar.text_input("Keep Location", value="Australia")
         cleanup_clicked = st.sidebar.button("Delete Others", key="cleanup_jobs")
         if cleanup_clicked:
             try:
-                deleted_count = job_service.cleanup_jobs(keep_location)
-                db_session.commit()
+                deleted_count = cleanup_jobs(keep_location)
             except Exception as exc:
-                db_session.rollback()
                 st.sidebar.error(f"Cleanup failed: {exc}")
             else:
                 st.sidebar.success(
                     f"Deleted {deleted_count} job{'s' if deleted_count != 1 else ''}."
                 )
 
-        jobs: list[Job] = job_service.get_active_jobs()
-
-    search_query = st.sidebar.text_input(
-        "Search",
-        placeholder="Title or company",
-    )
-    location_query = st.sidebar.text_input(
-        "Location",
-        placeholder="City, region, or remote",
-    )
+        if search_query.strip():
+            jobs: list[JobListRow] | list[JobSearchHit] = job_service.search(
+                search_query, limit=100, location_ids=location_ids
+            ).hits
+            if skill_matches is not None:
+                jobs = [job for job in jobs if job.id in skill_matches]
+        elif skill_matches is not None:
+            jobs = job_service.find_jobs_by_skills(
+                all_of=required_skills,
+                none_of=excluded_skills,
+                location_ids=location_ids,
+            )
+        else:
+            jobs = job_service.list_active_jobs(location_ids=location_ids)
+
+        relevance: dict[int, RelevantJob] = {}
+        if relevance_query.strip() and jobs:
+            relevance = {
+                job.id: job
+                for job in job_service.rank_jobs_by_relevance(
+                    relevance_query,
+                    k=len(jobs),
+                    job_ids=[job.id for job in jobs],
+                )
+            }
+            # Matching jobs first, best first; the rest keep their order.
+            order = {job_id: rank for rank, job_id in enumerate(relevance)}
+            jobs = sorted(jobs, key=lambda job: order.get(job.id, len(order)))
 
     def source_label(job: object) -> str:
         value = getattr(job, "source_platform", None)
@@ -64,26 +190,11 @@ def render_jobs_page() -> None:
         default=sources,
     )
 
-    search_value = search_query.strip().lower()
-    location_value = location_query.strip().lower()
-
-    def filter_jobs(items: Iterable[Job]) -> list[Job]:
+    def filter_jobs(
+        items: Iterable[JobListRow | JobSearchHit],
+    ) -> list[JobListRow | JobSearchHit]:
         filtered = []
         for job in items:
-            if search_value:
-                company = getattr(job, "company", "") or ""
-                title = getattr(job, "title", "") or ""
-                if (
-                    search_value not in company.lower()
-                    and search_value not in title.lower()
-                ):
-                    continue
-
-            if location_value:
-                location = getattr(job, "location", "") or ""
-                if location_value not in location.lower():
-                    continue
-
             if selected_sources and source_label(job) not in selected_sources:
                 continue
 
@@ -91,10 +202,13 @@ def render_jobs_page() -> None:
 
         return filtered
 
-    filtered_jobs: list[Job] = filter_jobs(jobs)
+    filtered_jobs = filter_jobs(jobs)
 
     if not jobs:
-        st.info("No active jobs found.")
+        if search_query.strip():
+            st.info("No active jobs match your search.")
+        else:
+            st.info("No active jobs found.")
         return
 
     st.caption(f"Showing {len(filtered_jobs)} of {len(jobs)} active jobs")
@@ -125,7 +239,6 @@ def render_jobs_page() -> None:
         def show_job_details(job_id: int) -> None:
             with SessionLocal() as dialog_session:
                 detail_service = JobService(dialog_session)
-                app_service = ApplicationService(dialog_session)
                 job = detail_service.get_job_by_id(job_id)
                 if job is None:
                     st.error("Job not found.")
@@ -158,13 +271,11 @@ def render_jobs_page() -> None:
                     )
                     if track_clicked:
                         try:
-                            application = app_service.create_application(job.id)
-                            dialog_session.commit()
+                            created = track_job(job.id)
                         except Exception as exc:
-                            dialog_session.rollback()
                             st.error(f"Failed to track application: {exc}")
                         else:
-                            if application in dialog_session.new:
+                            if created:
                                 st.success("Application tracked.")
                             else:
                                 st.info("Application already tracked.")
@@ -176,12 +287,10 @@ def render_jobs_page() -> None:
                     )
                     if archive_clicked:
                         try:
-                            archived = detail_service.archive_job(job.id)
+                            archived = archive_job(job.id)
                             if not archived:
                                 raise ValueError("Job could not be archived.")
-                            dialog_session.commit()
                         except Exception as exc:
-                            dialog_session.rollback()
                             st.error(f"Failed to archive job: {exc}")
                         else:
                             st.success("Job archived.")
@@ -217,6 +326,13 @@ def render_jobs_page() -> None:
             with col1:
                 st.markdown(f"### {job_title}")
                 st.write(job_company)
+                snippet = getattr(job, "snippet", None)
+                if snippet:
+                    st.caption(snippet)
+                match = relevance.get(job.id)
+                if match is not None:
+                    terms = ", ".join(list(match.contributions)[:5])
+                    st.caption(f"Relevance {match.score:.1f}: {terms}")
             with col2:
                 st.write(job_location)
                 st.write(
@@ -229,13 +345,11 @@ def render_jobs_page() -> None:
                 track_clicked = st.button("➕ Track", key=f"track_{job.id}")
                 if track_clicked:
                     try:
-                        application = application_service.create_application(job.id)
-                        db_session.commit()
+                        created = track_job(job.id)
                     except Exception as exc:
-                        db_session.rollback()
                         st.error(f"Failed to track application: {exc}")
                     else:
-                        if application in db_session.new:
+                        if created:
                             st.success("Application tracked.")
                         else:
                             st.info("Application already tracked.")
@@ -243,12 +357,10 @@ def render_jobs_page() -> None:
                 delete_clicked = st.button("🗑️ Delete", key=f"delete_{job.id}")
                 if delete_clicked:
                     try:
-                        deleted = job_service.delete_job(job.id)
+                        deleted = delete_job(job.id)
                         if not deleted:
                             raise ValueError("Job could not be deleted.")
-                        db_session.commit()
                     except Exception as exc:
-                        db_session.rollback()
                         st.error(f"Failed to delete job: {exc}")
                     else:
                         st.success("Job deleted.")
@@ -331,18 +443,13 @@ def render_applications_page() -> None:
                     if submitted:
                         status_changed = status_value != current_status
                         notes_changed = notes_value != current_notes
-                        if status_changed:
-                            app_service.update_application_status(
-                                application.id,
-                                status_value,
-                            )
-                        if notes_changed:
-                            app_service.update_application_notes(
+                        if status_changed or notes_changed:
+                            update_application(
                                 application.id,
-                                notes_value if notes_value else None,
+                                status_value if status_changed else None,
+                                notes_value if notes_changed else None,
+                                notes_changed,
                             )
-                        if status_changed or notes_changed:
-                            db_session.commit()
                             st.success("Application updated.")
                         else:
                             st.info("No changes to save.")
@@ -366,19 +473,17 @@ def render_applications_page() -> None:
 def render_stats_page() -> None:
     st.header("Stats")
 
-    with SessionLocal() as db_session:
-        top_skills = (
-            db_session.query(
-                Skill.skill_name,
-                func.count(JobSkill.skill_id).label("job_count"),
-            )
-            .join(JobSkill, JobSkill.skill_id == Skill.id)
-            .group_by(Skill.id)
-            .order_by(func.count(JobSkill.skill_id).desc(), Skill.skill_name.asc())
-            .limit(10)
-            .all()
+    write_stats = get_write_coordinator().stats()
+    if write_stats.requests:
+        st.caption(
+            f"Writes: {write_stats.requests} in {write_stats.batches} commits, "
+            f"p50 {write_stats.p50_ms:.1f} ms, p95 {write_stats.p95_ms:.1f} ms, "
+            f"{write_stats.retries} lock retries"
         )
 
+    with SessionLocal() as db_session:
+        top_skills = SkillStatsService(db_session).get_top_skills(limit=10)
+
     if not top_skills:
         st.info("No skills data available yet.")
         return
@@ -387,6 +492,69 @@ def render_stats_page() -> None:
     skill_counts = {skill_name: count for skill_name, count in top_skills}
     st.bar_chart(skill_counts)
 
+    render_category_demand()
+
+    render_demand_trends([skill_name for skill_name, _ in top_skills])
+
+
+def render_category_demand() -> None:
+    with SessionLocal() as db_session:
+        taxonomy = SkillTaxonomyService(db_session)
+        roots = taxonomy.demand_by_category()
+        if not roots:
+            return
+
+        st.subheader("Demand by Category")
+        parent = st.selectbox(
+            "Category",
+            ("All", *(row.category for row in roots)),
+        )
+        rows = roots if parent == "All" else taxonomy.demand_by_category(parent)
+
+    if rows:
+        st.bar_chart({row.category: row.job_count for row in rows})
+
+
+def render_demand_trends(skill_names: list[str]) -> None:
+    st.subheader("Demand Over Time")
+    days = st.selectbox(
+        "Window",
+        (30, 90, 180, 365),
+        index=1,
+        format_func=lambda value: f"Last {value} days",
+    )
+    selected = st.multiselect("Skills", skill_names, default=skill_names[:5])
+
+    with SessionLocal() as db_session:
+        stats_service = SkillStatsService(db_session)
+        trends = stats_service.get_demand_trends(selected, days=days)
+        growth = stats_service.get_demand_growth(window_days=days // 2, limit=10)
+
+    if trends:
+        chart: dict[str, list] = {
+            "day": [point.day for point in next(iter(trends.values()))]
+        }
+        for skill_name, points in trends.items():
+            chart[skill_name] = [point.count for point in points]
+        st.line_chart(chart, x="day", y=list(trends))
+
+    if growth:
+        st.caption(f"Fastest growing, last {days // 2} days vs the {days // 2} before")
+        st.dataframe(
+            [
+                {
+                    "Skill": row.skill_name,
+                    "Current": row.current,
+                    "Previous": row.previous,
+                    "Growth": (
+                        "new" if row.growth_rate is None else f"{row.growth_rate:+.0%}"
+                    ),
+                }
+                for row in growth
+            ],
+            hide_index=True,
+        )
+
 
 def main() -> None:
     st.set_page_config(page_title="Job Tracker", layout="wide")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+IDENTITY = "identity"
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+
+def available_codecs() -> tuple[str, ...]:
+    if zstandard is None:
+        return (IDENTITY, ZLIB)
+    return (IDENTITY, ZLIB, ZSTD)
+
+
+def resolve_codec(codec: str) -> str:
+    """Fall back to zlib when the requested codec is unknown or not installed."""
+    normalized = (codec or "").strip().lower()
+    if normalized in available_codecs():
+        return normalized
+    return ZLIB
+
+
+def compress_text(value: str | None, codec: str) -> bytes | None:
+    if value is None:
+        return None
+
+    data = value.encode("utf-8")
+    if codec == ZLIB:
+        return zlib.compress(data, ZLIB_LEVEL)
+    if codec == ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == IDENTITY:
+        return data
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def decompress_text(data: bytes | None, codec: str) -> str | None:
+    if data is None:
+        return None
+
+    if codec == ZLIB:
+        raw = zlib.decompress(data)
+    elif codec == ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == IDENTITY:
+        raw = bytes(data)
+    else:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    return raw.decode("utf-8")
@@ -0,0 +1,15 @@
+"""Dialect-specific statement helpers shared by the services."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def upsert_insert(db_session: Session, entity: Any) -> Any:
+    """``INSERT`` supporting ``on_conflict_do_*`` for the session's backend."""
+    if db_session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(entity)
+    return sqlite.insert(entity)
@@ -0,0 +1,81 @@
+"""Process-wide LRU caches of natural key -> row id.
+
+Lookups made inside a transaction are staged on the session and only
+published to the shared cache once that session commits; any rollback
+(including a savepoint rollback) drops them. A rolled-back insert therefore
+never leaves a dangling id behind for other sessions to reuse.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+K = TypeVar("K", bound=Hashable)
+
+
+class CommittedIdCache(Generic[K]):
+    def __init__(self, name: str, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self._staged_key = f"staged_ids:{name}"
+        self._entries: OrderedDict[K, int] = OrderedDict()
+        self._lock = threading.Lock()
+        event.listen(Session, "after_commit", self._publish)
+        event.listen(Session, "after_soft_rollback", self._discard)
+
+    def get(self, db_session: Session, key: K) -> int | None:
+        """Cached id for ``key``, including ids staged by this session."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        return self._staged(db_session).get(key)
+
+    def get_many(self, db_session: Session, keys: Iterable[K]) -> dict[K, int]:
+        staged = self._staged(db_session)
+        found: dict[K, int] = {}
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+                elif key in staged:
+                    found[key] = staged[key]
+        return found
+
+    def stage(self, db_session: Session, key: K, value: int) -> None:
+        self._staged(db_session)[key] = value
+
+    def stage_many(self, db_session: Session, values: dict[K, int]) -> None:
+        self._staged(db_session).update(values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _staged(self, db_session: Session) -> dict[K, int]:
+        return db_session.info.setdefault(self._staged_key, {})
+
+    def _publish(self, session: Session) -> None:
+        staged = session.info.pop(self._staged_key, None)
+        if not staged:
+            return
+        with self._lock:
+            self._entries.update(staged)
+            for key in staged:
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _discard(self, session: Session, _previous_transaction) -> None:
+        session.info.pop(self._staged_key, None)
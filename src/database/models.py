@@ -3,10 +3,29 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    DateTime,
+    Engine,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+    false,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from src.config import settings
+from src.database.compression import compress_text, decompress_text, resolve_codec
+
 
 class Base(DeclarativeBase):
     pass
@@ -14,13 +33,19 @@ class Base(DeclarativeBase):
 
 class Job(Base):
     __tablename__ = "jobs"
+    # Never reuse the id of a deleted job: the archive, the vector store and
+    # the relevance index all key on it.
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     company: Mapped[str] = mapped_column(String(255), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     location: Mapped[Optional[str]] = mapped_column(String(255))
-    description: Mapped[Optional[str]] = mapped_column(Text)
-    skills_raw: Mapped[Optional[str]] = mapped_column(Text)
+    location_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("locations.id"),
+        index=True,
+    )
+    skills_raw: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
     url: Mapped[Optional[str]] = mapped_column(String(2048), unique=True)
     posted_date: Mapped[Optional[date]] = mapped_column(Date)
     deadline: Mapped[Optional[date]] = mapped_column(Date)
@@ -35,8 +60,15 @@ class Job(Base):
         server_default="active",
     )
     source_platform: Mapped[Optional[str]] = mapped_column(String(100))
-    raw_html: Mapped[Optional[str]] = mapped_column(Text)
 
+    normalized_location: Mapped[Optional[Location]] = relationship(
+        back_populates="jobs",
+    )
+    content: Mapped[Optional[JobContent]] = relationship(
+        back_populates="job",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
     applications: Mapped[List[Application]] = relationship(
         back_populates="job",
         cascade="all, delete-orphan",
@@ -45,12 +77,192 @@ class Job(Base):
         back_populates="job",
         cascade="all, delete-orphan",
     )
+    enrichment_task: Mapped[Optional[EnrichmentTask]] = relationship(
+        back_populates="job",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
     skills: Mapped[List[Skill]] = relationship(
         secondary="job_skills",
         back_populates="jobs",
         viewonly=True,
     )
 
+    @property
+    def description(self) -> str | None:
+        return self.content.description if self.content is not None else None
+
+    @description.setter
+    def description(self, value: str | None) -> None:
+        self._ensure_content().description = value
+
+    @property
+    def raw_html(self) -> str | None:
+        return self.content.raw_html if self.content is not None else None
+
+    @raw_html.setter
+    def raw_html(self, value: str | None) -> None:
+        self._ensure_content().raw_html = value
+
+    def _ensure_content(self) -> JobContent:
+        if self.content is None:
+            self.content = JobContent(codec=resolve_codec(settings.CONTENT_CODEC))
+        return self.content
+
+
+class EnrichmentTask(Base):
+    """Skill-extraction work item for one job, driven by ``EnrichmentQueue``."""
+
+    __tablename__ = "enrichment_tasks"
+    __table_args__ = (
+        Index("ix_enrichment_tasks_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"), primary_key=True)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="pending",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp(),
+    )
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    leased_by: Mapped[Optional[str]] = mapped_column(String(100))
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    # "dictionary" or the model(s) that produced the saved skills.
+    served_by: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+
+    job: Mapped[Job] = relationship(back_populates="enrichment_task")
+
+
+class LLMCall(Base):
+    """One model attempt recorded by ``LLMTelemetry`` when persistence is on."""
+
+    __tablename__ = "llm_calls"
+    __table_args__ = (Index("ix_llm_calls_model_created_at", "model", "created_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    outcome: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
+    latency_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    load_ms: Mapped[Optional[float]] = mapped_column(Float)
+    prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer)
+    completion_tokens: Mapped[Optional[int]] = mapped_column(Integer)
+    prompt_eval_ms: Mapped[Optional[float]] = mapped_column(Float)
+    eval_ms: Mapped[Optional[float]] = mapped_column(Float)
+    prompt_version: Mapped[str] = mapped_column(
+        String(20), nullable=False, server_default=""
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp(),
+    )
+
+
+class Location(Base):
+    """Parsed location dimension; ``""`` marks a part the source left out."""
+
+    __tablename__ = "locations"
+    __table_args__ = (
+        UniqueConstraint(
+            "city", "region", "country", "is_remote", name="uq_locations_parts"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    city: Mapped[str] = mapped_column(String(255), nullable=False, server_default="")
+    region: Mapped[str] = mapped_column(
+        String(255), nullable=False, server_default="", index=True
+    )
+    country: Mapped[str] = mapped_column(
+        String(100), nullable=False, server_default="", index=True
+    )
+    is_remote: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, server_default=false()
+    )
+
+    jobs: Mapped[List[Job]] = relationship(back_populates="normalized_location")
+
+    @property
+    def label(self) -> str:
+        label = ", ".join(part for part in (self.city, self.region, self.country) if part)
+        if self.is_remote:
+            return f"{label} (Remote)" if label else "Remote"
+        return label
+
+
+class JobContent(Base):
+    """Heavy per-job text, stored compressed outside the hot ``jobs`` table."""
+
+    __tablename__ = "job_content"
+
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"), primary_key=True)
+    codec: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="zlib",
+    )
+    description_data: Mapped[Optional[bytes]] = mapped_column(
+        "description", LargeBinary
+    )
+    raw_html_data: Mapped[Optional[bytes]] = mapped_column("raw_html", LargeBinary)
+
+    job: Mapped[Job] = relationship(back_populates="content")
+
+    @property
+    def description(self) -> str | None:
+        return decompress_text(self.description_data, self.codec)
+
+    @description.setter
+    def description(self, value: str | None) -> None:
+        self._recode()
+        self.description_data = compress_text(value, self.codec)
+
+    @property
+    def raw_html(self) -> str | None:
+        return decompress_text(self.raw_html_data, self.codec)
+
+    @raw_html.setter
+    def raw_html(self, value: str | None) -> None:
+        self._recode()
+        self.raw_html_data = compress_text(value, self.codec)
+
+    def _recode(self) -> None:
+        # Both columns share one codec, so a write under a different
+        # configured codec re-encodes the column that is not being replaced.
+        target = resolve_codec(settings.CONTENT_CODEC)
+        if self.codec is None:
+            self.codec = target
+            return
+        if self.codec == target:
+            return
+
+        description = self.description
+        raw_html = self.raw_html
+        self.codec = target
+        self.description_data = compress_text(description, target)
+        self.raw_html_data = compress_text(raw_html, target)
+
+
+class JobRevision(Base):
+    """Marker of the last edit to a job's embedded text (title, description).
+
+    Written only by SQLite triggers (see ``JOB_REVISION_TRIGGERS_DDL``);
+    jobs without a row are at revision 0. Stores derived from the text
+    remember the revision they indexed and redo jobs whose marker moved.
+    """
+
+    __tablename__ = "job_revisions"
+
+    # No foreign key: the jobs delete trigger removes the row.
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False)
+
 
 class Application(Base):
     __tablename__ = "applications"
@@ -79,10 +291,15 @@ class Skill(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     skill_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     category: Mapped[Optional[str]] = mapped_column(String(100))
+    category_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("skill_categories.id"),
+        index=True,
+    )
     frequency: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
-        server_default="1",
+        server_default="0",
+        index=True,
     )
     priority: Mapped[int] = mapped_column(
         Integer,
@@ -99,10 +316,82 @@ class Skill(Base):
         back_populates="skills",
         viewonly=True,
     )
+    skill_category: Mapped[Optional[SkillCategory]] = relationship(
+        back_populates="skills",
+    )
+    aliases: Mapped[List[SkillAlias]] = relationship(
+        back_populates="skill",
+        cascade="all, delete-orphan",
+    )
+
+
+class SkillAlias(Base):
+    """Alternative spelling that canonicalizes to ``skill`` (``py`` -> python)."""
+
+    __tablename__ = "skill_aliases"
+
+    alias: Mapped[str] = mapped_column(String(255), primary_key=True)
+    skill_id: Mapped[int] = mapped_column(
+        ForeignKey("skills.id"),
+        nullable=False,
+        index=True,
+    )
+
+    skill: Mapped[Skill] = relationship(back_populates="aliases")
+
+
+class SkillCategory(Base):
+    __tablename__ = "skill_categories"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    parent_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("skill_categories.id"),
+        index=True,
+    )
+
+    parent: Mapped[Optional[SkillCategory]] = relationship(
+        remote_side="SkillCategory.id",
+    )
+    skills: Mapped[List[Skill]] = relationship(back_populates="skill_category")
+
+
+class SkillCategoryClosure(Base):
+    """Every (ancestor, descendant) category pair, including self at depth 0."""
+
+    __tablename__ = "skill_category_closure"
+    __table_args__ = (
+        Index("ix_skill_category_closure_descendant", "descendant_id", "ancestor_id"),
+    )
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("skill_categories.id"),
+        primary_key=True,
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("skill_categories.id"),
+        primary_key=True,
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class CacheVersion(Base):
+    """Counter bumped when shared data changes under process-wide caches.
+
+    Each process remembers the version its caches were loaded at and drops
+    them once the stored version moves on.
+    """
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
 
 class JobSkill(Base):
     __tablename__ = "job_skills"
+    # The primary key leads with job_id; this serves "jobs having skill X".
+    __table_args__ = (Index("ix_job_skills_skill_id_job_id", "skill_id", "job_id"),)
 
     job_id: Mapped[int] = mapped_column(
         ForeignKey("jobs.id"),
@@ -116,3 +405,207 @@ class JobSkill(Base):
 
     job: Mapped[Job] = relationship(back_populates="job_skills")
     skill: Mapped[Skill] = relationship(back_populates="job_skills")
+
+
+class SkillDemandDaily(Base):
+    """Per-day count of jobs asking for a skill, rolled up as jobs are enriched.
+
+    Rows are keyed by the job's posting day (falling back to the scrape day)
+    and only ever grow, so trends survive retention deleting the jobs they
+    were counted from. ``source_platform`` is ``""`` when unknown.
+    """
+
+    __tablename__ = "skill_demand_daily"
+    __table_args__ = (Index("ix_skill_demand_daily_skill_day", "skill_id", "day"),)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    skill_id: Mapped[int] = mapped_column(
+        ForeignKey("skills.id"),
+        primary_key=True,
+    )
+    source_platform: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        server_default="",
+    )
+    count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+
+# Full-text index over jobs. SQLite only: a regular FTS5 table so snippets
+# can be produced without reading back the compressed ``job_content`` rows.
+# Triggers keep it in sync on every write path: those on ``jobs`` copy the
+# hot columns, those on ``job_content`` decompress the description through
+# the ``job_content_text`` SQL function registered on every SQLite
+# connection (a writer without it fails loudly instead of going stale).
+# Migrations import these statements rather than keeping their own copy.
+JOBS_FTS_TABLE_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title,
+        company,
+        location,
+        description,
+        prefix='2 3',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """
+
+JOBS_FTS_TRIGGERS_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, location)
+        VALUES (new.id, new.title, new.company, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        DELETE FROM jobs_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+    AFTER UPDATE OF title, company, location ON jobs BEGIN
+        UPDATE jobs_fts
+        SET title = new.title, company = new.company, location = new.location
+        WHERE rowid = new.id;
+    END
+    """,
+)
+
+for _statement in (JOBS_FTS_TABLE_DDL, *JOBS_FTS_TRIGGERS_DDL):
+    event.listen(
+        Job.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    Job.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS jobs_fts").execute_if(dialect="sqlite"),
+)
+
+JOB_CONTENT_FTS_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS job_content_fts_ai AFTER INSERT ON job_content
+    BEGIN
+        UPDATE jobs_fts
+        SET description = job_content_text(new.description, new.codec)
+        WHERE rowid = new.job_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_content_fts_au
+    AFTER UPDATE OF description, codec ON job_content BEGIN
+        UPDATE jobs_fts
+        SET description = job_content_text(new.description, new.codec)
+        WHERE rowid = new.job_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_content_fts_ad AFTER DELETE ON job_content
+    BEGIN
+        UPDATE jobs_fts SET description = NULL WHERE rowid = old.job_id;
+    END
+    """,
+)
+
+for _statement in JOB_CONTENT_FTS_DDL:
+    event.listen(
+        JobContent.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+
+# ``cache_versions`` counter bumped on every write that can change which
+# counted jobs need which skill, so the skill facet index can skip its count
+# scans while nothing changed. Triggers catch every write path, raw SQL
+# included.
+JOB_SKILLS_CACHE = "job_skills"
+
+_BUMP_JOB_SKILLS_VERSION = f"""
+        INSERT INTO cache_versions (name, version) VALUES ('{JOB_SKILLS_CACHE}', 1)
+        ON CONFLICT (name) DO UPDATE SET version = version + 1;
+"""
+
+JOB_SKILLS_VERSION_TRIGGERS_DDL = tuple(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {table}_version_{suffix} {event_clause} BEGIN
+        {_BUMP_JOB_SKILLS_VERSION.strip()}
+    END
+    """
+    for table, suffix, event_clause in (
+        ("jobs", "ai", "AFTER INSERT ON jobs"),
+        ("jobs", "ad", "AFTER DELETE ON jobs"),
+        ("jobs", "au", "AFTER UPDATE OF status ON jobs"),
+        ("job_skills", "ai", "AFTER INSERT ON job_skills"),
+        ("job_skills", "ad", "AFTER DELETE ON job_skills"),
+        ("job_skills", "au", "AFTER UPDATE ON job_skills"),
+    )
+)
+
+for _statement in JOB_SKILLS_VERSION_TRIGGERS_DDL:
+    event.listen(
+        JobSkill.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+
+# Each edit to a job's title or description takes the next value of the
+# ``job_content`` counter in ``cache_versions`` as that job's revision, so
+# revisions never repeat, even across deleted jobs, and the counter alone
+# tells whether any text changed.
+JOB_CONTENT_CACHE = "job_content"
+
+_BUMP_JOB_REVISION = f"""
+        INSERT INTO cache_versions (name, version) VALUES ('{JOB_CONTENT_CACHE}', 1)
+        ON CONFLICT (name) DO UPDATE SET version = version + 1;
+        INSERT INTO job_revisions (job_id, revision)
+        VALUES (
+            {{job_id}},
+            (SELECT version FROM cache_versions WHERE name = '{JOB_CONTENT_CACHE}')
+        )
+        ON CONFLICT (job_id) DO UPDATE SET revision = excluded.revision;
+"""
+
+JOB_REVISION_TRIGGERS_DDL = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_content_revision_ai
+    AFTER INSERT ON job_content BEGIN
+        {_BUMP_JOB_REVISION.format(job_id="new.job_id").strip()}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_content_revision_au
+    AFTER UPDATE OF description ON job_content BEGIN
+        {_BUMP_JOB_REVISION.format(job_id="new.job_id").strip()}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jobs_revision_au AFTER UPDATE OF title ON jobs
+    BEGIN
+        {_BUMP_JOB_REVISION.format(job_id="new.id").strip()}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_revision_ad AFTER DELETE ON jobs BEGIN
+        DELETE FROM job_revisions WHERE job_id = old.id;
+    END
+    """,
+)
+
+for _statement in JOB_REVISION_TRIGGERS_DDL:
+    event.listen(
+        JobContent.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, _connection_record) -> None:
+    # Only SQLite drivers (pysqlite, aiosqlite) have create_function.
+    create_function = getattr(dbapi_connection, "create_function", None)
+    if create_function is not None:
+        create_function("job_content_text", 2, decompress_text, deterministic=True)
@@ -0,0 +1,77 @@
+"""Slim, read-only row types for list views.
+
+These are plain tuples built from Core selects, so list pages never hydrate
+``Job`` ORM objects or pull the large TEXT columns.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import NamedTuple
+
+from src.database.models import Job
+
+
+class JobListRow(NamedTuple):
+    id: int
+    title: str
+    company: str
+    location: str | None
+    posted_date: date | None
+    source_platform: str | None
+    scraped_at: datetime
+
+
+JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.posted_date,
+    Job.source_platform,
+    Job.scraped_at,
+)
+
+
+class RankedJob(NamedTuple):
+    id: int
+    title: str
+    company: str
+    location: str | None
+    posted_date: date | None
+    source_platform: str | None
+    scraped_at: datetime
+    score: float
+
+
+class RelevantJob(NamedTuple):
+    id: int
+    title: str
+    company: str
+    location: str | None
+    posted_date: date | None
+    source_platform: str | None
+    scraped_at: datetime
+    score: float
+    contributions: dict[str, float]
+
+
+class SearchCursor(NamedTuple):
+    rank: float
+    job_id: int
+
+
+class JobSearchHit(NamedTuple):
+    id: int
+    title: str
+    company: str
+    location: str | None
+    posted_date: date | None
+    source_platform: str | None
+    snippet: str
+    rank: float
+
+
+class JobSearchPage(NamedTuple):
+    hits: list[JobSearchHit]
+    next_cursor: SearchCursor | None
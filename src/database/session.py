@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generator
+import threading
+from typing import Any, AsyncGenerator, Dict, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import settings
@@ -14,11 +22,61 @@ def _get_connect_args(database_url: str) -> Dict[str, Any]:
     return {}
 
 
+def configure_sqlite_engine(target: Engine) -> None:
+    """Apply connection pragmas and explicit transaction control for SQLite.
+
+    WAL lets readers run alongside the single writer, ``busy_timeout``
+    makes a blocked writer wait instead of failing immediately and
+    ``foreign_keys`` enforces the constraints SQLite ignores by default.
+    pysqlite's own transaction handling is disabled so SQLAlchemy emits
+    ``BEGIN`` itself, which makes SAVEPOINTs nest correctly. Connections opened with
+    the ``sqlite_begin_immediate`` execution option take the write lock up
+    front.
+    """
+    if target.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_connection, _connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        if settings.sqlite_journal_mode:
+            cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(target, "begin")
+    def _on_begin(connection) -> None:
+        if connection.get_execution_options().get("sqlite_begin_immediate"):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            connection.exec_driver_sql("BEGIN")
+
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> URL:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if url.get_driver_name() in ("aiosqlite", "asyncpg"):
+        return url
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database: {backend}")
+    return url.set(drivername=_ASYNC_DRIVERS[backend])
+
+
 engine = create_engine(
     settings.database_url,
     connect_args=_get_connect_args(settings.database_url),
 )
 
+configure_sqlite_engine(engine)
+
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
@@ -26,9 +84,40 @@ SessionLocal = sessionmaker(
 )
 
 
+_async_engine: AsyncEngine | None = None
+_async_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_async_lock = threading.Lock()
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Async sessions on ``DATABASE_URL``, built on first use.
+
+    Built lazily so sync-only users never need an async driver (or a
+    backend that has one) just to import this module.
+    """
+    global _async_engine, _async_sessionmaker
+    with _async_lock:
+        if _async_sessionmaker is None:
+            _async_engine = create_async_engine(
+                get_async_database_url(settings.database_url)
+            )
+            configure_sqlite_engine(_async_engine.sync_engine)
+            _async_sessionmaker = async_sessionmaker(
+                bind=_async_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return _async_sessionmaker
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+
+def utc_now() -> datetime:
+    """Current UTC time as a naive ``datetime``, matching the ``DateTime``
+    columns (and ``CURRENT_TIMESTAMP`` defaults), which store naive UTC.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
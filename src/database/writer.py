@@ -0,0 +1,252 @@
+"""Single-writer coordination for database mutations.
+
+Every mutation is submitted as a callable that receives a ``Session``. One
+background thread drains the queue, runs whatever is waiting as a group in
+a single transaction (each callable inside its own savepoint, so one
+failure does not sink its neighbours), and commits once. Lock errors from
+SQLite are retried with jittered exponential backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, NamedTuple, TypeVar
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.database.session import SessionLocal
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_LOCK_ERROR_MARKERS = ("database is locked", "database table is locked", "busy")
+
+
+class WriteStats(NamedTuple):
+    requests: int
+    failures: int
+    batches: int
+    retries: int
+    mean_batch_size: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+class _WriteRequest:
+    __slots__ = ("fn", "future", "submitted_at")
+
+    def __init__(self, fn: Callable[[Session], Any]) -> None:
+        self.fn = fn
+        self.future: Future[Any] = Future()
+        self.submitted_at = time.perf_counter()
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    if not isinstance(exc, OperationalError):
+        return False
+    message = str(exc.orig if exc.orig is not None else exc).lower()
+    return any(marker in message for marker in _LOCK_ERROR_MARKERS)
+
+
+class WriteCoordinator:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        max_batch_size: int = 64,
+        batch_window: float = 0.005,
+        max_retries: int = 5,
+        retry_base_delay: float = 0.05,
+        retry_max_delay: float = 1.0,
+        latency_window: int = 1000,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+        self._queue: queue.Queue[_WriteRequest | None] = queue.Queue()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._failures = 0
+        self._batches = 0
+        self._retries = 0
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="db-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._start_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(None)
+            thread.join(timeout)
+            self._thread = None
+
+    def submit(self, fn: Callable[[Session], T]) -> Future[T]:
+        self.start()
+        request = _WriteRequest(fn)
+        self._queue.put(request)
+        return request.future
+
+    def execute(self, fn: Callable[[Session], T], timeout: float | None = None) -> T:
+        return self.submit(fn).result(timeout)
+
+    async def execute_async(self, fn: Callable[[Session], T]) -> T:
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def stats(self) -> WriteStats:
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            requests = self._requests
+            failures = self._failures
+            batches = self._batches
+            retries = self._retries
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            index = min(len(latencies) - 1, int(fraction * len(latencies)))
+            return latencies[index] * 1000
+
+        return WriteStats(
+            requests=requests,
+            failures=failures,
+            batches=batches,
+            retries=retries,
+            mean_batch_size=requests / batches if batches else 0.0,
+            p50_ms=percentile(0.50),
+            p95_ms=percentile(0.95),
+            max_ms=latencies[-1] * 1000 if latencies else 0.0,
+        )
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            deadline = time.perf_counter() + self.batch_window
+            stop_after_batch = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop_after_batch = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+            if stop_after_batch:
+                return
+
+    def _commit_batch(self, batch: list[_WriteRequest]) -> None:
+        attempt = 0
+        while True:
+            outcomes: list[tuple[bool, Any]] = []
+            session = self.session_factory(expire_on_commit=False)
+            try:
+                session.connection(
+                    execution_options={"sqlite_begin_immediate": True}
+                )
+                for request in batch:
+                    outcomes.append(self._apply(session, request))
+                session.commit()
+            except Exception as exc:
+                session.rollback()
+                if is_lock_error(exc) and attempt < self.max_retries:
+                    attempt += 1
+                    with self._stats_lock:
+                        self._retries += 1
+                    time.sleep(self._backoff(attempt))
+                    continue
+                logger.exception("Write batch of %s requests failed", len(batch))
+                self._finish(batch, [(False, exc)] * len(batch))
+                return
+            finally:
+                session.close()
+
+            self._finish(batch, outcomes)
+            return
+
+    def _apply(self, session: Session, request: _WriteRequest) -> tuple[bool, Any]:
+        savepoint = session.begin_nested()
+        try:
+            result = request.fn(session)
+            savepoint.commit()
+        except Exception as exc:
+            savepoint.rollback()
+            if is_lock_error(exc):
+                # Retry the whole batch rather than failing one request.
+                raise
+            return False, exc
+        return True, result
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _finish(
+        self, batch: list[_WriteRequest], outcomes: list[tuple[bool, Any]]
+    ) -> None:
+        finished_at = time.perf_counter()
+        failures = 0
+        for request, (succeeded, value) in zip(batch, outcomes):
+            if succeeded:
+                request.future.set_result(value)
+            else:
+                failures += 1
+                request.future.set_exception(value)
+
+        with self._stats_lock:
+            self._requests += len(batch)
+            self._failures += failures
+            self._batches += 1
+            self._latencies.extend(
+                finished_at - request.submitted_at for request in batch
+            )
+
+
+_default_coordinator: WriteCoordinator | None = None
+_default_lock = threading.Lock()
+
+
+def get_write_coordinator() -> WriteCoordinator:
+    """Process-wide writer bound to ``SessionLocal``."""
+    global _default_coordinator
+    with _default_lock:
+        if _default_coordinator is None:
+            _default_coordinator = WriteCoordinator(SessionLocal)
+        return _default_coordinator
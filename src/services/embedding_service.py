@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.ai.llm_client import LLMClient
+from src.ai.preprocessing import clean_description
+from src.config import settings
+from src.database.models import Job, JobContent, JobRevision
+from src.logger import get_logger
+from src.services.vector_store import JobVectorStore, get_job_vector_store
+
+logger = get_logger(__name__)
+
+
+class EmbeddingService:
+    """Keeps the job vector store in step with the active jobs.
+
+    Each job is embedded from its title and cleaned description, and again
+    whenever its ``JobRevision`` moves past the one stored with the vector;
+    vectors of deleted jobs are dropped from the store. Job ids are never
+    reused (``jobs`` is AUTOINCREMENT), so a stored id always belongs to the
+    job it was embedded from.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        llm_client: LLMClient,
+        store: JobVectorStore | None = None,
+    ) -> None:
+        self.db_session = db_session
+        self.llm_client = llm_client
+        self.store = store if store is not None else get_job_vector_store()
+
+    def embed_new_jobs(self, limit: int | None = None) -> int:
+        """Embed up to ``limit`` active jobs missing from the store or edited
+        since they were embedded, newest first.
+        """
+        model = settings.ollama_embedding_model
+        if self.store.model not in (None, model):
+            logger.warning(
+                "Vector store holds %s embeddings, not %s; remove %s to rebuild",
+                self.store.model,
+                model,
+                self.store.path,
+            )
+            return 0
+
+        stored = self.store.job_revisions()
+        all_ids = set(self.db_session.scalars(select(Job.id)))
+        removed = self.store.remove(stored.keys() - all_ids)
+        if removed:
+            logger.info("Dropped %s vectors of deleted jobs", removed)
+
+        active = self.db_session.execute(
+            select(Job.id, func.coalesce(JobRevision.revision, 0))
+            .outerjoin(JobRevision, JobRevision.job_id == Job.id)
+            .where(Job.status == "active")
+            .order_by(Job.id.desc())
+        )
+        missing = {
+            job_id: revision
+            for job_id, revision in active
+            if stored.get(job_id) != revision
+        }
+        job_ids = list(missing)[:limit]
+
+        embedded = 0
+        batch_size = max(1, settings.embedding_batch_size)
+        for start in range(0, len(job_ids), batch_size):
+            texts = self.load_texts(job_ids[start : start + batch_size])
+            vectors = self.llm_client.embed(list(texts.values()), model)
+            if vectors is None:
+                logger.warning("Embedding stopped after %s jobs", embedded)
+                break
+            self.store.add(
+                list(texts), vectors, model, [missing[job_id] for job_id in texts]
+            )
+            embedded += len(texts)
+        if embedded:
+            logger.info("Embedded %s jobs", embedded)
+        return embedded
+
+    def load_texts(self, job_ids: list[int]) -> dict[int, str]:
+        """Title plus cleaned description per job, in ``job_ids`` order."""
+        rows = self.db_session.execute(
+            select(Job.id, Job.title, JobContent)
+            .outerjoin(JobContent, JobContent.job_id == Job.id)
+            .where(Job.id.in_(job_ids))
+        )
+        texts = {
+            job_id: "\n".join(
+                part
+                for part in (
+                    title,
+                    clean_description(content.description) if content else "",
+                )
+                if part
+            )
+            for job_id, title, content in rows
+        }
+        return {job_id: texts[job_id] for job_id in job_ids if job_id in texts}
+
+
+def run_embedding(
+    session_factory: Callable[[], Session], llm_client: LLMClient
+) -> int:
+    """Entry point for the scraper run: embed every job still missing."""
+    with session_factory() as db_session:
+        return EmbeddingService(db_session, llm_client).embed_new_jobs()
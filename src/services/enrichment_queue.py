@@ -0,0 +1,219 @@
+"""Persistent queue of jobs waiting for skill extraction.
+
+Every job gets an ``enrichment_tasks`` row when it is created. Workers
+``claim`` due tasks under a time-limited lease, the skill save marks its
+task ``done`` in the same transaction, and ``release`` sends whatever is
+still leased back to ``pending`` with exponential backoff, or to ``failed``
+once ``max_attempts`` is used up or the job can never succeed (no
+description). A crashed worker's lease simply expires and the task is
+claimed again, so polling is one indexed lookup and nothing spins forever.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.database.dialects import upsert_insert
+from src.database.models import EnrichmentTask
+from src.database.timestamps import utc_now
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueStats(NamedTuple):
+    pending: int
+    in_progress: int
+    done: int
+    failed: int
+
+
+def default_worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class EnrichmentQueue:
+    def __init__(
+        self,
+        db_session: Session,
+        max_attempts: int | None = None,
+        lease_seconds: int | None = None,
+        retry_base_seconds: int | None = None,
+    ) -> None:
+        self.db_session = db_session
+        self.max_attempts = max_attempts or settings.enrichment_max_attempts
+        self.lease_seconds = lease_seconds or settings.enrichment_lease_seconds
+        self.retry_base_seconds = (
+            retry_base_seconds or settings.enrichment_retry_base_seconds
+        )
+
+    def enqueue(self, job_ids: Sequence[int], now: datetime | None = None) -> None:
+        """Queue ``job_ids``; failed tasks are given a fresh set of attempts."""
+        if not job_ids:
+            return
+        now = now or utc_now()
+        stmt = upsert_insert(self.db_session, EnrichmentTask).values(
+            [
+                {"job_id": job_id, "status": PENDING, "next_attempt_at": now}
+                for job_id in job_ids
+            ]
+        )
+        self.db_session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["job_id"],
+                set_={
+                    "status": PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": now,
+                    "last_error": None,
+                },
+                where=EnrichmentTask.status == FAILED,
+            )
+        )
+
+    def claim(
+        self,
+        limit: int = 100,
+        worker: str | None = None,
+        now: datetime | None = None,
+    ) -> list[int]:
+        """Lease up to ``limit`` due tasks: pending ones past their retry time
+        and in-progress ones whose lease has expired.
+        """
+        now = now or utc_now()
+        self._fail_exhausted_leases(now)
+
+        due = or_(
+            and_(
+                EnrichmentTask.status == PENDING,
+                EnrichmentTask.next_attempt_at <= now,
+            ),
+            and_(
+                EnrichmentTask.status == IN_PROGRESS,
+                EnrichmentTask.lease_expires_at < now,
+            ),
+        )
+        candidates = (
+            select(EnrichmentTask.job_id)
+            .where(due)
+            .order_by(EnrichmentTask.next_attempt_at, EnrichmentTask.job_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db_session.execute(
+            update(EnrichmentTask)
+            .where(EnrichmentTask.job_id.in_(candidates), due)
+            .values(
+                status=IN_PROGRESS,
+                attempts=EnrichmentTask.attempts + 1,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                leased_by=worker or default_worker_name(),
+            )
+            .returning(EnrichmentTask.job_id)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.scalars())
+
+    def complete(self, job_ids: Sequence[int], served_by: str | None = None) -> None:
+        """Mark ``job_ids`` done, recording the extractor or model tier used."""
+        if not job_ids:
+            return
+        self.db_session.execute(
+            update(EnrichmentTask)
+            .where(EnrichmentTask.job_id.in_(job_ids))
+            .values(
+                status=DONE,
+                lease_expires_at=None,
+                leased_by=None,
+                last_error=None,
+                served_by=served_by,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def release(
+        self,
+        job_ids: Sequence[int],
+        error: str,
+        permanent: bool = False,
+        now: datetime | None = None,
+    ) -> int:
+        """Return still-leased ``job_ids`` to the queue after a failed attempt.
+
+        Tasks are retried after ``retry_base_seconds * 2 ** (attempts - 1)``
+        unless ``permanent`` or out of attempts, in which case they fail.
+        """
+        if not job_ids:
+            return 0
+        now = now or utc_now()
+        leased = self.db_session.execute(
+            select(EnrichmentTask.job_id, EnrichmentTask.attempts).where(
+                EnrichmentTask.job_id.in_(job_ids),
+                EnrichmentTask.status == IN_PROGRESS,
+            )
+        ).all()
+
+        by_attempts: dict[int, list[int]] = {}
+        for job_id, attempts in leased:
+            by_attempts.setdefault(attempts, []).append(job_id)
+        for attempts, ids in by_attempts.items():
+            if permanent or attempts >= self.max_attempts:
+                values = {"status": FAILED}
+            else:
+                delay = self.retry_base_seconds * 2 ** max(attempts - 1, 0)
+                values = {
+                    "status": PENDING,
+                    "next_attempt_at": now + timedelta(seconds=delay),
+                }
+            self.db_session.execute(
+                update(EnrichmentTask)
+                .where(EnrichmentTask.job_id.in_(ids))
+                .values(
+                    lease_expires_at=None, leased_by=None, last_error=error, **values
+                )
+                .execution_options(synchronize_session=False)
+            )
+        if leased:
+            logger.info("Released %s enrichment tasks: %s", len(leased), error)
+        return len(leased)
+
+    def stats(self) -> QueueStats:
+        counts = {
+            status: count
+            for status, count in self.db_session.execute(
+                select(EnrichmentTask.status, func.count()).group_by(
+                    EnrichmentTask.status
+                )
+            )
+        }
+        return QueueStats(*(counts.get(status, 0) for status in QueueStats._fields))
+
+    def _fail_exhausted_leases(self, now: datetime) -> None:
+        self.db_session.execute(
+            update(EnrichmentTask)
+            .where(
+                EnrichmentTask.status == IN_PROGRESS,
+                EnrichmentTask.lease_expires_at < now,
+                EnrichmentTask.attempts >= self.max_attempts,
+            )
+            .values(
+                status=FAILED,
+                lease_expires_at=None,
+                leased_by=None,
+                last_error="lease expired",
+            )
+            .execution_options(synchronize_session=False)
+        )
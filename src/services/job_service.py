@@ -1,19 +1,84 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import re
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from sqlalchemy import delete, not_, or_, select, update
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    bindparam,
+    delete,
+    func,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from src.database.models import Job
+from src.database.models import (
+    Application,
+    EnrichmentTask,
+    Job,
+    JobContent,
+    JobSkill,
+    Skill,
+)
+from src.database.read_models import (
+    JOB_LIST_COLUMNS,
+    JobListRow,
+    JobSearchHit,
+    JobSearchPage,
+    RankedJob,
+    RelevantJob,
+    SearchCursor,
+)
 from src.logger import get_logger
+from src.services.enrichment_queue import EnrichmentQueue
+from src.services.location_service import LocationService
+from src.services.relevance_index import RelevanceIndex, get_relevance_index
+from src.services.skill_stats_service import COUNTED_STATUS, SkillStatsService
+from src.services.skill_taxonomy import get_alias_map
+from src.services.vector_store import JobVectorStore, get_job_vector_store
 
 if TYPE_CHECKING:
-    from src.services.skill_service import SkillService
+    from src.ai.llm_client import LLMClient
+    from src.database.writer import WriteCoordinator
+    from src.services.skill_service import AsyncSkillService, SkillService
 
 
 logger = get_logger(__name__)
 
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+NO_SKILLS_ERROR = "no skills extracted"
+LLM_UNAVAILABLE_ERROR = "llm unavailable"
+
+T = TypeVar("T")
+
+# bm25() column weights, in jobs_fts column order:
+# title, company, location, description.
+_SEARCH_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+
+def _release_error(llm_client: LLMClient) -> str:
+    return NO_SKILLS_ERROR if llm_client.available() else LLM_UNAVAILABLE_ERROR
+
+
+def _normalize_skill_names(
+    names: Sequence[str], aliases: Mapping[str, str]
+) -> list[str]:
+    normalized = (name.strip().lower() for name in names)
+    return sorted({aliases.get(name, name) for name in normalized if name})
+
+
+def build_fts_query(query: str) -> str:
+    """Turn free text into a safe FTS5 query: every word is a quoted prefix term."""
+    tokens = _SEARCH_TOKEN_RE.findall(query.lower())
+    return " ".join(f'"{token}"*' for token in tokens)
+
 
 class JobService:
     def __init__(self, db_session: Session) -> None:
@@ -30,15 +95,30 @@ class JobService:
 
     def delete_job(self, job_id: int) -> bool:
         try:
-            stmt = delete(Job).where(Job.id == job_id)
-            result = self.db_session.execute(stmt)
-            return (result.rowcount or 0) > 0
+            return self.delete_jobs([job_id]) > 0
         except Exception:
             logger.exception("Failed to delete job: %s", job_id)
             return False
 
+    def delete_jobs(self, job_ids: Sequence[int]) -> int:
+        """Delete jobs and their child rows with Core statements.
+
+        Bulk deletes bypass ORM cascades, so every table that references
+        ``jobs`` is cleared explicitly before the parent rows go.
+        """
+        if not job_ids:
+            return 0
+
+        ids = list(job_ids)
+        SkillStatsService(self.db_session).adjust_for_jobs(ids, sign=-1)
+        for child in (JobSkill, Application, JobContent, EnrichmentTask):
+            self.db_session.execute(delete(child).where(child.job_id.in_(ids)))
+        result = self.db_session.execute(delete(Job).where(Job.id.in_(ids)))
+        return result.rowcount or 0
+
     def archive_job(self, job_id: int) -> bool:
         try:
+            SkillStatsService(self.db_session).adjust_for_jobs([job_id], sign=-1)
             stmt = (
                 update(Job)
                 .where(Job.id == job_id)
@@ -51,19 +131,38 @@ class JobService:
             logger.exception("Failed to archive job: %s", job_id)
             return False
 
-    def cleanup_jobs(self, location_filter: str = "Australia") -> int:
+    def cleanup_jobs(
+        self, location_filter: str = "Australia", chunk_size: int = 500
+    ) -> int:
+        """Delete jobs outside ``location_filter`` in small committed chunks.
+
+        Jobs with a tracked application are kept.
+        """
+        deleted = 0
         try:
-            stmt = delete(Job).where(
-                or_(
-                    Job.location.is_(None),
-                    not_(Job.location.contains(location_filter)),
-                )
-            )
-            result = self.db_session.execute(stmt)
-            return result.rowcount or 0
+            while True:
+                removed = self.cleanup_jobs_chunk(location_filter, chunk_size)
+                if not removed:
+                    break
+                deleted += removed
+                self.db_session.commit()
         except Exception:
+            self.db_session.rollback()
             logger.exception("Failed to cleanup jobs with filter: %s", location_filter)
-            return 0
+        return deleted
+
+    def cleanup_jobs_chunk(
+        self, location_filter: str = "Australia", chunk_size: int = 500
+    ) -> int:
+        """Delete one chunk of ``cleanup_jobs`` without committing."""
+        locations = LocationService(self.db_session)
+        locations.backfill_missing()
+        condition = and_(locations.outside(location_filter), ~Job.applications.any())
+        return self.delete_jobs(self.select_job_ids(condition, chunk_size))
+
+    def select_job_ids(self, condition: ColumnElement[bool], limit: int) -> list[int]:
+        stmt = select(Job.id).where(condition).order_by(Job.id).limit(limit)
+        return list(self.db_session.scalars(stmt))
 
     def upsert_job(self, job_data: dict[str, Any]) -> Job:
         url = job_data.get("url")
@@ -88,42 +187,332 @@ class JobService:
             key: value for key, value in job_data.items() if key in allowed_fields
         }
 
+        location = payload.get("location")
+        if "location" in payload and (job is None or job.location != location):
+            payload["location_id"] = LocationService(self.db_session).resolve_id(location)
+
         if job is None:
             job = Job(**payload)
+            job.enrichment_task = EnrichmentTask()
             self.db_session.add(job)
             return job
 
+        if "description" in payload and payload["description"] != job.description:
+            # New text may succeed where the old one could not.
+            EnrichmentQueue(self.db_session).enqueue([job.id])
+
+        new_status = payload.get("status")
+        leaves_counted = job.status == COUNTED_STATUS != new_status
+        if new_status is not None and leaves_counted:
+            SkillStatsService(self.db_session).adjust_for_jobs([job.id], sign=-1)
+        enters_counted = new_status == COUNTED_STATUS != job.status
+
         for key, value in payload.items():
             if key == "url" and url is None:
                 continue
             setattr(job, key, value)
 
+        if enters_counted:
+            self.db_session.flush()
+            SkillStatsService(self.db_session).adjust_for_jobs([job.id], sign=1)
         return job
 
     def get_active_jobs(self, limit: int = 100) -> list[Job]:
+        """Active jobs as full ORM objects with skills loaded, for callers
+        that need the entities; list views use ``list_active_jobs``.
+        """
         return (
             self.db_session.query(Job)
-            .options(joinedload(Job.skills))
+            .options(selectinload(Job.skills))
             .filter(Job.status == "active")
             .order_by(Job.scraped_at.desc())
             .limit(limit)
             .all()
         )
 
+    def list_active_jobs(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        source_platform: str | None = None,
+        location_ids: Sequence[int] | None = None,
+    ) -> list[JobListRow]:
+        stmt = select(*JOB_LIST_COLUMNS).where(Job.status == "active")
+        if source_platform is not None:
+            stmt = stmt.where(Job.source_platform == source_platform)
+        if location_ids is not None:
+            stmt = stmt.where(Job.location_id.in_(location_ids))
+        stmt = (
+            stmt.order_by(Job.scraped_at.desc(), Job.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [JobListRow(*row) for row in self.db_session.execute(stmt)]
+
+    def find_jobs_by_skills(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = (),
+        limit: int = 100,
+        offset: int = 0,
+        status: str | None = "active",
+        location_ids: Sequence[int] | None = None,
+    ) -> list[JobListRow]:
+        """Jobs linked to every skill in ``all_of``, at least one of ``any_of``
+        and none of ``none_of``. Skill names are matched case-insensitively
+        and aliases resolve to their canonical skill, as when skills are saved.
+        """
+        aliases = get_alias_map(self.db_session)
+        all_names = _normalize_skill_names(all_of, aliases)
+        any_names = _normalize_skill_names(any_of, aliases)
+        none_names = _normalize_skill_names(none_of, aliases)
+
+        def jobs_with(names: list[str]):
+            return (
+                select(JobSkill.job_id)
+                .join(Skill, Skill.id == JobSkill.skill_id)
+                .where(Skill.skill_name.in_(names))
+            )
+
+        stmt = select(*JOB_LIST_COLUMNS)
+        if status is not None:
+            stmt = stmt.where(Job.status == status)
+        if all_names:
+            stmt = stmt.where(
+                Job.id.in_(
+                    jobs_with(all_names)
+                    .group_by(JobSkill.job_id)
+                    .having(func.count() == len(all_names))
+                )
+            )
+        if any_names:
+            stmt = stmt.where(Job.id.in_(jobs_with(any_names)))
+        if none_names:
+            stmt = stmt.where(Job.id.not_in(jobs_with(none_names)))
+        if location_ids is not None:
+            stmt = stmt.where(Job.location_id.in_(location_ids))
+
+        stmt = (
+            stmt.order_by(Job.scraped_at.desc(), Job.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [JobListRow(*row) for row in self.db_session.execute(stmt)]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        cursor: SearchCursor | None = None,
+        status: str | None = "active",
+        location_ids: Sequence[int] | None = None,
+    ) -> JobSearchPage:
+        match = build_fts_query(query)
+        if not match:
+            return JobSearchPage(hits=[], next_cursor=None)
+
+        weights = ", ".join(str(weight) for weight in _SEARCH_WEIGHTS)
+        conditions = ["jobs_fts MATCH :match"]
+        params: dict[str, Any] = {"match": match, "limit": limit + 1}
+        if status is not None:
+            conditions.append("jobs.status = :status")
+            params["status"] = status
+        if location_ids is not None:
+            conditions.append("jobs.location_id IN :location_ids")
+            params["location_ids"] = list(location_ids)
+        keyset = ""
+        if cursor is not None:
+            # Filters the labelled score; the subquery's LIMIT -1 stops SQLite
+            # flattening it, which would copy bm25() into these terms.
+            keyset = (
+                "WHERE score > :cursor_rank "
+                "OR (score = :cursor_rank AND id > :cursor_id)"
+            )
+            params["cursor_rank"] = cursor.rank
+            params["cursor_id"] = cursor.job_id
+
+        stmt = text(
+            f"""
+            SELECT id, title, company, location, posted_date, source_platform,
+                   snippet, score AS rank
+            FROM (
+                SELECT jobs.id, jobs.title, jobs.company, jobs.location,
+                       jobs.posted_date, jobs.source_platform,
+                       snippet(jobs_fts, -1, '**', '**', '…', 16) AS snippet,
+                       bm25(jobs_fts, {weights}) AS score
+                FROM jobs_fts
+                JOIN jobs ON jobs.id = jobs_fts.rowid
+                WHERE {" AND ".join(conditions)}
+                LIMIT -1
+            )
+            {keyset}
+            ORDER BY score, id
+            LIMIT :limit
+            """
+        ).columns(posted_date=Job.__table__.c.posted_date.type)
+        if location_ids is not None:
+            stmt = stmt.bindparams(bindparam("location_ids", expanding=True))
+
+        try:
+            rows = self.db_session.execute(stmt, params).all()
+        except Exception:
+            logger.exception("Failed to search jobs: %s", query)
+            return JobSearchPage(hits=[], next_cursor=None)
+
+        hits = [JobSearchHit(*row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and hits:
+            last = hits[-1]
+            next_cursor = SearchCursor(rank=last.rank, job_id=last.id)
+        return JobSearchPage(hits=hits, next_cursor=next_cursor)
+
+    def rank_jobs(
+        self,
+        query_vector: Sequence[float],
+        k: int = 20,
+        status: str | None = "active",
+        store: JobVectorStore | None = None,
+    ) -> list[RankedJob]:
+        """The ``k`` embedded jobs most similar (cosine) to ``query_vector``,
+        best first.
+        """
+        if store is None:
+            store = get_job_vector_store()
+        fetch = k
+        while True:
+            hits = store.search(query_vector, fetch)
+            scores = dict(hits)
+            stmt = select(*JOB_LIST_COLUMNS).where(Job.id.in_(scores))
+            if status is not None:
+                stmt = stmt.where(Job.status == status)
+            rows = self.db_session.execute(stmt).all()
+            # Jobs filtered out by status leave gaps; widen the search.
+            if len(rows) >= k or len(hits) < fetch:
+                break
+            fetch *= 4
+
+        ranked = [RankedJob(*row, score=scores[row.id]) for row in rows]
+        # Ties go to the newest job, as in ``rank_jobs_by_relevance``.
+        ranked.sort(key=lambda job: (-job.score, -job.id))
+        return ranked[:k]
+
+    def rank_jobs_by_relevance(
+        self,
+        profile: str = "",
+        skills: Sequence[str] = (),
+        k: int = 20,
+        job_ids: Sequence[int] | None = None,
+        index: RelevanceIndex | None = None,
+    ) -> list[RelevantJob]:
+        """The ``k`` active jobs scoring highest (BM25) against a free-text
+        profile and a skill list, best first, with each query term's share
+        of the score. ``job_ids`` limits the candidates.
+        """
+        if index is None:
+            index = get_relevance_index()
+        index.refresh(self.db_session)
+        matches = {
+            match.job_id: match
+            for match in index.score(profile, skills, k=k, job_ids=job_ids)
+        }
+        rows = self.db_session.execute(
+            select(*JOB_LIST_COLUMNS).where(
+                Job.id.in_(matches), Job.status == "active"
+            )
+        )
+        relevant = [
+            RelevantJob(
+                *row,
+                score=matches[row.id].score,
+                contributions=matches[row.id].contributions,
+            )
+            for row in rows
+        ]
+        relevant.sort(key=lambda job: (-job.score, -job.id))
+        return relevant
+
     def process_new_jobs_with_ai(
-        self, skill_service: SkillService, limit: int = 100
+        self,
+        skill_service: SkillService,
+        limit: int = 100,
+        concurrency: int | None = None,
     ) -> int:
-        jobs = (
-            self.db_session.query(Job)
-            .filter(~Job.job_skills.any())
-            .order_by(Job.scraped_at.desc())
-            .limit(limit)
-            .all()
+        """Claim up to ``limit`` queued jobs and extract their skills.
+
+        The claim is committed before any LLM call, so other workers see the
+        lease and no write lock is held while the model runs. Jobs whose
+        skills were saved are marked done by the save itself; the rest go
+        back to the queue for a later retry. Nothing is claimed while the
+        LLM circuit breaker is open.
+        """
+        llm_client = skill_service.llm_client
+        if not llm_client.available():
+            logger.warning("LLM unavailable; skipping skill extraction")
+            return 0
+        queue = EnrichmentQueue(self.db_session)
+        job_ids = queue.claim(limit)
+        self.db_session.commit()
+        try:
+            if job_ids:
+                llm_client.warm_up()
+            skill_service.extract_and_save_many(job_ids, concurrency)
+        finally:
+            # Unsaved jobs go back to the queue even if extraction raised.
+            queue.release(job_ids, _release_error(llm_client))
+        return len(job_ids)
+
+
+class AsyncJobService:
+    """Async counterpart of the ``JobService`` ingest path.
+
+    Each call runs the synchronous service logic through
+    ``AsyncSession.run_sync``, so the SQL itself is awaited on the async
+    driver instead of blocking the event loop. With a ``writer``, mutations
+    are handed to the shared write coordinator and committed there.
+    """
+
+    def __init__(
+        self, db_session: AsyncSession, writer: WriteCoordinator | None = None
+    ) -> None:
+        self.db_session = db_session
+        self.writer = writer
+
+    async def upsert_job(self, job_data: dict[str, Any]) -> Job:
+        return await self._write(
+            lambda session: JobService(session).upsert_job(job_data)
         )
 
-        processed = 0
-        for job in jobs:
-            skill_service.extract_and_save_skills(job.id)
-            processed += 1
+    async def process_new_jobs_with_ai(
+        self,
+        skill_service: AsyncSkillService,
+        limit: int = 100,
+        concurrency: int | None = None,
+    ) -> int:
+        llm_client = skill_service.llm_client
+        if not llm_client.available():
+            logger.warning("LLM unavailable; skipping skill extraction")
+            return 0
+        # The lease is committed before the LLM work starts; the writer
+        # commits it itself.
+        job_ids = await self._write(
+            lambda session: EnrichmentQueue(session).claim(limit)
+        )
+        if self.writer is None:
+            await self.db_session.commit()
+        try:
+            if job_ids:
+                await asyncio.to_thread(llm_client.warm_up)
+            await skill_service.extract_and_save_many(job_ids, concurrency)
+        finally:
+            # Unsaved jobs go back to the queue even if extraction raised.
+            error = _release_error(llm_client)
+            await self._write(
+                lambda session: EnrichmentQueue(session).release(job_ids, error)
+            )
+        return len(job_ids)
 
-        return processed
+    async def _write(self, fn: Callable[[Session], T]) -> T:
+        if self.writer is not None:
+            return await self.writer.execute_async(fn)
+        return await self.db_session.run_sync(fn)
@@ -0,0 +1,268 @@
+"""Map free-text scraped locations onto the ``locations`` dimension.
+
+``parse_location`` is a pure, memoized parser, so each distinct scraped
+string is parsed once per process, and resolved ids go through a
+``CommittedIdCache`` shared by the whole process.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from sqlalchemy import ColumnElement, false, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.database.dialects import upsert_insert
+from src.database.id_cache import CommittedIdCache
+from src.database.models import Job, Location
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+_AU_REGIONS = {
+    "qld": "Queensland",
+    "queensland": "Queensland",
+    "nsw": "New South Wales",
+    "new south wales": "New South Wales",
+    "vic": "Victoria",
+    "victoria": "Victoria",
+    "wa": "Western Australia",
+    "western australia": "Western Australia",
+    "sa": "South Australia",
+    "south australia": "South Australia",
+    "tas": "Tasmania",
+    "tasmania": "Tasmania",
+    "act": "Australian Capital Territory",
+    "australian capital territory": "Australian Capital Territory",
+    "nt": "Northern Territory",
+    "northern territory": "Northern Territory",
+}
+
+_COUNTRIES = {
+    "australia": "Australia",
+    "au": "Australia",
+    "aus": "Australia",
+    "new zealand": "New Zealand",
+    "nz": "New Zealand",
+    "united states": "United States",
+    "united states of america": "United States",
+    "usa": "United States",
+    "us": "United States",
+    "united kingdom": "United Kingdom",
+    "uk": "United Kingdom",
+    "canada": "Canada",
+    "india": "India",
+    "singapore": "Singapore",
+    "germany": "Germany",
+    "ireland": "Ireland",
+}
+
+# Lets a bare "Brisbane" land on the same row as "Brisbane, QLD, Australia".
+_AU_CITY_REGIONS = {
+    "brisbane": "Queensland",
+    "gold coast": "Queensland",
+    "sunshine coast": "Queensland",
+    "townsville": "Queensland",
+    "cairns": "Queensland",
+    "sydney": "New South Wales",
+    "newcastle": "New South Wales",
+    "wollongong": "New South Wales",
+    "melbourne": "Victoria",
+    "geelong": "Victoria",
+    "perth": "Western Australia",
+    "adelaide": "South Australia",
+    "hobart": "Tasmania",
+    "canberra": "Australian Capital Territory",
+    "darwin": "Northern Territory",
+}
+
+# Abbreviations that are also common outside Australia (Washington, ...).
+_AMBIGUOUS_REGIONS = {"wa", "sa"}
+
+_REMOTE_RE = re.compile(r"\b(remote|work from home|wfh)\b")
+_NOISE_RE = re.compile(
+    r"\([^)]*\)|\b(remote|hybrid|on-?site|work from home|wfh|greater|"
+    r"metropolitan|metro|area)\b|\d+"
+)
+_SEPARATOR_RE = re.compile(r"\s*(?:,|/|\||\s-\s|\s–\s)\s*")
+
+
+class ParsedLocation(NamedTuple):
+    city: str
+    region: str
+    country: str
+    is_remote: bool
+
+
+@lru_cache(maxsize=4096)
+def parse_location(raw: str | None) -> ParsedLocation | None:
+    """Split a scraped location into city, region, country and remote flag."""
+    if raw is None:
+        return None
+    lowered = " ".join(raw.lower().split())
+    if not lowered:
+        return None
+
+    is_remote = bool(_REMOTE_RE.search(lowered))
+    parts = []
+    for part in _SEPARATOR_RE.split(_NOISE_RE.sub(" ", lowered)):
+        part = " ".join(part.split())
+        if not part:
+            continue
+        # "brisbane qld" -> "brisbane", "qld"
+        head, _, tail = part.rpartition(" ")
+        known = part in _AU_REGIONS or part in _COUNTRIES
+        if head and not known and (tail in _AU_REGIONS or tail in _COUNTRIES):
+            parts.extend((head, tail))
+        else:
+            parts.append(part)
+
+    country = next((_COUNTRIES[part] for part in parts if part in _COUNTRIES), "")
+    city = next(
+        (
+            part
+            for part in parts
+            if part not in _COUNTRIES and part not in _AU_REGIONS
+        ),
+        "",
+    )
+    in_australia = country == "Australia" or (
+        not country and city in _AU_CITY_REGIONS
+    )
+    region = ""
+    for part in parts:
+        if part in _COUNTRIES or part == city:
+            continue
+        if not region and part in _AU_REGIONS and (
+            in_australia or (not country and part not in _AMBIGUOUS_REGIONS)
+        ):
+            region = _AU_REGIONS[part]
+        elif not region:
+            region = part.upper() if len(part) <= 3 else part.title()
+
+    if not region and country in ("", "Australia"):
+        region = _AU_CITY_REGIONS.get(city, "")
+    if region in _AU_REGIONS.values():
+        country = "Australia"
+
+    return ParsedLocation(city.title(), region, country, is_remote)
+
+
+_location_ids: CommittedIdCache[ParsedLocation] = CommittedIdCache("locations")
+
+
+def clear_location_cache() -> None:
+    _location_ids.clear()
+
+
+class LocationService:
+    def __init__(self, db_session: Session) -> None:
+        self.db_session = db_session
+
+    def resolve_id(self, raw: str | None) -> int | None:
+        """Id of the ``locations`` row for ``raw``, creating it if needed."""
+        parsed = parse_location(raw)
+        if parsed is None:
+            return None
+
+        location_id = _location_ids.get(self.db_session, parsed)
+        if location_id is None:
+            location_id = self._get_or_create(parsed)
+            if location_id is not None:
+                _location_ids.stage(self.db_session, parsed, location_id)
+        return location_id
+
+    def matching_ids(self, query: str) -> list[int]:
+        """Ids of every location within ``query`` (e.g. all of "Australia")."""
+        parsed = parse_location(query)
+        if parsed is None:
+            return []
+
+        conditions: list[ColumnElement[bool]] = [
+            column == value
+            for column, value in (
+                (Location.city, parsed.city),
+                (Location.region, parsed.region),
+                (Location.country, parsed.country),
+            )
+            if value
+        ]
+        if parsed.is_remote:
+            conditions.append(Location.is_remote)
+        if not conditions:
+            return []
+        return list(self.db_session.scalars(select(Location.id).where(*conditions)))
+
+    def outside(self, query: str) -> ColumnElement[bool]:
+        """Jobs not located within ``query``, including jobs with no location.
+
+        Run ``backfill_missing`` first: a job whose text was never resolved
+        has no ``location_id`` and would count as outside. A query matching
+        no known location selects nothing, so a typo cannot empty the table.
+        """
+        if parse_location(query) is None:
+            return false()
+        keep_ids = self.matching_ids(query)
+        if not keep_ids:
+            logger.warning("No known location matches %r; selecting no jobs", query)
+            return false()
+        return or_(Job.location_id.is_(None), Job.location_id.not_in(keep_ids))
+
+    def backfill_missing(self, batch_size: int = 500) -> int:
+        """Resolve ``location_id`` for jobs stored before it was assigned."""
+        updated = 0
+        while True:
+            raws = list(
+                self.db_session.scalars(
+                    select(Job.location)
+                    .where(Job.location_id.is_(None), Job.location.is_not(None))
+                    .distinct()
+                    .limit(batch_size)
+                )
+            )
+            batch_updated = 0
+            for raw in raws:
+                location_id = self.resolve_id(raw)
+                if location_id is None:
+                    continue
+                result = self.db_session.execute(
+                    update(Job)
+                    .where(Job.location == raw, Job.location_id.is_(None))
+                    .values(location_id=location_id)
+                    .execution_options(synchronize_session=False)
+                )
+                batch_updated += result.rowcount or 0
+            updated += batch_updated
+            if not batch_updated or len(raws) < batch_size:
+                break
+
+        if updated:
+            logger.info("Backfilled location_id for %s jobs", updated)
+        return updated
+
+    def _get_or_create(self, parsed: ParsedLocation) -> int | None:
+        existing = self._find(parsed)
+        if existing is not None:
+            return existing
+
+        # DO NOTHING covers another writer inserting it since the lookup.
+        self.db_session.execute(
+            upsert_insert(self.db_session, Location)
+            .values(**parsed._asdict())
+            .on_conflict_do_nothing(
+                index_elements=["city", "region", "country", "is_remote"]
+            )
+        )
+        return self._find(parsed)
+
+    def _find(self, parsed: ParsedLocation) -> int | None:
+        return self.db_session.scalar(
+            select(Location.id).where(
+                Location.city == parsed.city,
+                Location.region == parsed.region,
+                Location.country == parsed.country,
+                Location.is_remote == parsed.is_remote,
+            )
+        )
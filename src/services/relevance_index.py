@@ -0,0 +1,482 @@
+"""Sparse BM25 matrix of the active jobs for cheap relevance ranking.
+
+Each active job is one row of term frequencies over words from its title
+and cleaned description plus one ``skill:<name>`` term per extracted skill.
+The matrix is kept in CSR form (``indptr``/``terms``/``tf`` numpy arrays,
+appended to as jobs arrive) and saved with ``numpy.savez`` to
+``RELEVANCE_INDEX_PATH``. From it ``_derive`` builds the BM25-normalised
+weights and a term-major copy (postings), so scoring a query is one sparse
+matrix-vector product over the postings of the query terms followed by
+``argpartition`` for the top ``k``.
+
+``refresh`` first compares a cheap probe (active job count, newest active
+id, skill link count, ``job_content`` version) with the one it last saw and
+returns at once when nothing moved. Otherwise it reads the id, has-skills
+flag and ``JobRevision`` of every active job in one query and catches up:
+rows of jobs that are no longer active are dropped, new jobs are appended
+and jobs whose skills were extracted or whose title or description was
+edited since they were indexed are re-indexed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import zipfile
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session
+
+from src.ai.preprocessing import clean_description
+from src.config import settings
+from src.database.models import (
+    JOB_CONTENT_CACHE,
+    CacheVersion,
+    Job,
+    JobContent,
+    JobRevision,
+    JobSkill,
+    Skill,
+)
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+SKILL_PREFIX = "skill:"
+
+# Bump when tokenisation or the saved arrays change; older files are rebuilt.
+_FORMAT_VERSION = 2
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*")
+_LOAD_CHUNK = 500
+
+
+class RelevanceMatch(NamedTuple):
+    job_id: int
+    score: float
+    # Query term -> its share of ``score``, largest first.
+    contributions: dict[str, float]
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _WORD_RE.findall(text.lower()) if text else []
+
+
+def query_terms(text: str = "", skills: Iterable[str] = ()) -> list[str]:
+    """Distinct index terms for a free-text profile and a skill list.
+
+    Profile words also match extracted skills of the same name; skills also
+    match their words in descriptions of jobs not enriched yet.
+    """
+    terms: list[str] = []
+    for word in tokenize(text):
+        terms += (word, SKILL_PREFIX + word)
+    for skill in skills:
+        name = skill.strip().lower()
+        if name:
+            terms += (*tokenize(name), SKILL_PREFIX + name)
+    return list(dict.fromkeys(terms))
+
+
+class RelevanceIndex:
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        k1: float | None = None,
+        b: float | None = None,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.k1 = settings.bm25_k1 if k1 is None else k1
+        self.b = settings.bm25_b if b is None else b
+        self._lock = threading.RLock()
+        self.clear()
+        if self.path is not None and self.path.exists():
+            self._load_file()
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, job_id: int) -> bool:
+        return bool(self._rows_of([job_id]).size)
+
+    def job_ids(self) -> set[int]:
+        with self._lock:
+            return set(self._doc_ids.tolist())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._probe: tuple[int, int, int, int] | None = None
+            self._vocabulary: list[str] = []
+            self._term_ids: dict[str, int] = {}
+            self._doc_ids = np.zeros(0, dtype=np.int64)
+            self._has_skills = np.zeros(0, dtype=bool)
+            self._revisions = np.zeros(0, dtype=np.int64)
+            self._lengths = np.zeros(0, dtype=np.float32)
+            self._indptr = np.zeros(1, dtype=np.int64)
+            self._terms = np.zeros(0, dtype=np.int32)
+            self._tf = np.zeros(0, dtype=np.float32)
+            self._post_order = np.zeros(0, dtype=np.int64)
+            self._derive()
+
+    def refresh(self, db_session: Session) -> None:
+        """Bring the index in line with the active jobs and save it."""
+        with self._lock:
+            probe = self._read_probe(db_session)
+            if probe == self._probe:
+                return
+            rows = db_session.execute(
+                select(
+                    Job.id,
+                    exists().where(JobSkill.job_id == Job.id),
+                    func.coalesce(JobRevision.revision, 0),
+                )
+                .outerjoin(JobRevision, JobRevision.job_id == Job.id)
+                .where(Job.status == "active")
+            )
+            active = {
+                job_id: (bool(has_skills), revision)
+                for job_id, has_skills, revision in rows
+            }
+            indexed = {
+                job_id: (has_skills, revision)
+                for job_id, has_skills, revision in zip(
+                    self._doc_ids.tolist(),
+                    self._has_skills.tolist(),
+                    self._revisions.tolist(),
+                    strict=True,
+                )
+            }
+            stale = [
+                job_id
+                for job_id, (has_skills, revision) in indexed.items()
+                if job_id not in active
+                or (active[job_id][0] and not has_skills)
+                or active[job_id][1] != revision
+            ]
+            dropped = [job_id for job_id in stale if job_id not in active]
+            new = [job_id for job_id in active if job_id not in indexed]
+            new += [job_id for job_id in stale if job_id in active]
+            self._probe = probe
+            if not stale and not new:
+                return
+
+            self.remove_jobs(stale, derive=False)
+            for start in range(0, len(new), _LOAD_CHUNK):
+                self._add_documents(
+                    self._load_documents(db_session, new[start : start + _LOAD_CHUNK])
+                )
+            self._derive()
+            logger.info(
+                "Relevance index: %s jobs indexed, %s dropped, %s total",
+                len(new),
+                len(dropped),
+                len(self),
+            )
+            self.save()
+
+    def add_job(
+        self,
+        job_id: int,
+        title: str | None,
+        description: str | None,
+        skill_names: Sequence[str] = (),
+        revision: int = 0,
+    ) -> None:
+        """Index (or re-index) a single job at its ``JobRevision``."""
+        with self._lock:
+            self.remove_jobs([job_id], derive=False)
+            self._add_documents([(job_id, title, description, skill_names, revision)])
+            self._derive()
+
+    def remove_jobs(self, job_ids: Iterable[int], derive: bool = True) -> int:
+        with self._lock:
+            rows = self._rows_of(job_ids)
+            if not rows.size:
+                return 0
+            keep = np.ones(len(self._doc_ids), dtype=bool)
+            keep[rows] = False
+            row_lengths = np.diff(self._indptr)
+            keep_nnz = np.repeat(keep, row_lengths)
+            self._doc_ids = self._doc_ids[keep]
+            self._has_skills = self._has_skills[keep]
+            self._revisions = self._revisions[keep]
+            self._lengths = self._lengths[keep]
+            self._indptr = np.concatenate(([0], np.cumsum(row_lengths[keep])))
+            self._terms = self._terms[keep_nnz]
+            self._tf = self._tf[keep_nnz]
+            # Surviving entries keep their relative order; renumber them.
+            post_order = self._post_order[keep_nnz[self._post_order]]
+            self._post_order = (np.cumsum(keep_nnz) - 1)[post_order]
+            if derive:
+                self._derive()
+            return int(rows.size)
+
+    def score(
+        self,
+        text: str = "",
+        skills: Sequence[str] = (),
+        k: int = 20,
+        job_ids: Sequence[int] | None = None,
+    ) -> list[RelevanceMatch]:
+        """Top ``k`` jobs by BM25 score against ``text`` and ``skills``, best
+        first; ``job_ids`` limits the candidates. Jobs matching no query
+        term are left out.
+        """
+        with self._lock:
+            term_ids = np.fromiter(
+                (
+                    self._term_ids[term]
+                    for term in query_terms(text, skills)
+                    if term in self._term_ids
+                ),
+                dtype=np.int64,
+            )
+            if not term_ids.size or k <= 0:
+                return []
+
+            # Gather the postings of every query term: the non-zero entries
+            # of the matrix-vector product.
+            starts = self._post_ptr[term_ids]
+            counts = self._post_ptr[term_ids + 1] - starts
+            offsets = np.cumsum(counts) - counts
+            gather = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+            rows = self._post_rows[gather]
+            values = self._post_weights[gather] * np.repeat(self._idf[term_ids], counts)
+            scores = np.bincount(rows, weights=values, minlength=len(self._doc_ids))
+            if job_ids is not None:
+                allowed = np.zeros(len(scores), dtype=bool)
+                allowed[self._rows_of(job_ids)] = True
+                scores[~allowed] = 0
+
+            top = np.flatnonzero(scores > 0)
+            if top.size > k:
+                top = top[np.argpartition(-scores[top], k - 1)[:k]]
+            # Best score first; ties go to the newest job.
+            top = top[np.lexsort((-self._doc_ids[top], -scores[top]))]
+
+            selected = np.isin(rows, top)
+            contributions: dict[int, dict[str, float]] = {}
+            for row, term_id, value in zip(
+                rows[selected].tolist(),
+                np.repeat(term_ids, counts)[selected].tolist(),
+                values[selected].tolist(),
+            ):
+                contributions.setdefault(row, {})[self._vocabulary[term_id]] = value
+            return [
+                RelevanceMatch(
+                    job_id=int(self._doc_ids[row]),
+                    score=float(scores[row]),
+                    contributions=dict(
+                        sorted(
+                            contributions[row].items(),
+                            key=lambda item: (-item[1], item[0]),
+                        )
+                    ),
+                )
+                for row in top.tolist()
+            ]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(partial, "wb") as handle:
+                np.savez(
+                    handle,
+                    version=np.array(_FORMAT_VERSION),
+                    vocabulary=np.array(self._vocabulary, dtype=np.str_),
+                    doc_ids=self._doc_ids,
+                    has_skills=self._has_skills,
+                    revisions=self._revisions,
+                    lengths=self._lengths,
+                    indptr=self._indptr,
+                    terms=self._terms,
+                    tf=self._tf,
+                )
+            os.replace(partial, self.path)
+
+    def _load_file(self) -> None:
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if int(data["version"]) != _FORMAT_VERSION:
+                    logger.info("Relevance index format changed, rebuilding")
+                    return
+                self._vocabulary = data["vocabulary"].tolist()
+                self._doc_ids = data["doc_ids"]
+                self._has_skills = data["has_skills"]
+                self._revisions = data["revisions"]
+                self._lengths = data["lengths"]
+                self._indptr = data["indptr"]
+                self._terms = data["terms"]
+                self._tf = data["tf"]
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            logger.warning("Unreadable relevance index at %s, rebuilding", self.path)
+            self.clear()
+            return
+        self._term_ids = {term: index for index, term in enumerate(self._vocabulary)}
+        self._post_order = np.argsort(self._terms, kind="stable")
+        self._derive()
+
+    @staticmethod
+    def _read_probe(db_session: Session) -> tuple[int, int, int, int]:
+        jobs, max_job_id = db_session.execute(
+            select(func.count(), func.coalesce(func.max(Job.id), 0)).where(
+                Job.status == "active"
+            )
+        ).one()
+        # The job_content version moves on every title or description edit,
+        # which no count sees.
+        content_version = (
+            select(CacheVersion.version)
+            .where(CacheVersion.name == JOB_CONTENT_CACHE)
+            .scalar_subquery()
+        )
+        links, content_version = db_session.execute(
+            select(func.count(), content_version).select_from(JobSkill)
+        ).one()
+        return int(jobs), int(max_job_id), int(links), int(content_version or 0)
+
+    def _rows_of(self, job_ids: Iterable[int]) -> np.ndarray:
+        wanted = np.fromiter(job_ids, dtype=np.int64)
+        if not wanted.size or not self._doc_ids.size:
+            return np.zeros(0, dtype=np.int64)
+        positions = np.searchsorted(self._doc_ids, wanted, sorter=self._id_order)
+        positions = np.minimum(positions, len(self._doc_ids) - 1)
+        rows = self._id_order[positions]
+        return np.unique(rows[self._doc_ids[rows] == wanted])
+
+    def _add_documents(
+        self,
+        documents: Iterable[tuple[int, str | None, str | None, Sequence[str], int]],
+    ) -> None:
+        doc_ids: list[int] = []
+        has_skills: list[bool] = []
+        revisions: list[int] = []
+        lengths: list[int] = []
+        row_lengths: list[int] = []
+        terms: list[int] = []
+        tf: list[int] = []
+        for job_id, title, description, skill_names, revision in documents:
+            counts = Counter(tokenize(title))
+            counts.update(tokenize(clean_description(description)))
+            counts.update(SKILL_PREFIX + name.strip().lower() for name in skill_names)
+            for term, count in counts.items():
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = self._term_ids[term] = len(self._vocabulary)
+                    self._vocabulary.append(term)
+                terms.append(term_id)
+                tf.append(count)
+            doc_ids.append(job_id)
+            has_skills.append(bool(skill_names))
+            revisions.append(revision)
+            lengths.append(counts.total())
+            row_lengths.append(len(counts))
+        if not doc_ids:
+            return
+        self._doc_ids = np.concatenate((self._doc_ids, doc_ids)).astype(np.int64)
+        self._has_skills = np.concatenate((self._has_skills, has_skills)).astype(bool)
+        self._revisions = np.concatenate((self._revisions, revisions)).astype(np.int64)
+        self._lengths = np.concatenate((self._lengths, lengths)).astype(np.float32)
+        self._indptr = np.concatenate(
+            (self._indptr, self._indptr[-1] + np.cumsum(row_lengths))
+        ).astype(np.int64)
+        self._append_postings(np.asarray(terms, dtype=np.int32))
+        self._terms = np.concatenate((self._terms, terms)).astype(np.int32)
+        self._tf = np.concatenate((self._tf, tf)).astype(np.float32)
+
+    def _append_postings(self, new_terms: np.ndarray) -> None:
+        """Merge entries appended to the matrix into ``_post_order`` (entry
+        indices grouped by term, rows ascending) without re-sorting it.
+        """
+        vocabulary = len(self._vocabulary)
+        old_df = np.bincount(self._terms, minlength=vocabulary)
+        old_ptr = np.concatenate(([0], np.cumsum(old_df)))
+        added_ptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(new_terms, minlength=vocabulary)))
+        )
+        order = np.empty(len(self._terms) + len(new_terms), dtype=np.int64)
+        # Old entries move right by the entries added to earlier terms...
+        old_terms = np.repeat(np.arange(vocabulary), old_df)
+        order[np.arange(len(self._terms)) + added_ptr[old_terms]] = self._post_order
+        # ...and new ones go after the old entries of their term.
+        by_term = np.argsort(new_terms, kind="stable")
+        sorted_terms = new_terms[by_term]
+        order[old_ptr[sorted_terms + 1] + np.arange(len(new_terms))] = (
+            len(self._terms) + by_term
+        )
+        self._post_order = order
+
+    def _derive(self) -> None:
+        """Recompute idf, BM25 weights, postings and the id lookup."""
+        docs = len(self._doc_ids)
+        df = np.bincount(self._terms, minlength=len(self._vocabulary))
+        self._idf = np.log1p((docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        row_of_nnz = np.repeat(np.arange(docs), np.diff(self._indptr))
+        average_length = float(self._lengths.mean()) if docs else 1.0
+        length_norm = self.k1 * (
+            1 - self.b + self.b * self._lengths / max(average_length, 1.0)
+        )
+        weights = (
+            self._tf * (self.k1 + 1) / (self._tf + length_norm[row_of_nnz])
+        ).astype(np.float32)
+        self._post_rows = row_of_nnz[self._post_order]
+        self._post_weights = weights[self._post_order]
+        self._post_ptr = np.concatenate(([0], np.cumsum(df))).astype(np.int64)
+        self._id_order = np.argsort(self._doc_ids, kind="stable")
+
+    @staticmethod
+    def _load_documents(
+        db_session: Session, job_ids: Sequence[int]
+    ) -> list[tuple[int, str | None, str | None, list[str], int]]:
+        skills: dict[int, list[str]] = {}
+        for job_id, skill_name in db_session.execute(
+            select(JobSkill.job_id, Skill.skill_name)
+            .join(Skill, Skill.id == JobSkill.skill_id)
+            .where(JobSkill.job_id.in_(job_ids))
+        ):
+            skills.setdefault(job_id, []).append(skill_name)
+        rows = db_session.execute(
+            select(
+                Job.id, Job.title, JobContent, func.coalesce(JobRevision.revision, 0)
+            )
+            .outerjoin(JobContent, JobContent.job_id == Job.id)
+            .outerjoin(JobRevision, JobRevision.job_id == Job.id)
+            .where(Job.id.in_(job_ids))
+        )
+        return [
+            (
+                job_id,
+                title,
+                content.description if content else None,
+                skills.get(job_id, []),
+                revision,
+            )
+            for job_id, title, content, revision in rows
+        ]
+
+
+def refresh_relevance_index(session_factory: Callable[[], Session]) -> None:
+    """Entry point for the scraper run: index the jobs that arrived."""
+    with session_factory() as db_session:
+        get_relevance_index().refresh(db_session)
+
+
+_default_index: RelevanceIndex | None = None
+_default_lock = threading.Lock()
+
+
+def get_relevance_index() -> RelevanceIndex:
+    """Process-wide index at ``RELEVANCE_INDEX_PATH``."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = RelevanceIndex(settings.relevance_index_path)
+        return _default_index
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import NamedTuple
+
+from sqlalchemy import ColumnElement, Table, and_, create_engine, not_, or_, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.config import settings
+from src.database.models import (
+    Application,
+    Job,
+    JobContent,
+    JobSkill,
+    Location,
+    Skill,
+    SkillCategory,
+)
+from src.database.timestamps import utc_now
+from src.logger import get_logger
+from src.services.job_service import JobService
+from src.services.location_service import LocationService
+
+logger = get_logger(__name__)
+
+ARCHIVE_SCHEMA = "archive"
+
+# Parents before children, so archived rows always satisfy their foreign keys.
+_ARCHIVE_TABLES: tuple[Table, ...] = (
+    Location.__table__,
+    Job.__table__,
+    JobContent.__table__,
+    SkillCategory.__table__,
+    Skill.__table__,
+    JobSkill.__table__,
+    Application.__table__,
+)
+
+# Shared reference rows may already be archived by an earlier chunk and are
+# kept. Job-owned rows replace whatever the archive holds under the same id
+# (a job retired before ids stopped being reused), children first.
+_SHARED_TABLES = frozenset({"locations", "skill_categories", "skills"})
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which jobs to retire. A job matching any enabled rule is selected."""
+
+    max_age_days: int | None = None
+    drop_past_deadline: bool = False
+    statuses: tuple[str, ...] = field(default_factory=tuple)
+    keep_location: str | None = None
+    protect_applications: bool = True
+
+    @classmethod
+    def from_settings(cls) -> RetentionPolicy:
+        statuses = tuple(
+            status.strip()
+            for status in settings.retention_statuses.split(",")
+            if status.strip()
+        )
+        return cls(
+            max_age_days=settings.retention_max_age_days,
+            drop_past_deadline=settings.retention_drop_past_deadline,
+            statuses=statuses,
+            keep_location=settings.retention_keep_location or None,
+        )
+
+    def condition(
+        self,
+        now: datetime | None = None,
+        locations: LocationService | None = None,
+    ) -> ColumnElement[bool] | None:
+        """Selection predicate; ``locations`` turns ``keep_location`` into an
+        indexed ``location_id`` check instead of a substring scan.
+        """
+        now = now or utc_now()
+        rules: list[ColumnElement[bool]] = []
+        if self.max_age_days is not None:
+            rules.append(Job.scraped_at < now - timedelta(days=self.max_age_days))
+        if self.drop_past_deadline:
+            rules.append(and_(Job.deadline.is_not(None), Job.deadline < now.date()))
+        if self.statuses:
+            rules.append(Job.status.in_(self.statuses))
+        if self.keep_location and locations is not None:
+            rules.append(locations.outside(self.keep_location))
+        elif self.keep_location:
+            rules.append(
+                or_(
+                    Job.location.is_(None),
+                    not_(Job.location.contains(self.keep_location)),
+                )
+            )
+        if not rules:
+            return None
+
+        selected = or_(*rules)
+        if self.protect_applications:
+            selected = and_(selected, ~Job.applications.any())
+        return selected
+
+
+class RetentionResult(NamedTuple):
+    deleted: int
+    archived: int
+    chunks: int
+
+
+class RetentionService:
+    """Retire jobs in small committed chunks, optionally copying them first.
+
+    Each chunk is its own short transaction, so the write lock is released
+    between chunks and concurrent writers are never stalled for long. With
+    ``archive_path`` set, the archive SQLite file is attached to the live
+    connection and each chunk is copied and deleted in the same transaction.
+    A failing chunk is rolled back and its error re-raised; earlier chunks
+    stay committed.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        chunk_size: int | None = None,
+        archive_path: str | None = None,
+    ) -> None:
+        self.db_session = db_session
+        self.chunk_size = chunk_size or settings.retention_chunk_size
+        self.archive_path = archive_path
+        self.job_service = JobService(db_session)
+
+    def run(
+        self,
+        policy: RetentionPolicy,
+        max_chunks: int | None = None,
+        now: datetime | None = None,
+    ) -> RetentionResult:
+        locations = None
+        if policy.keep_location:
+            locations = LocationService(self.db_session)
+            locations.backfill_missing()
+        condition = policy.condition(now, locations)
+        if condition is None:
+            logger.info("Retention policy has no rules enabled; nothing to do")
+            return RetentionResult(deleted=0, archived=0, chunks=0)
+
+        deleted = archived = chunks = 0
+        try:
+            if self.archive_path:
+                self._prepare_archive()
+            while max_chunks is None or chunks < max_chunks:
+                job_ids = self.job_service.select_job_ids(condition, self.chunk_size)
+                if not job_ids:
+                    break
+                if self.archive_path:
+                    self._attach_archive()
+                    archived += self._copy_to_archive(job_ids)
+                deleted += self.job_service.delete_jobs(job_ids)
+                self.db_session.commit()
+                chunks += 1
+        except Exception:
+            self.db_session.rollback()
+            logger.exception("Retention run failed after %s chunks", chunks)
+            raise
+        finally:
+            if self.archive_path:
+                self._detach_archive()
+
+        logger.info(
+            "Retention run complete: %s deleted, %s archived in %s chunks",
+            deleted,
+            archived,
+            chunks,
+        )
+        return RetentionResult(deleted=deleted, archived=archived, chunks=chunks)
+
+    def _prepare_archive(self) -> None:
+        Path(self.archive_path).parent.mkdir(parents=True, exist_ok=True)
+        archive_engine = create_engine(f"sqlite:///{self.archive_path}")
+        try:
+            # Plain DDL rather than create_all, which would also fire the
+            # jobs_fts table and triggers attached to the live schema.
+            with archive_engine.begin() as connection:
+                for table in _ARCHIVE_TABLES:
+                    connection.execute(CreateTable(table, if_not_exists=True))
+                    for index in table.indexes:
+                        connection.execute(CreateIndex(index, if_not_exists=True))
+        finally:
+            archive_engine.dispose()
+
+    def _is_attached(self) -> bool:
+        rows = self.db_session.execute(text("PRAGMA database_list")).all()
+        return any(row[1] == ARCHIVE_SCHEMA for row in rows)
+
+    def _attach_archive(self) -> None:
+        if self._is_attached():
+            return
+        self.db_session.execute(
+            text(f"ATTACH DATABASE :path AS {ARCHIVE_SCHEMA}"),
+            {"path": self.archive_path},
+        )
+
+    def _detach_archive(self) -> None:
+        try:
+            if self._is_attached():
+                self.db_session.execute(text(f"DETACH DATABASE {ARCHIVE_SCHEMA}"))
+        except Exception:
+            logger.warning("Could not detach retention archive database")
+
+    def _copy_to_archive(self, job_ids: list[int]) -> int:
+        id_params = {f"id_{index}": job_id for index, job_id in enumerate(job_ids)}
+        placeholders = ", ".join(f":{name}" for name in id_params)
+        filters = {
+            "locations": (
+                "WHERE id IN (SELECT location_id FROM main.jobs "
+                f"WHERE id IN ({placeholders}))"
+            ),
+            "jobs": f"WHERE id IN ({placeholders})",
+            # Small dimension: copy it whole, parents before children.
+            "skill_categories": (
+                "ORDER BY (SELECT max(depth) FROM main.skill_category_closure "
+                "WHERE descendant_id = skill_categories.id)"
+            ),
+            "skills": (
+                "WHERE id IN (SELECT skill_id FROM main.job_skills "
+                f"WHERE job_id IN ({placeholders}))"
+            ),
+        }
+
+        for table in reversed(_ARCHIVE_TABLES):
+            if table.name in _SHARED_TABLES:
+                continue
+            key = "id" if table.name == "jobs" else "job_id"
+            self.db_session.execute(
+                text(
+                    f"DELETE FROM {ARCHIVE_SCHEMA}.{table.name} "
+                    f"WHERE {key} IN ({placeholders})"
+                ),
+                id_params,
+            )
+
+        copied_jobs = 0
+        for table in _ARCHIVE_TABLES:
+            columns = ", ".join(column.name for column in table.columns)
+            clause = filters.get(table.name, f"WHERE job_id IN ({placeholders})")
+            shared = table.name in _SHARED_TABLES
+            verb = "INSERT OR IGNORE" if shared else "INSERT OR REPLACE"
+            result = self.db_session.execute(
+                text(
+                    f"{verb} INTO {ARCHIVE_SCHEMA}.{table.name} ({columns}) "
+                    f"SELECT {columns} FROM main.{table.name} {clause}"
+                ),
+                id_params,
+            )
+            if table.name == "jobs":
+                copied_jobs = result.rowcount or 0
+
+        if copied_jobs != len(job_ids):
+            raise RuntimeError(
+                f"Archived {copied_jobs} of {len(job_ids)} jobs; refusing to delete"
+            )
+        return copied_jobs
+
+
+def run_scheduled_retention(
+    session_factory: Callable[[], Session],
+) -> RetentionResult:
+    """Entry point for the scheduler: apply the configured policy once."""
+    with session_factory() as db_session:
+        service = RetentionService(
+            db_session,
+            archive_path=settings.retention_archive_path,
+        )
+        return service.run(RetentionPolicy.from_settings())
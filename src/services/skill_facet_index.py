@@ -0,0 +1,284 @@
+"""In-memory skill bitmaps for interactive facet filtering.
+
+Each indexed job gets a dense bit position, assigned in id order, and each
+skill maps to a Python ``int`` used as a bitset with that bit set for every
+counted job that needs the skill, so "all of / any of / none of" filters are
+a handful of big-int ANDs and ORs and facet counts are ``bit_count()``
+calls. ``refresh`` first compares the ``cache_versions`` counters that
+triggers bump on every jobs / job_skills write and the taxonomy version;
+only when they moved does it compare a database fingerprint (link and job
+counts, newest job id) with the index. It then tries to catch up by loading
+only jobs newer than the last one indexed plus indexed jobs that had no
+skills yet (enrichment lands after the scrape); anything else (archives,
+deletes, taxonomy syncs) falls back to a full rebuild.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from src.database.models import JOB_SKILLS_CACHE, CacheVersion, Job, JobSkill, Skill
+from src.logger import get_logger
+from src.services.skill_stats_service import COUNTED_STATUS
+from src.services.skill_taxonomy import TAXONOMY_CACHE
+
+logger = get_logger(__name__)
+
+# Above this many skill-less jobs, catching up costs more than a rebuild.
+_MAX_PENDING_JOBS = 500
+
+
+class _Fingerprint(NamedTuple):
+    links: int
+    jobs: int
+    max_job_id: int
+    taxonomy_version: int
+
+
+def _bitset(positions: Sequence[int]) -> int:
+    """Bitset with the given bits set, built in one pass over a byte buffer."""
+    if not positions:
+        return 0
+    buffer = bytearray(max(positions) // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class SkillFacetIndex:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._skill_bits: dict[str, int] = {}
+        self._job_bits = 0
+        self._positions: dict[int, int] = {}
+        self._position_ids: list[int] = []
+        self._links = 0
+        self._max_job_id = 0
+        self._taxonomy_version = 0
+        self._write_version: int | None = None
+
+    def refresh(self, db_session: Session) -> None:
+        with self._lock:
+            # Read before the fingerprint: a write landing in between leaves
+            # the stored version behind, so the next refresh looks again.
+            write_version, taxonomy_version = self._database_versions(db_session)
+            if (
+                write_version is not None
+                and write_version == self._write_version
+                and taxonomy_version == self._taxonomy_version
+            ):
+                return
+            target = self._database_fingerprint(db_session, taxonomy_version)
+            if target == self._fingerprint():
+                self._write_version = write_version
+                return
+
+            # A taxonomy sync can rename or merge skills without changing
+            # any count, so only a rebuild picks it up.
+            if target.taxonomy_version == self._taxonomy_version:
+                pending = self.job_ids(self._job_bits & ~self._any_skill_bits())
+                if len(pending) <= _MAX_PENDING_JOBS:
+                    self._load(db_session, self._max_job_id, pending)
+            if target != self._fingerprint():
+                logger.debug("Skill facet index out of date, rebuilding")
+                self.clear()
+                self._load(db_session, newer_than=0)
+                self._taxonomy_version = target.taxonomy_version
+            self._write_version = write_version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._skill_bits = {}
+            self._job_bits = 0
+            self._positions = {}
+            self._position_ids = []
+            self._links = 0
+            self._max_job_id = 0
+            self._taxonomy_version = 0
+            self._write_version = None
+
+    def add_job(self, job_id: int, skill_names: Iterable[str] = ()) -> None:
+        with self._lock:
+            bit = 1 << self._position(job_id)
+            self._job_bits |= bit
+            self._max_job_id = max(self._max_job_id, job_id)
+            for name in skill_names:
+                name = name.strip().lower()
+                bits = self._skill_bits.get(name, 0)
+                if not bits & bit:
+                    self._skill_bits[name] = bits | bit
+                    self._links += 1
+
+    def remove_jobs(self, job_ids: Iterable[int]) -> None:
+        with self._lock:
+            mask = 0
+            for job_id in job_ids:
+                position = self._positions.get(job_id)
+                if position is not None:
+                    mask |= 1 << position
+            self._job_bits &= ~mask
+            for name, bits in self._skill_bits.items():
+                removed = bits & mask
+                if removed:
+                    self._links -= removed.bit_count()
+                    self._skill_bits[name] = bits & ~mask
+
+    def match(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = (),
+    ) -> int:
+        """Bitset of the jobs passing the filters (see ``job_ids``)."""
+        all_of, any_of, none_of = (
+            [name.strip().lower() for name in names]
+            for names in (all_of, any_of, none_of)
+        )
+        with self._lock:
+            result = self._job_bits
+            for name in all_of:
+                result &= self._skill_bits.get(name, 0)
+            if any_of:
+                either = 0
+                for name in any_of:
+                    either |= self._skill_bits.get(name, 0)
+                result &= either
+            for name in none_of:
+                result &= ~self._skill_bits.get(name, 0)
+            return result
+
+    def facet_counts(self, matched: int, limit: int | None = None) -> dict[str, int]:
+        """Jobs per skill within ``matched``, largest first."""
+        with self._lock:
+            counts = [
+                (name, (bits & matched).bit_count())
+                for name, bits in self._skill_bits.items()
+            ]
+        counts = [(name, count) for name, count in counts if count]
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return dict(counts[:limit])
+
+    def job_ids(self, matched: int) -> list[int]:
+        """Decode a bitset into job ids, newest (highest id) first."""
+        digits = bin(matched)[2:]
+        top = len(digits) - 1
+        with self._lock:
+            job_ids = [
+                self._position_ids[top - index]
+                for index, digit in enumerate(digits)
+                if digit == "1"
+            ]
+        job_ids.sort(reverse=True)
+        return job_ids
+
+    def _position(self, job_id: int) -> int:
+        position = self._positions.get(job_id)
+        if position is None:
+            position = self._positions[job_id] = len(self._position_ids)
+            self._position_ids.append(job_id)
+        return position
+
+    def _any_skill_bits(self) -> int:
+        bits = 0
+        for skill_bits in self._skill_bits.values():
+            bits |= skill_bits
+        return bits
+
+    def _fingerprint(self) -> _Fingerprint:
+        return _Fingerprint(
+            self._links,
+            self._job_bits.bit_count(),
+            self._max_job_id,
+            self._taxonomy_version,
+        )
+
+    @staticmethod
+    def _database_versions(db_session: Session) -> tuple[int | None, int]:
+        """The jobs / job_skills write counter (``None`` where no trigger
+        maintains it, so every refresh checks the fingerprint) and the
+        taxonomy version.
+        """
+        versions = dict(
+            db_session.execute(
+                select(CacheVersion.name, CacheVersion.version).where(
+                    CacheVersion.name.in_((JOB_SKILLS_CACHE, TAXONOMY_CACHE))
+                )
+            ).all()
+        )
+        return versions.get(JOB_SKILLS_CACHE), versions.get(TAXONOMY_CACHE, 0)
+
+    @staticmethod
+    def _database_fingerprint(
+        db_session: Session, taxonomy_version: int
+    ) -> _Fingerprint:
+        links = db_session.scalar(
+            select(func.count())
+            .select_from(JobSkill)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(Job.status == COUNTED_STATUS)
+        )
+        jobs, max_job_id = db_session.execute(
+            select(func.count(), func.coalesce(func.max(Job.id), 0)).where(
+                Job.status == COUNTED_STATUS
+            )
+        ).one()
+        return _Fingerprint(
+            int(links),
+            int(jobs),
+            int(max_job_id),
+            taxonomy_version,
+        )
+
+    def _load(
+        self, db_session: Session, newer_than: int, pending: Sequence[int] = ()
+    ) -> None:
+        job_ids = list(
+            db_session.scalars(
+                select(Job.id)
+                .where(Job.status == COUNTED_STATUS, Job.id > newer_than)
+                .order_by(Job.id)
+            )
+        )
+        self._job_bits |= _bitset([self._position(job_id) for job_id in job_ids])
+        self._max_job_id = max(job_ids, default=self._max_job_id)
+
+        positions: defaultdict[str, list[int]] = defaultdict(list)
+        links = db_session.execute(
+            select(JobSkill.job_id, Skill.skill_name)
+            .join(Skill, Skill.id == JobSkill.skill_id)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(
+                Job.status == COUNTED_STATUS,
+                or_(Job.id > newer_than, Job.id.in_(pending)),
+            )
+        )
+        for job_id, skill_name in links:
+            # Skip links of a job committed after the job query ran; the
+            # next refresh picks it up.
+            position = self._positions.get(job_id)
+            if position is not None:
+                positions[skill_name.strip().lower()].append(position)
+        for name, job_positions in positions.items():
+            bits = self._skill_bits.get(name, 0)
+            added = _bitset(job_positions) & ~bits
+            self._skill_bits[name] = bits | added
+            self._links += added.bit_count()
+
+
+_default_index: SkillFacetIndex | None = None
+_default_lock = threading.Lock()
+
+
+def get_skill_facet_index() -> SkillFacetIndex:
+    """Process-wide facet index shared by dashboard sessions."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = SkillFacetIndex()
+        return _default_index
@@ -0,0 +1,154 @@
+"""Deterministic skill extraction from the known skill vocabulary.
+
+``SkillMatcher`` is an Aho-Corasick automaton over every skill name and
+alias, so a description is scanned once regardless of vocabulary size.
+Matches must sit on word boundaries ("sql" does not fire inside "mysql").
+Each skill gets a confidence: 1.0 for its canonical name, 0.9 for an alias,
+0.5 for short or everyday words ("go", "rest"), plus a little for every
+repeat mention. ``SkillService`` only falls back to the LLM when too few
+confident skills are found.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.database.models import Skill, SkillAlias
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+CANONICAL_CONFIDENCE = 1.0
+ALIAS_CONFIDENCE = 0.9
+AMBIGUOUS_CONFIDENCE = 0.5
+REPEAT_BONUS = 0.05
+
+# Terms that are ordinary English words as often as they are skills.
+_AMBIGUOUS_TERMS = {"go", "rest", "spring", "node", "spark", "torch", "scrum"}
+
+
+class _Term(NamedTuple):
+    skill_name: str
+    length: int
+    confidence: float
+
+
+class SkillMatcher:
+    def __init__(self, terms: Mapping[str, str]) -> None:
+        """``terms`` maps a lowercase term (name or alias) to its skill."""
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[_Term]] = [[]]
+        for term, skill_name in terms.items():
+            term = term.strip().lower()
+            if term:
+                self._add(term, _Term(skill_name, len(term), _confidence(term, skill_name)))
+        self._link()
+        self.vocabulary_size = len(set(terms.values()))
+
+    def match(self, text: str) -> dict[str, float]:
+        """Skill name -> confidence for every skill mentioned in ``text``."""
+        text = text.lower()
+        best: dict[str, float] = {}
+        mentions: dict[str, int] = {}
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for term in self._output[state]:
+                start = end - term.length + 1
+                if not _is_boundary(text, start - 1) or not _is_boundary(text, end + 1):
+                    continue
+                mentions[term.skill_name] = mentions.get(term.skill_name, 0) + 1
+                best[term.skill_name] = max(best.get(term.skill_name, 0.0), term.confidence)
+
+        return {
+            name: round(min(1.0, confidence + REPEAT_BONUS * (mentions[name] - 1)), 2)
+            for name, confidence in best.items()
+        }
+
+    def _add(self, term: str, output: _Term) -> None:
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(output)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+
+def _confidence(term: str, skill_name: str) -> float:
+    if len(term) <= 2 or term in _AMBIGUOUS_TERMS:
+        return AMBIGUOUS_CONFIDENCE
+    return CANONICAL_CONFIDENCE if term == skill_name else ALIAS_CONFIDENCE
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+_matcher: SkillMatcher | None = None
+_matcher_fingerprint: tuple[int, ...] | None = None
+_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher(db_session: Session) -> SkillMatcher:
+    """Process-wide matcher, rebuilt whenever skills or aliases change."""
+    global _matcher, _matcher_fingerprint
+    skills, max_skill_id = db_session.execute(
+        select(func.count(), func.coalesce(func.max(Skill.id), 0)).select_from(Skill)
+    ).one()
+    aliases = db_session.scalar(select(func.count()).select_from(SkillAlias))
+    fingerprint = (skills, max_skill_id, aliases)
+
+    with _matcher_lock:
+        if _matcher is None or fingerprint != _matcher_fingerprint:
+            terms = {
+                name: name for name in db_session.scalars(select(Skill.skill_name))
+            }
+            terms.update(
+                {
+                    alias: skill_name
+                    for alias, skill_name in db_session.execute(
+                        select(SkillAlias.alias, Skill.skill_name).join(
+                            Skill, Skill.id == SkillAlias.skill_id
+                        )
+                    )
+                }
+            )
+            _matcher = SkillMatcher(terms)
+            _matcher_fingerprint = fingerprint
+            logger.debug("Built skill matcher from %s terms", len(terms))
+        return _matcher
+
+
+def clear_skill_matcher() -> None:
+    global _matcher, _matcher_fingerprint
+    with _matcher_lock:
+        _matcher = None
+        _matcher_fingerprint = None
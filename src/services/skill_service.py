@@ -1,15 +1,275 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.ai.llm_client import LLMClient
-from src.database.models import Job, JobSkill, Skill
+from src.ai.llm_client import MODEL_KEY, LLMClient
+from src.ai.preprocessing import chunk_description, clean_description, estimate_tokens
+from src.config import settings
+from src.database.dialects import upsert_insert
+from src.database.models import Job, JobContent, JobSkill, Skill
 from src.logger import get_logger
+from src.services.enrichment_queue import EnrichmentQueue
+from src.services.skill_matcher import SkillMatcher, get_skill_matcher
+from src.services.skill_stats_service import COUNTED_STATUS, SkillStatsService
+from src.services.skill_taxonomy import (
+    get_alias_map,
+    get_skill_id_cache,
+    refresh_taxonomy_caches,
+)
+
+if TYPE_CHECKING:
+    from src.database.writer import WriteCoordinator
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+MISSING_DESCRIPTION_ERROR = "missing description"
+DICTIONARY_TIER = "dictionary"
+
+# Longer "skills" are sentences a small model copied from the posting.
+_MAX_SKILL_NAME_LENGTH = 60
+
+# Bump when the prompt wording or output schema changes so cached responses
+# are not reused.
+SKILL_PROMPT_VERSION = "2"
+
+SKILL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"skills": {"type": "array", "items": {"type": "string"}}},
+    "required": ["skills"],
+}
+
+
+def build_skill_prompt(description: str) -> str:
+    return (
+        "Extract technical skills from this job description. "
+        "Return JSON {skills: [list of strings]}.\n\n"
+        f"Job description:\n{description}"
+    )
+
+
+BATCH_SKILL_PROMPT_VERSION = "2"
+
+
+def batch_skill_schema(job_ids: Iterable[int]) -> dict[str, Any]:
+    """Schema requiring a ``{skills: [...]}`` entry for every job id."""
+    keys = [str(job_id) for job_id in job_ids]
+    return {
+        "type": "object",
+        "properties": {key: SKILL_SCHEMA for key in keys},
+        "required": keys,
+    }
+
+
+def build_batch_skill_prompt(descriptions: Mapping[int, str]) -> str:
+    jobs = "\n\n".join(
+        f"Job {job_id}:\n{description}" for job_id, description in descriptions.items()
+    )
+    return (
+        "Extract technical skills from each job description below. "
+        "Return JSON mapping every job id to {skills: [list of strings]}, "
+        'e.g. {"12": {"skills": ["python"]}}.\n\n'
+        f"{jobs}"
+    )
+
+
+def pack_descriptions(
+    descriptions: Mapping[int, str],
+    token_budget: int | None = None,
+    max_jobs: int | None = None,
+) -> list[dict[int, str]]:
+    """Group descriptions into prompts of at most ``max_jobs`` jobs and
+    roughly ``token_budget`` tokens. Oversized descriptions go alone.
+    """
+    token_budget = token_budget or settings.llm_batch_token_budget
+    max_jobs = max(1, max_jobs or settings.llm_batch_max_jobs)
+    budget = token_budget - estimate_tokens(build_batch_skill_prompt({}))
+
+    batches: list[dict[int, str]] = []
+    batch: dict[int, str] = {}
+    used = 0
+    for job_id, description in descriptions.items():
+        tokens = estimate_tokens(f"Job {job_id}:\n{description}\n\n")
+        if batch and (len(batch) >= max_jobs or used + tokens > budget):
+            batches.append(batch)
+            batch, used = {}, 0
+        batch[job_id] = description
+        used += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def split_batch_response(
+    response: dict[str, Any] | None, job_ids: Iterable[int]
+) -> dict[int, dict[str, Any]]:
+    """Per-job ``{"skills": [...]}`` results; missing or malformed jobs are
+    left out.
+    """
+    if not isinstance(response, dict):
+        return {}
+    model = response.get(MODEL_KEY)
+    if isinstance(response.get("jobs"), dict):
+        response = response["jobs"]
+
+    results: dict[int, dict[str, Any]] = {}
+    for job_id in job_ids:
+        result = response.get(str(job_id))
+        if isinstance(result, list):
+            result = {"skills": result}
+        if has_skill_list(result):
+            results[job_id] = result if model is None else {**result, MODEL_KEY: model}
+    return results
+
+
+def has_skill_list(response: Any) -> bool:
+    return isinstance(response, dict) and isinstance(response.get("skills"), list)
+
+
+def is_confident_skill_response(response: Any) -> bool:
+    """Whether a cheap model's answer can be kept: a clean list of at least
+    ``LLM_CASCADE_MIN_SKILLS`` plausible skill names.
+    """
+    if not has_skill_list(response):
+        return False
+    skills = response["skills"]
+    clean = [
+        skill
+        for skill in skills
+        if isinstance(skill, str) and 0 < len(skill.strip()) <= _MAX_SKILL_NAME_LENGTH
+    ]
+    return len(clean) == len(skills) and len(clean) >= settings.llm_cascade_min_skills
+
+
+def extract_skill_batch(
+    llm_client: LLMClient, descriptions: Mapping[int, str]
+) -> dict[int, dict[str, Any] | None]:
+    """LLM responses for a packed batch, retrying missing jobs one by one.
+
+    Touches no database state, so it is safe to run in a worker thread.
+    """
+    results: dict[int, dict[str, Any] | None] = {}
+    if len(descriptions) > 1:
+
+        def validate(response: dict[str, Any]) -> bool:
+            jobs = split_batch_response(response, descriptions)
+            return len(jobs) == len(descriptions) and all(
+                is_confident_skill_response(job) for job in jobs.values()
+            )
+
+        results.update(
+            split_batch_response(
+                llm_client.generate_json(
+                    build_batch_skill_prompt(descriptions),
+                    BATCH_SKILL_PROMPT_VERSION,
+                    validate,
+                    schema=batch_skill_schema(descriptions),
+                ),
+                descriptions,
+            )
+        )
+        missing = len(descriptions) - len(results)
+        if missing:
+            logger.warning(
+                "Batch response missed %s of %s jobs, retrying them singly",
+                missing,
+                len(descriptions),
+            )
+
+    for job_id, description in descriptions.items():
+        if job_id not in results:
+            results[job_id] = extract_chunk(llm_client, description)
+    return results
+
+
+def extract_chunk(
+    llm_client: LLMClient,
+    text: str,
+    validate: Callable[[Any], bool] = is_confident_skill_response,
+) -> dict[str, Any] | None:
+    return llm_client.generate_json(
+        build_skill_prompt(text),
+        SKILL_PROMPT_VERSION,
+        validate,
+        schema=SKILL_SCHEMA,
+        max_items=settings.llm_max_skills,
+    )
+
+
+def extract_description(
+    llm_client: LLMClient, description: str
+) -> dict[str, Any] | None:
+    """LLM response for one description, map-reducing it over chunks (in
+    parallel) when it exceeds ``LLM_DESCRIPTION_TOKEN_BUDGET``.
+    """
+    chunks = chunk_description(description, settings.llm_description_token_budget)
+    if len(chunks) == 1:
+        return extract_chunk(llm_client, description)
+    workers = max(1, min(len(chunks), settings.llm_concurrency))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm") as pool:
+        # A chunk may legitimately hold no skills, so only its shape is checked.
+        responses = list(
+            pool.map(
+                lambda chunk: extract_chunk(llm_client, chunk, has_skill_list), chunks
+            )
+        )
+    return merge_skill_responses(responses)
+
+
+def split_long_descriptions(
+    descriptions: Mapping[int, str],
+) -> tuple[dict[int, str], dict[int, list[str]]]:
+    """Separate descriptions that fit one prompt from chunked long ones."""
+    budget = settings.llm_description_token_budget
+    short: dict[int, str] = {}
+    chunked: dict[int, list[str]] = {}
+    for job_id, description in descriptions.items():
+        if estimate_tokens(description) <= budget:
+            short[job_id] = description
+        else:
+            chunked[job_id] = chunk_description(description, budget)
+    return short, chunked
+
+
+def merge_skill_responses(
+    responses: Iterable[dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Union of the chunk skill lists in first-seen order; ``None`` if no
+    chunk produced one.
+    """
+    skills: list[Any] = []
+    seen: set[str] = set()
+    models: list[str] = []
+    merged = 0
+    for response in responses:
+        if not has_skill_list(response):
+            continue
+        merged += 1
+        model = response.get(MODEL_KEY)
+        if model and model not in models:
+            models.append(model)
+        for skill in response["skills"]:
+            key = skill.strip().lower() if isinstance(skill, str) else None
+            if key and key not in seen:
+                seen.add(key)
+                skills.append(skill)
+    if not merged:
+        return None
+    merged_response = {"skills": skills, "chunks": merged}
+    if models:
+        merged_response[MODEL_KEY] = ",".join(models)
+    return merged_response
+
 
 class SkillService:
     def __init__(self, db_session: Session, llm_client: LLMClient) -> None:
@@ -17,21 +277,187 @@ class SkillService:
         self.llm_client = llm_client
 
     def extract_and_save_skills(self, job_id: int) -> list[str] | None:
+        description = self.load_description(job_id)
+        if description is None:
+            return None
+
+        matches = self.match_skills(description)
+        if matches is not None:
+            return self.save_matched_skills(job_id, matches)
+
+        response = extract_description(self.llm_client, description)
+        return self.save_extracted_skills(job_id, response)
+
+    def extract_and_save_many(
+        self, job_ids: list[int], concurrency: int | None = None
+    ) -> int:
+        """Extract skills for several jobs with up to ``concurrency`` LLM calls
+        in flight, several short descriptions packed into each prompt and
+        long ones split into chunks whose skills are merged. Results are
+        saved on the calling thread as they arrive, so the session is never
+        shared with the workers. Every write is committed in its own short
+        transaction, so no write lock is held while the model runs. A failed
+        call or save only loses its own jobs. Returns jobs saved.
+        """
+        descriptions = self.load_descriptions(job_ids)
+        self.fail_missing_descriptions(job_ids, descriptions)
+        self.db_session.commit()
+        matched, descriptions = self.match_descriptions(descriptions)
+        saved = 0
+        for job_id, matches in matched.items():
+            if self._save_isolated(self.save_matched_skills, job_id, matches):
+                saved += 1
+        if not descriptions:
+            return saved
+
+        short, chunked = split_long_descriptions(descriptions)
+        workers = max(1, concurrency or settings.llm_concurrency)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm") as pool:
+            # A batch's job ids, or (job id, chunk index) for one chunk.
+            futures: dict[Future, list[int] | tuple[int, int]] = {
+                pool.submit(extract_skill_batch, self.llm_client, batch): list(batch)
+                for batch in pack_descriptions(short)
+            }
+            for job_id, chunks in chunked.items():
+                for index, chunk in enumerate(chunks):
+                    future = pool.submit(
+                        extract_chunk, self.llm_client, chunk, has_skill_list
+                    )
+                    futures[future] = (job_id, index)
+
+            partials: dict[int, dict[int, dict[str, Any] | None]] = {}
+            failed: set[int] = set()
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.exception("Skill extraction failed for jobs %s", task)
+                    if isinstance(task, list):
+                        continue
+                    result = None
+                    failed.add(task[0])
+
+                if isinstance(task, list):
+                    responses = result
+                else:
+                    job_id, index = task
+                    partials.setdefault(job_id, {})[index] = result
+                    if len(partials[job_id]) < len(chunked[job_id]):
+                        continue
+                    parts = partials.pop(job_id)
+                    if job_id in failed:
+                        # A partial skill list would mark the job done.
+                        continue
+                    responses = {
+                        job_id: merge_skill_responses(
+                            parts[index] for index in range(len(parts))
+                        )
+                    }
+                for response_job_id, response in responses.items():
+                    if self._save_isolated(
+                        self.save_extracted_skills, response_job_id, response
+                    ):
+                        saved += 1
+        return saved
+
+    def _save_isolated(
+        self, save: Callable[[int, Any], list[str] | None], job_id: int, result: Any
+    ) -> list[str] | None:
+        """Run and commit one job's save; a failure is logged and rolled back
+        without touching the other jobs' saves.
+        """
+        try:
+            skills = save(job_id, result)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            logger.exception("Failed to save skills for job: %s", job_id)
+            return None
+        return skills
+
+    def fail_missing_descriptions(
+        self, job_ids: Iterable[int], descriptions: Mapping[int, str]
+    ) -> None:
+        """Fail queued tasks of jobs with nothing to extract from; they are
+        queued again when a description arrives.
+        """
+        missing = [job_id for job_id in job_ids if job_id not in descriptions]
+        EnrichmentQueue(self.db_session).release(
+            missing, MISSING_DESCRIPTION_ERROR, permanent=True
+        )
+
+    def match_skills(self, description: str) -> dict[str, float] | None:
+        """Dictionary matches for ``description``, or ``None`` when they are
+        too few to skip the LLM.
+        """
+        if not settings.skill_matcher_enabled:
+            return None
+        return self._confident_matches(get_skill_matcher(self.db_session), description)
+
+    def match_descriptions(
+        self, descriptions: dict[int, str]
+    ) -> tuple[dict[int, dict[str, float]], dict[int, str]]:
+        """Split jobs into dictionary matches and descriptions for the LLM."""
+        if not descriptions or not settings.skill_matcher_enabled:
+            return {}, descriptions
+
+        matcher = get_skill_matcher(self.db_session)
+        matched: dict[int, dict[str, float]] = {}
+        pending: dict[int, str] = {}
+        for job_id, description in descriptions.items():
+            matches = self._confident_matches(matcher, description)
+            if matches is None:
+                pending[job_id] = description
+            else:
+                matched[job_id] = matches
+        logger.info(
+            "Matched skills for %s of %s jobs without the LLM",
+            len(matched),
+            len(descriptions),
+        )
+        return matched, pending
+
+    @staticmethod
+    def _confident_matches(
+        matcher: SkillMatcher, description: str
+    ) -> dict[str, float] | None:
+        if matcher.vocabulary_size < settings.skill_matcher_min_vocabulary:
+            return None
+        matches = {
+            name: confidence
+            for name, confidence in matcher.match(description).items()
+            if confidence >= settings.skill_matcher_min_confidence
+        }
+        if len(matches) < settings.skill_matcher_min_skills:
+            return None
+        return matches
+
+    def load_descriptions(self, job_ids: list[int]) -> dict[int, str]:
+        """Cleaned, non-empty descriptions for ``job_ids`` in one query."""
+        if not job_ids:
+            return {}
+        contents = self.db_session.scalars(
+            select(JobContent).where(JobContent.job_id.in_(job_ids))
+        )
+        descriptions = {}
+        for content in contents:
+            description = clean_description(content.description)
+            if description:
+                descriptions[content.job_id] = description
+        return descriptions
+
+    def load_description(self, job_id: int) -> str | None:
         job = self.db_session.query(Job).filter(Job.id == job_id).one_or_none()
         if job is None:
             logger.warning("Job not found for skill extraction: %s", job_id)
             return None
 
-        description = (job.description or "").strip()
-        if not description:
-            return None
+        return clean_description(job.description) or None
 
-        prompt = (
-            "Extract technical skills from this job description. "
-            "Return JSON {skills: [list of strings]}.\n\n"
-            f"Job description:\n{description}"
-        )
-        response = self.llm_client.generate_json(prompt)
+    def save_extracted_skills(
+        self, job_id: int, response: dict[str, Any] | None
+    ) -> list[str] | None:
         if not response:
             logger.warning("LLM did not return skills for job: %s", job_id)
             return None
@@ -41,39 +467,255 @@ class SkillService:
             logger.warning("LLM response missing skills list for job: %s", job_id)
             return None
 
+        job = self.db_session.get(Job, job_id)
+        if job is None:
+            logger.warning("Job not found for skill extraction: %s", job_id)
+            return None
+
         job.skills_raw = json.dumps(response)
 
+        aliases = get_alias_map(self.db_session)
         normalized_skills: list[str] = []
         seen: set[str] = set()
         for skill_name in skills:
             if not isinstance(skill_name, str):
                 continue
             normalized = skill_name.strip().lower()
+            normalized = aliases.get(normalized, normalized)
             if not normalized or normalized in seen:
                 continue
 
             seen.add(normalized)
             normalized_skills.append(normalized)
 
-            skill = (
-                self.db_session.query(Skill)
-                .filter(Skill.skill_name == normalized)
-                .one_or_none()
+        return self._save_skills(
+            job, dict.fromkeys(normalized_skills), response.get(MODEL_KEY)
+        )
+
+    def save_matched_skills(
+        self, job_id: int, matches: dict[str, float]
+    ) -> list[str] | None:
+        """Link dictionary matches, recording each match's confidence."""
+        job = self.db_session.get(Job, job_id)
+        if job is None:
+            logger.warning("Job not found for skill extraction: %s", job_id)
+            return None
+
+        job.skills_raw = json.dumps(
+            {"skills": list(matches), "extractor": DICTIONARY_TIER}
+        )
+        return self._save_skills(job, matches, DICTIONARY_TIER)
+
+    def _save_skills(
+        self, job: Job, skills: dict[str, float | None], served_by: str | None
+    ) -> list[str]:
+        names = list(skills)
+        skill_ids = self.resolve_skill_ids(names)
+        linked_skill_ids = self._link_skills(
+            job.id, {skill_ids[name]: skills[name] for name in names}
+        )
+        self.db_session.expire(job, ["job_skills", "skills"])
+        EnrichmentQueue(self.db_session).complete([job.id], served_by)
+
+        stats = SkillStatsService(self.db_session)
+        if job.status == COUNTED_STATUS:
+            stats.increment(linked_skill_ids)
+        stats.record_demand(job, linked_skill_ids)
+        return names
+
+    def resolve_skill_ids(self, names: list[str]) -> dict[str, int]:
+        """Ids for ``names``, creating missing skills in one statement."""
+        refresh_taxonomy_caches(self.db_session)
+        cache = get_skill_id_cache()
+        skill_ids = cache.get_many(self.db_session, names)
+        missing = [name for name in names if name not in skill_ids]
+        if missing:
+            found = self._select_skill_ids(missing)
+            new_names = [name for name in missing if name not in found]
+            if new_names:
+                self.db_session.execute(
+                    upsert_insert(self.db_session, Skill)
+                    .values([{"skill_name": name} for name in new_names])
+                    .on_conflict_do_nothing(index_elements=["skill_name"])
+                )
+                found.update(self._select_skill_ids(new_names))
+            cache.stage_many(self.db_session, found)
+            skill_ids.update(found)
+        return skill_ids
+
+    def _select_skill_ids(self, names: list[str]) -> dict[str, int]:
+        rows = self.db_session.execute(
+            select(Skill.skill_name, Skill.id).where(Skill.skill_name.in_(names))
+        )
+        return {skill_name: skill_id for skill_name, skill_id in rows}
+
+    def _link_skills(
+        self, job_id: int, confidences: dict[int, float | None]
+    ) -> list[int]:
+        """Insert missing links in one statement; returns newly linked ids."""
+        if not confidences:
+            return []
+        result = self.db_session.execute(
+            upsert_insert(self.db_session, JobSkill)
+            .values(
+                [
+                    {
+                        "job_id": job_id,
+                        "skill_id": skill_id,
+                        "confidence_score": confidence,
+                    }
+                    for skill_id, confidence in confidences.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["job_id", "skill_id"])
+            .returning(JobSkill.skill_id)
+        )
+        return list(result.scalars())
+
+
+class AsyncSkillService:
+    """Async counterpart of ``SkillService`` for the scraper event loop.
+
+    Database work runs through ``AsyncSession.run_sync`` on the async driver,
+    and the blocking LLM call runs in a worker thread, so neither stalls the
+    loop that drives the browser and the scheduler. With a ``writer``, the
+    save step is committed by the shared write coordinator instead.
+    ``extract_and_save_many`` keeps several LLM calls in flight at once while
+    saves still go through the session (or writer) one at a time.
+    """
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        llm_client: LLMClient,
+        writer: WriteCoordinator | None = None,
+    ) -> None:
+        self.db_session = db_session
+        self.llm_client = llm_client
+        self.writer = writer
+        self._save_lock = asyncio.Lock()
+
+    def _service(self, session: Session) -> SkillService:
+        return SkillService(session, self.llm_client)
+
+    async def extract_and_save_skills(self, job_id: int) -> list[str] | None:
+        description = await self.db_session.run_sync(
+            lambda session: self._service(session).load_description(job_id)
+        )
+        if description is None:
+            return None
+
+        matches = await self.db_session.run_sync(
+            lambda session: self._service(session).match_skills(description)
+        )
+        if matches is not None:
+            return await self._write(
+                lambda service: service.save_matched_skills(job_id, matches)
             )
-            if skill is None:
-                skill = Skill(skill_name=normalized)
-                self.db_session.add(skill)
-                self.db_session.flush()
-
-            link = (
-                self.db_session.query(JobSkill)
-                .filter(
-                    JobSkill.job_id == job.id,
-                    JobSkill.skill_id == skill.id,
+
+        response = await asyncio.to_thread(
+            extract_description, self.llm_client, description
+        )
+        return await self._write(
+            lambda service: service.save_extracted_skills(job_id, response)
+        )
+
+    async def extract_and_save_many(
+        self, job_ids: list[int], concurrency: int | None = None
+    ) -> int:
+        """Extract skills for several jobs with at most ``concurrency`` LLM
+        calls in flight. Returns the number of jobs whose skills were saved.
+        """
+        descriptions = await self.db_session.run_sync(
+            lambda session: self._service(session).load_descriptions(job_ids)
+        )
+        await self._write(
+            lambda service: service.fail_missing_descriptions(job_ids, descriptions)
+        )
+        matched, descriptions = await self.db_session.run_sync(
+            lambda session: self._service(session).match_descriptions(descriptions)
+        )
+        saved = 0
+        for job_id, matches in matched.items():
+            if await self._write(
+                lambda service, job_id=job_id, matches=matches: (
+                    service.save_matched_skills(job_id, matches)
                 )
-                .one_or_none()
+            ):
+                saved += 1
+        if not descriptions:
+            return saved
+
+        workers = max(1, concurrency or settings.llm_concurrency)
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm") as pool:
+
+            async def extract(batch: dict[int, str]) -> int:
+                responses = await loop.run_in_executor(
+                    pool, extract_skill_batch, self.llm_client, batch
+                )
+                batch_saved = 0
+                for job_id, response in responses.items():
+                    if await self._write(
+                        lambda service, job_id=job_id, response=response: (
+                            service.save_extracted_skills(job_id, response)
+                        )
+                    ):
+                        batch_saved += 1
+                return batch_saved
+
+            async def extract_chunked(job_id: int, chunks: list[str]) -> int:
+                responses = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool, extract_chunk, self.llm_client, chunk, has_skill_list
+                        )
+                        for chunk in chunks
+                    )
+                )
+                response = merge_skill_responses(responses)
+                skills = await self._write(
+                    lambda service: service.save_extracted_skills(job_id, response)
+                )
+                return 1 if skills else 0
+
+            short, chunked = split_long_descriptions(descriptions)
+            batches = pack_descriptions(short)
+            task_jobs = [list(batch) for batch in batches] + [
+                [job_id] for job_id in chunked
+            ]
+            results = await asyncio.gather(
+                *(extract(batch) for batch in batches),
+                *(
+                    extract_chunked(job_id, chunks)
+                    for job_id, chunks in chunked.items()
+                ),
+                return_exceptions=True,
             )
-            if link is None:
-                self.db_session.add(JobSkill(job_id=job.id, skill_id=skill.id))
 
-        return normalized_skills
+        for job_ids_in_task, result in zip(task_jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Skill extraction failed for jobs %s: %s", job_ids_in_task, result
+                )
+            else:
+                saved += result
+        return saved
+
+    async def _write(self, save: Callable[[SkillService], T]) -> T:
+        if self.writer is not None:
+            return await self.writer.execute_async(
+                lambda session: save(self._service(session))
+            )
+        # An AsyncSession cannot run two run_sync calls at once. Each write
+        # is committed so no transaction stays open across LLM calls.
+        async with self._save_lock:
+            try:
+                result = await self.db_session.run_sync(
+                    lambda session: save(self._service(session))
+                )
+                await self.db_session.commit()
+            except Exception:
+                await self.db_session.rollback()
+                raise
+            return result
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import Date, and_, case, cast, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from src.database.dialects import upsert_insert
+from src.database.models import Job, JobSkill, Skill, SkillDemandDaily
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Skill.frequency counts links from jobs in this status.
+COUNTED_STATUS = "active"
+
+
+class SkillCount(NamedTuple):
+    skill_name: str
+    job_count: int
+
+
+class DemandPoint(NamedTuple):
+    day: date
+    count: int
+
+
+class SkillGrowth(NamedTuple):
+    skill_name: str
+    current: int
+    previous: int
+    # None when the skill had no demand in the previous window.
+    growth_rate: float | None
+
+
+class SkillStatsService:
+    """Maintains and reads the denormalized ``Skill.frequency`` counters."""
+
+    def __init__(self, db_session: Session) -> None:
+        self.db_session = db_session
+
+    def get_top_skills(self, limit: int = 10) -> list[SkillCount]:
+        stmt = (
+            select(Skill.skill_name, Skill.frequency)
+            .where(Skill.frequency > 0)
+            .order_by(Skill.frequency.desc(), Skill.skill_name.asc())
+            .limit(limit)
+        )
+        return [SkillCount(*row) for row in self.db_session.execute(stmt)]
+
+    def increment(self, skill_ids: Sequence[int], amount: int = 1) -> None:
+        if not skill_ids:
+            return
+        self.db_session.execute(
+            update(Skill)
+            .where(Skill.id.in_(list(skill_ids)))
+            .values(frequency=Skill.frequency + amount)
+        )
+
+    def adjust_for_jobs(self, job_ids: Sequence[int], sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) the links of counted jobs.
+
+        Only jobs currently in ``COUNTED_STATUS`` contribute, so call this
+        before a status change or delete takes effect.
+        """
+        if not job_ids:
+            return
+
+        ids = list(job_ids)
+        counted_links = (
+            select(func.count())
+            .select_from(JobSkill)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(
+                and_(
+                    JobSkill.skill_id == Skill.id,
+                    JobSkill.job_id.in_(ids),
+                    Job.status == COUNTED_STATUS,
+                )
+            )
+            .scalar_subquery()
+        )
+        affected = select(JobSkill.skill_id).where(JobSkill.job_id.in_(ids))
+        self.db_session.execute(
+            update(Skill)
+            .where(Skill.id.in_(affected))
+            .values(frequency=Skill.frequency + sign * counted_links)
+        )
+
+    def reconcile_frequencies(self) -> int:
+        """Recompute every counter from ``job_skills``; returns skills fixed."""
+        actual = (
+            select(func.count())
+            .select_from(JobSkill)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(
+                and_(
+                    JobSkill.skill_id == Skill.id,
+                    Job.status == COUNTED_STATUS,
+                )
+            )
+            .scalar_subquery()
+        )
+        result = self.db_session.execute(
+            update(Skill)
+            .where(Skill.frequency != actual)
+            .values(frequency=actual)
+        )
+        fixed = result.rowcount or 0
+        if fixed:
+            logger.info("Reconciled frequency for %s skills", fixed)
+        return fixed
+
+    def record_demand(self, job: Job, skill_ids: Sequence[int]) -> None:
+        """Add one job's new skill links to the daily rollup."""
+        if not skill_ids:
+            return
+
+        if job.posted_date is not None:
+            day = job.posted_date
+        elif job.scraped_at is not None:
+            day = job.scraped_at.date()
+        else:
+            day = date.today()
+
+        stmt = upsert_insert(self.db_session, SkillDemandDaily).values(
+            [
+                {
+                    "day": day,
+                    "skill_id": skill_id,
+                    "source_platform": job.source_platform or "",
+                    "count": 1,
+                }
+                for skill_id in skill_ids
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "skill_id", "source_platform"],
+            set_={"count": SkillDemandDaily.count + stmt.excluded["count"]},
+        )
+        self.db_session.execute(stmt)
+
+    def backfill_demand(
+        self, start: date | None = None, end: date | None = None
+    ) -> int:
+        """Rebuild rollup rows for ``[start, end]`` from the jobs still stored.
+
+        Days whose jobs were already removed by retention lose their history,
+        so pass a range when only recent days need repair.
+        """
+        job_day = self._job_day()
+        day_filters: list[ColumnElement[bool]] = []
+        rollup_filters: list[ColumnElement[bool]] = []
+        if start is not None:
+            day_filters.append(job_day >= start)
+            rollup_filters.append(SkillDemandDaily.day >= start)
+        if end is not None:
+            day_filters.append(job_day <= end)
+            rollup_filters.append(SkillDemandDaily.day <= end)
+
+        self.db_session.execute(delete(SkillDemandDaily).where(*rollup_filters))
+
+        platform = func.coalesce(Job.source_platform, "")
+        source = (
+            select(job_day, JobSkill.skill_id, platform, func.count())
+            .select_from(JobSkill)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(*day_filters)
+            .group_by(job_day, JobSkill.skill_id, platform)
+        )
+        result = self.db_session.execute(
+            insert(SkillDemandDaily).from_select(
+                ["day", "skill_id", "source_platform", "count"], source
+            )
+        )
+        rows = result.rowcount or 0
+        logger.info("Backfilled %s skill demand rows", rows)
+        return rows
+
+    def get_demand_trends(
+        self,
+        skill_names: Sequence[str],
+        days: int = 90,
+        source_platform: str | None = None,
+        today: date | None = None,
+    ) -> dict[str, list[DemandPoint]]:
+        """Daily demand per skill over the last ``days`` days, zero-filled."""
+        end = today or date.today()
+        start = end - timedelta(days=days - 1)
+        if not skill_names:
+            return {}
+
+        window = [start + timedelta(days=offset) for offset in range(days)]
+        counts: dict[str, dict[date, int]] = {name: {} for name in skill_names}
+
+        stmt = (
+            select(
+                Skill.skill_name,
+                SkillDemandDaily.day,
+                func.sum(SkillDemandDaily.count),
+            )
+            .join(Skill, Skill.id == SkillDemandDaily.skill_id)
+            .where(
+                Skill.skill_name.in_(list(skill_names)),
+                SkillDemandDaily.day.between(start, end),
+            )
+            .group_by(Skill.skill_name, SkillDemandDaily.day)
+        )
+        if source_platform is not None:
+            stmt = stmt.where(SkillDemandDaily.source_platform == source_platform)
+
+        for skill_name, day, count in self.db_session.execute(stmt):
+            counts[skill_name][day] = int(count)
+
+        return {
+            name: [DemandPoint(day, by_day.get(day, 0)) for day in window]
+            for name, by_day in counts.items()
+        }
+
+    def get_demand_growth(
+        self,
+        window_days: int = 30,
+        limit: int = 10,
+        min_count: int = 1,
+        source_platform: str | None = None,
+        today: date | None = None,
+    ) -> list[SkillGrowth]:
+        """Compare each skill's last ``window_days`` with the window before.
+
+        Fastest-growing first; skills new in the current window lead.
+        """
+        end = today or date.today()
+        current_start = end - timedelta(days=window_days - 1)
+        previous_start = current_start - timedelta(days=window_days)
+
+        in_current = SkillDemandDaily.day >= current_start
+        current = func.sum(case((in_current, SkillDemandDaily.count), else_=0))
+        previous = func.sum(case((in_current, 0), else_=SkillDemandDaily.count))
+        stmt = (
+            select(Skill.skill_name, current, previous)
+            .join(Skill, Skill.id == SkillDemandDaily.skill_id)
+            .where(SkillDemandDaily.day.between(previous_start, end))
+            .group_by(Skill.skill_name)
+            .having(current >= min_count)
+        )
+        if source_platform is not None:
+            stmt = stmt.where(SkillDemandDaily.source_platform == source_platform)
+
+        growth: list[SkillGrowth] = []
+        for skill_name, current_count, previous_count in self.db_session.execute(stmt):
+            rate = (
+                (current_count - previous_count) / previous_count
+                if previous_count
+                else None
+            )
+            growth.append(
+                SkillGrowth(skill_name, int(current_count), int(previous_count), rate)
+            )
+
+        growth.sort(
+            key=lambda row: (
+                -(float("inf") if row.growth_rate is None else row.growth_rate),
+                -row.current,
+                row.skill_name,
+            )
+        )
+        return growth[:limit]
+
+    def _dialect_name(self) -> str:
+        return self.db_session.get_bind().dialect.name
+
+    def _job_day(self) -> ColumnElement[date]:
+        if self._dialect_name() == "sqlite":
+            return func.date(
+                func.coalesce(Job.posted_date, Job.scraped_at), type_=Date
+            )
+        return func.coalesce(Job.posted_date, cast(Job.scraped_at, Date))
@@ -0,0 +1,378 @@
+"""Skill taxonomy: canonical skills, their aliases and a category tree.
+
+Categories are stored as an adjacency list plus a closure table holding
+every (ancestor, descendant) pair, so "demand for everything under Data"
+is one indexed join instead of a recursive walk. ``SkillService`` folds the
+LLM's spellings onto canonical skills through ``get_alias_map``, an
+in-memory map loaded once per process. ``sync`` bumps the taxonomy version
+in ``cache_versions``; ``refresh_taxonomy_caches`` compares it once per
+transaction and drops the alias map and cached skill ids of every process
+that loaded them before a merge deleted skills.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from sqlalchemy import delete, event, func, literal, select
+from sqlalchemy.orm import Session, aliased
+
+from src.database.dialects import upsert_insert
+from src.database.id_cache import CommittedIdCache
+from src.database.models import (
+    CacheVersion,
+    Job,
+    JobSkill,
+    Skill,
+    SkillAlias,
+    SkillCategory,
+    SkillCategoryClosure,
+    SkillDemandDaily,
+)
+from src.logger import get_logger
+from src.services.skill_stats_service import COUNTED_STATUS, SkillStatsService
+
+logger = get_logger(__name__)
+
+# Category name -> parent name (None for roots).
+DEFAULT_CATEGORIES: dict[str, str | None] = {
+    "Programming Languages": None,
+    "Web": None,
+    "Frontend": "Web",
+    "Backend Frameworks": "Web",
+    "Data": None,
+    "Databases": "Data",
+    "Data Engineering": "Data",
+    "Machine Learning": "Data",
+    "Cloud & DevOps": None,
+    "Cloud Platforms": "Cloud & DevOps",
+    "Containers & Orchestration": "Cloud & DevOps",
+    "CI/CD": "Cloud & DevOps",
+    "Practices": None,
+}
+
+# Canonical skill -> (category, aliases). Names are lowercase.
+DEFAULT_SKILLS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "python": ("Programming Languages", ("py", "python3", "python 3")),
+    "java": ("Programming Languages", ("java 8", "java 11", "java 17")),
+    "javascript": ("Programming Languages", ("js", "ecmascript", "es6")),
+    "typescript": ("Programming Languages", ("ts",)),
+    "c#": ("Programming Languages", ("csharp", "c sharp")),
+    "c++": ("Programming Languages", ("cpp",)),
+    "go": ("Programming Languages", ("golang",)),
+    "rust": ("Programming Languages", ()),
+    "sql": ("Databases", ()),
+    "react": ("Frontend", ("react.js", "reactjs")),
+    "angular": ("Frontend", ("angularjs", "angular.js")),
+    "vue": ("Frontend", ("vue.js", "vuejs")),
+    "html": ("Frontend", ("html5",)),
+    "css": ("Frontend", ("css3",)),
+    "node.js": ("Backend Frameworks", ("node", "nodejs")),
+    "django": ("Backend Frameworks", ()),
+    "flask": ("Backend Frameworks", ()),
+    "fastapi": ("Backend Frameworks", ()),
+    ".net": ("Backend Frameworks", ("dotnet", "asp.net", ".net core")),
+    "spring": ("Backend Frameworks", ("spring boot", "springboot")),
+    "postgresql": ("Databases", ("postgres", "psql")),
+    "mysql": ("Databases", ()),
+    "sql server": ("Databases", ("mssql", "microsoft sql server")),
+    "mongodb": ("Databases", ("mongo",)),
+    "redis": ("Databases", ()),
+    "apache spark": ("Data Engineering", ("spark", "pyspark")),
+    "apache airflow": ("Data Engineering", ("airflow",)),
+    "apache kafka": ("Data Engineering", ("kafka",)),
+    "dbt": ("Data Engineering", ()),
+    "pandas": ("Machine Learning", ()),
+    "machine learning": ("Machine Learning", ("ml",)),
+    "pytorch": ("Machine Learning", ("torch",)),
+    "tensorflow": ("Machine Learning", ("tf",)),
+    "aws": ("Cloud Platforms", ("amazon web services",)),
+    "azure": ("Cloud Platforms", ("microsoft azure",)),
+    "gcp": ("Cloud Platforms", ("google cloud", "google cloud platform")),
+    "docker": ("Containers & Orchestration", ()),
+    "kubernetes": ("Containers & Orchestration", ("k8s",)),
+    "terraform": ("Cloud & DevOps", ()),
+    "linux": ("Cloud & DevOps", ()),
+    "ci/cd": ("CI/CD", ("cicd", "ci cd", "continuous integration")),
+    "github actions": ("CI/CD", ()),
+    "jenkins": ("CI/CD", ()),
+    "git": ("Practices", ()),
+    "agile": ("Practices", ("scrum",)),
+    "rest api": ("Practices", ("rest", "restful", "rest apis", "restful api")),
+}
+
+
+class CategoryDemand(NamedTuple):
+    category: str
+    job_count: int
+
+
+class TaxonomySyncResult(NamedTuple):
+    categories: int
+    skills: int
+    aliases: int
+    merged: int
+
+
+TAXONOMY_CACHE = "skill_taxonomy"
+_CHECKED_KEY = "taxonomy_version_checked"
+
+_alias_map: dict[str, str] | None = None
+_taxonomy_version: int | None = None
+_alias_lock = threading.Lock()
+
+
+def get_taxonomy_version(db_session: Session) -> int:
+    version = db_session.scalar(
+        select(CacheVersion.version).where(CacheVersion.name == TAXONOMY_CACHE)
+    )
+    return version or 0
+
+
+def refresh_taxonomy_caches(db_session: Session) -> None:
+    """Drop the alias map and cached skill ids if the taxonomy was synced
+    since they were loaded. Checked once per transaction.
+    """
+    global _alias_map, _taxonomy_version
+    transaction = db_session.get_transaction()
+    if transaction is not None and db_session.info.get(_CHECKED_KEY) is transaction:
+        return
+    version = get_taxonomy_version(db_session)
+    db_session.info[_CHECKED_KEY] = db_session.get_transaction()
+    with _alias_lock:
+        if version == _taxonomy_version:
+            return
+        if _taxonomy_version is not None:
+            logger.info("Skill taxonomy changed, reloading aliases and skill ids")
+        _alias_map = None
+        _skill_ids.clear()
+        _taxonomy_version = version
+
+
+def get_alias_map(db_session: Session) -> Mapping[str, str]:
+    """Alias -> canonical skill name, loaded on first use."""
+    global _alias_map
+    refresh_taxonomy_caches(db_session)
+    with _alias_lock:
+        if _alias_map is None:
+            rows = db_session.execute(
+                select(SkillAlias.alias, Skill.skill_name).join(
+                    Skill, Skill.id == SkillAlias.skill_id
+                )
+            )
+            _alias_map = {alias: skill_name for alias, skill_name in rows}
+        return _alias_map
+
+
+def clear_alias_cache() -> None:
+    global _alias_map, _taxonomy_version
+    with _alias_lock:
+        _alias_map = None
+        _taxonomy_version = None
+
+
+_skill_ids: CommittedIdCache[str] = CommittedIdCache("skills")
+
+
+def _clear_caches(_session: Session) -> None:
+    clear_alias_cache()
+    _skill_ids.clear()
+
+
+def get_skill_id_cache() -> CommittedIdCache[str]:
+    """Skill name -> id, shared by every ``SkillService`` in the process."""
+    return _skill_ids
+
+
+class SkillTaxonomyService:
+    def __init__(self, db_session: Session) -> None:
+        self.db_session = db_session
+
+    def sync(
+        self,
+        categories: Mapping[str, str | None] = DEFAULT_CATEGORIES,
+        skills: Mapping[str, tuple[str, tuple[str, ...]]] = DEFAULT_SKILLS,
+    ) -> TaxonomySyncResult:
+        """Upsert the taxonomy, rebuild the closure table and fold existing
+        alias skills into their canonical skill. Idempotent.
+        """
+        category_ids = self._sync_categories(categories)
+        self.rebuild_closure()
+
+        alias_count = 0
+        skill_ids: dict[str, int] = {}
+        for skill_name, (category, aliases) in skills.items():
+            skill = self.db_session.scalar(
+                select(Skill).where(Skill.skill_name == skill_name)
+            )
+            if skill is None:
+                skill = Skill(skill_name=skill_name)
+                self.db_session.add(skill)
+            skill.category_id = category_ids[category]
+            skill.category = category
+            self.db_session.flush()
+            skill_ids[skill_name] = skill.id
+
+            for alias in aliases:
+                self.db_session.execute(
+                    upsert_insert(self.db_session, SkillAlias)
+                    .values(alias=alias, skill_id=skill.id)
+                    .on_conflict_do_update(
+                        index_elements=["alias"], set_={"skill_id": skill.id}
+                    )
+                )
+                alias_count += 1
+
+        merged = self.merge_alias_skills()
+        self._bump_version()
+        # Other processes notice the new version; this one also drops its
+        # caches once the merge is committed, so nothing reloads them early.
+        event.listen(self.db_session, "after_commit", _clear_caches, once=True)
+        logger.info(
+            "Synced skill taxonomy: %s categories, %s skills, %s aliases, "
+            "%s duplicate skills merged",
+            len(category_ids),
+            len(skill_ids),
+            alias_count,
+            merged,
+        )
+        return TaxonomySyncResult(
+            categories=len(category_ids),
+            skills=len(skill_ids),
+            aliases=alias_count,
+            merged=merged,
+        )
+
+    def rebuild_closure(self) -> int:
+        """Recompute ``skill_category_closure`` from ``parent_id`` links."""
+        parents = {
+            category_id: parent_id
+            for category_id, parent_id in self.db_session.execute(
+                select(SkillCategory.id, SkillCategory.parent_id)
+            )
+        }
+        rows = []
+        for category_id in parents:
+            ancestor, depth = category_id, 0
+            seen: set[int] = set()
+            while ancestor is not None and ancestor not in seen:
+                seen.add(ancestor)
+                rows.append(
+                    {
+                        "ancestor_id": ancestor,
+                        "descendant_id": category_id,
+                        "depth": depth,
+                    }
+                )
+                ancestor, depth = parents.get(ancestor), depth + 1
+
+        self.db_session.execute(delete(SkillCategoryClosure))
+        if rows:
+            self.db_session.execute(SkillCategoryClosure.__table__.insert(), rows)
+        return len(rows)
+
+    def merge_alias_skills(self) -> int:
+        """Re-point links of skills whose name is a known alias, then drop them."""
+        canonical = aliased(Skill)
+        duplicates = self.db_session.execute(
+            select(Skill.id, canonical.id)
+            .join(SkillAlias, SkillAlias.alias == Skill.skill_name)
+            .join(canonical, canonical.id == SkillAlias.skill_id)
+            .where(Skill.id != canonical.id)
+        ).all()
+
+        for duplicate_id, canonical_id in duplicates:
+            links = select(
+                JobSkill.job_id, literal(canonical_id), JobSkill.confidence_score
+            ).where(JobSkill.skill_id == duplicate_id)
+            self.db_session.execute(
+                upsert_insert(self.db_session, JobSkill)
+                .from_select(["job_id", "skill_id", "confidence_score"], links)
+                .on_conflict_do_nothing(index_elements=["job_id", "skill_id"])
+            )
+
+            demand = select(
+                SkillDemandDaily.day,
+                literal(canonical_id),
+                SkillDemandDaily.source_platform,
+                SkillDemandDaily.count,
+            ).where(SkillDemandDaily.skill_id == duplicate_id)
+            stmt = upsert_insert(self.db_session, SkillDemandDaily).from_select(
+                ["day", "skill_id", "source_platform", "count"], demand
+            )
+            self.db_session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["day", "skill_id", "source_platform"],
+                    set_={"count": SkillDemandDaily.count + stmt.excluded["count"]},
+                )
+            )
+
+            for model in (JobSkill, SkillDemandDaily):
+                self.db_session.execute(
+                    delete(model).where(model.skill_id == duplicate_id)
+                )
+            self.db_session.execute(
+                delete(SkillAlias).where(SkillAlias.skill_id == duplicate_id)
+            )
+            self.db_session.execute(delete(Skill).where(Skill.id == duplicate_id))
+
+        if duplicates:
+            SkillStatsService(self.db_session).reconcile_frequencies()
+            self.db_session.expire_all()
+        return len(duplicates)
+
+    def demand_by_category(self, parent: str | None = None) -> list[CategoryDemand]:
+        """Distinct active jobs per category, counting every skill beneath it.
+
+        With ``parent`` only its direct subcategories are listed; otherwise
+        the root categories are.
+        """
+        category = aliased(SkillCategory)
+        parent_category = aliased(SkillCategory)
+        stmt = (
+            select(category.name, func.count(JobSkill.job_id.distinct()))
+            .join(
+                SkillCategoryClosure,
+                SkillCategoryClosure.ancestor_id == category.id,
+            )
+            .join(Skill, Skill.category_id == SkillCategoryClosure.descendant_id)
+            .join(JobSkill, JobSkill.skill_id == Skill.id)
+            .join(Job, Job.id == JobSkill.job_id)
+            .where(Job.status == COUNTED_STATUS)
+            .group_by(category.id, category.name)
+            .order_by(func.count(JobSkill.job_id.distinct()).desc(), category.name)
+        )
+        if parent is None:
+            stmt = stmt.where(category.parent_id.is_(None))
+        else:
+            stmt = stmt.join(
+                parent_category, parent_category.id == category.parent_id
+            ).where(parent_category.name == parent)
+        return [CategoryDemand(*row) for row in self.db_session.execute(stmt)]
+
+    def _bump_version(self) -> None:
+        stmt = upsert_insert(self.db_session, CacheVersion).values(
+            name=TAXONOMY_CACHE, version=1
+        )
+        self.db_session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["name"],
+                set_={"version": CacheVersion.version + 1},
+            )
+        )
+
+    def _sync_categories(self, categories: Mapping[str, str | None]) -> dict[str, int]:
+        existing = {
+            category.name: category
+            for category in self.db_session.scalars(select(SkillCategory))
+        }
+        for name in categories:
+            if name not in existing:
+                existing[name] = SkillCategory(name=name)
+                self.db_session.add(existing[name])
+        for name, parent in categories.items():
+            existing[name].parent = existing[parent] if parent is not None else None
+        self.db_session.flush()
+        return {name: existing[name].id for name in categories}
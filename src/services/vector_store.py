@@ -0,0 +1,255 @@
+"""Job embeddings in a memory-mapped float32 matrix.
+
+``JobVectorStore`` keeps one L2-normalised row per job in ``vectors.f32``,
+the matching job ids in ``ids.i64`` and the ``JobRevision`` each vector was
+embedded at in ``revisions.i64``, all ``numpy.memmap`` files that grow by
+doubling, plus ``meta.json`` with the row count and dimensions.
+Cosine similarity is then a single matrix-vector product over the mapped
+rows (the OS pages them in; nothing is copied into Python objects) and the
+top ``k`` come from ``argpartition`` instead of a full sort. Removed jobs
+keep their row with id ``-1`` until the store is rebuilt. Every operation
+re-stats ``meta.json`` and remaps the files when another process has
+written to the store since.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from src.config import settings
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+_VECTORS_FILE = "vectors.f32"
+_IDS_FILE = "ids.i64"
+_REVISIONS_FILE = "revisions.i64"
+_META_FILE = "meta.json"
+_MIN_CAPACITY = 1024
+_REMOVED = -1
+
+
+class JobVectorStore:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._vectors: np.memmap | None = None
+        self._ids: np.memmap | None = None
+        self._revisions: np.memmap | None = None
+        self._capacity = 0
+        self._meta_stat: tuple[int, int, int] | None = None
+        self._load_meta()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_id: int) -> bool:
+        return job_id in self._rows
+
+    def job_ids(self) -> set[int]:
+        with self._lock:
+            self._sync()
+            return set(self._rows)
+
+    def job_revisions(self) -> dict[int, int]:
+        """Job id -> revision its vector was embedded at."""
+        with self._lock:
+            self._sync()
+            rows = list(self._rows.values())
+            revisions = self._revisions[rows].tolist() if rows else []
+            return dict(zip(self._rows, revisions, strict=True))
+
+    def add(
+        self,
+        job_ids: Sequence[int],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        model: str | None = None,
+        revisions: Sequence[int] | None = None,
+    ) -> None:
+        """Store (or overwrite) one vector per job id, with the revision of
+        the text it was embedded from (0 when not given).
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if not len(job_ids):
+            return
+        if matrix.ndim != 2 or matrix.shape[0] != len(job_ids):
+            raise ValueError("Expected one vector per job id")
+        if revisions is not None and len(revisions) != len(job_ids):
+            raise ValueError("Expected one revision per job id")
+        with self._lock:
+            self._sync()
+            if self.dimensions is None:
+                self.dimensions = int(matrix.shape[1])
+                self.model = model
+            elif matrix.shape[1] != self.dimensions:
+                raise ValueError(
+                    f"Vector has {matrix.shape[1]} dimensions, store has {self.dimensions}"
+                )
+            new_ids = [
+                job_id for job_id in dict.fromkeys(job_ids) if job_id not in self._rows
+            ]
+            if self.count + len(new_ids) > self._capacity:
+                self._grow(self.count + len(new_ids))
+            for job_id in new_ids:
+                self._rows[job_id] = self.count
+                self._ids[self.count] = job_id
+                self.count += 1
+            rows = np.fromiter(
+                (self._rows[job_id] for job_id in job_ids), dtype=np.int64
+            )
+            self._vectors[rows] = _normalize(matrix)
+            self._revisions[rows] = 0 if revisions is None else revisions
+            self.flush()
+
+    def remove(self, job_ids: Iterable[int]) -> int:
+        with self._lock:
+            self._sync()
+            rows = [
+                self._rows.pop(job_id) for job_id in job_ids if job_id in self._rows
+            ]
+            if rows:
+                self._ids[rows] = _REMOVED
+                self._vectors[rows] = 0
+                self._revisions[rows] = 0
+                self.flush()
+            return len(rows)
+
+    def search(
+        self, query_vector: Sequence[float] | np.ndarray, k: int
+    ) -> list[tuple[int, float]]:
+        """Top ``k`` ``(job_id, cosine similarity)`` pairs, best first."""
+        with self._lock:
+            self._sync()
+            if not self._rows or k <= 0:
+                return []
+            query = np.asarray(query_vector, dtype=np.float32)
+            if query.shape != (self.dimensions,):
+                raise ValueError(
+                    f"Query has shape {query.shape}, store has {self.dimensions} dimensions"
+                )
+            norm = np.linalg.norm(query)
+            if not norm:
+                return []
+            ids = self._ids[: self.count]
+            scores = self._vectors[: self.count] @ (query / norm)
+            scores[ids == _REMOVED] = -np.inf
+            k = min(k, len(self._rows))
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+            return [(int(ids[row]), float(scores[row])) for row in top]
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._ids.flush()
+                self._revisions.flush()
+            meta = {
+                "dimensions": self.dimensions,
+                "model": self.model,
+                "count": self.count,
+                "capacity": self._capacity,
+            }
+            # A fresh inode per write lets other processes spot it by stat.
+            meta_path = self.path / _META_FILE
+            partial = self.path / f"{_META_FILE}.{os.getpid()}.tmp"
+            partial.write_text(json.dumps(meta))
+            os.replace(partial, meta_path)
+            self._meta_stat = _stat(meta_path)
+
+    def _sync(self) -> None:
+        if _stat(self.path / _META_FILE) != self._meta_stat:
+            logger.debug("Job vector store changed on disk, remapping")
+            self._load_meta()
+
+    def _load_meta(self) -> None:
+        meta_path = self.path / _META_FILE
+        self._meta_stat = _stat(meta_path)
+        meta = json.loads(meta_path.read_text()) if self._meta_stat else {}
+        self.dimensions: int | None = meta.get("dimensions")
+        self.model: str | None = meta.get("model")
+        self.count: int = meta.get("count", 0)
+        capacity = meta.get("capacity", 0)
+        if capacity != self._capacity or self._vectors is None:
+            self._capacity = capacity
+            self._vectors = self._ids = self._revisions = None
+            if capacity:
+                self._open()
+        self._rows: dict[int, int] = {}
+        if self._ids is not None:
+            self._rows = {
+                int(job_id): row
+                for row, job_id in enumerate(self._ids[: self.count].tolist())
+                if job_id != _REMOVED
+            }
+
+    def _grow(self, rows: int) -> None:
+        capacity = max(rows, self._capacity * 2, _MIN_CAPACITY)
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._ids.flush()
+            self._revisions.flush()
+            self._vectors = self._ids = self._revisions = None
+        for name, row_bytes in (
+            (_VECTORS_FILE, 4 * self.dimensions),
+            (_IDS_FILE, 8),
+            (_REVISIONS_FILE, 8),
+        ):
+            with open(self.path / name, "ab") as handle:
+                handle.truncate(capacity * row_bytes)
+        self._capacity = capacity
+        self._open()
+        logger.debug("Grew job vector store to %s rows", capacity)
+
+    def _open(self) -> None:
+        self._vectors = np.memmap(
+            self.path / _VECTORS_FILE,
+            dtype=np.float32,
+            mode="r+",
+            shape=(self._capacity, self.dimensions),
+        )
+        self._ids = np.memmap(
+            self.path / _IDS_FILE, dtype=np.int64, mode="r+", shape=(self._capacity,)
+        )
+        revisions_path = self.path / _REVISIONS_FILE
+        if not revisions_path.exists():
+            # Stores written before revisions were kept: every vector is at 0.
+            with open(revisions_path, "ab") as handle:
+                handle.truncate(self._capacity * 8)
+        self._revisions = np.memmap(
+            revisions_path, dtype=np.int64, mode="r+", shape=(self._capacity,)
+        )
+
+
+def _stat(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+_default_store: JobVectorStore | None = None
+_default_lock = threading.Lock()
+
+
+def get_job_vector_store() -> JobVectorStore:
+    """Process-wide store at ``EMBEDDING_STORE_PATH``."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = JobVectorStore(settings.embedding_store_path)
+        return _default_store
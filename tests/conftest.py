@@ -1,9 +1,15 @@
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from src.ai.circuit_breaker import clear_circuit_breakers
 from src.database.models import Base
+from src.services.location_service import clear_location_cache
+from src.services.skill_matcher import clear_skill_matcher
+from src.services.skill_taxonomy import clear_alias_cache, get_skill_id_cache
 
 
 @pytest.fixture()
@@ -30,3 +36,39 @@ def db_session():
     finally:
         session.close()
         Base.metadata.drop_all(engine)
+
+
+@pytest_asyncio.fixture()
+async def async_db_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+    session = SessionLocal()
+
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    # Cached ids and aliases belong to whichever in-memory database loaded them.
+    clear_location_cache()
+    clear_alias_cache()
+    get_skill_id_cache().clear()
+    clear_skill_matcher()
+    clear_circuit_breakers()
+    yield
+    clear_location_cache()
+    clear_alias_cache()
+    get_skill_id_cache().clear()
+    clear_skill_matcher()
+    clear_circuit_breakers()
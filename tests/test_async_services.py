@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import select
+
+from src.ai.llm_client import LLMClient
+from src.config import settings
+from src.database.models import Job, JobSkill, Skill
+from src.database.session import get_async_database_url
+from src.services.job_service import AsyncJobService
+from src.services.skill_service import AsyncSkillService
+
+
+def test_get_async_database_url_maps_drivers():
+    assert (
+        get_async_database_url("sqlite:///./job_tracker.db").drivername
+        == "sqlite+aiosqlite"
+    )
+    assert (
+        get_async_database_url("postgresql://user@localhost/jobs").drivername
+        == "postgresql+asyncpg"
+    )
+    assert (
+        get_async_database_url("sqlite+aiosqlite:///:memory:").drivername
+        == "sqlite+aiosqlite"
+    )
+    with pytest.raises(ValueError):
+        get_async_database_url("mssql+pyodbc://localhost/jobs")
+
+
+@pytest.mark.asyncio
+async def test_async_upsert_and_process_new_jobs(async_db_session):
+    job_service = AsyncJobService(async_db_session)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python", "SQL"]}
+    skill_service = AsyncSkillService(async_db_session, llm_client)
+
+    job = await job_service.upsert_job(
+        {
+            "company": "Acme Corp",
+            "title": "Data Engineer",
+            "url": "https://jobs.example.com/acme/async",
+            "description": "We need Python and SQL skills.",
+        }
+    )
+    await job_service.upsert_job({"company": "Acme Corp", "title": "No Description"})
+    await async_db_session.flush()
+
+    processed = await job_service.process_new_jobs_with_ai(skill_service)
+    await async_db_session.commit()
+
+    assert processed == 2
+    llm_client.generate_json.assert_called_once()
+    skill_names = (await async_db_session.scalars(select(Skill.skill_name))).all()
+    assert sorted(skill_names) == ["python", "sql"]
+    links = (
+        await async_db_session.scalars(
+            select(JobSkill).where(JobSkill.job_id == job.id)
+        )
+    ).all()
+    assert len(links) == 2
+    assert (await async_db_session.get(Job, job.id)).skills_raw is not None
+
+
+@pytest.mark.asyncio
+async def test_async_extraction_bounds_llm_calls_and_serializes_saves(
+    async_db_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "llm_batch_max_jobs", 1)
+    job_service = AsyncJobService(async_db_session)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def generate_json(prompt, prompt_version="", validate=None, **options):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["now"] -= 1
+        return {"skills": ["Python", "Docker"]}
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = generate_json
+    skill_service = AsyncSkillService(async_db_session, llm_client)
+
+    upserts = [
+        job_service.upsert_job(
+            {
+                "company": "Acme Corp",
+                "title": f"Platform Engineer {index}",
+                "url": f"https://jobs.example.com/acme/platform-{index}",
+                "description": "Python services running in Docker.",
+            }
+        )
+        for index in range(5)
+    ]
+    for upsert in upserts:
+        await upsert
+    await async_db_session.flush()
+
+    processed = await job_service.process_new_jobs_with_ai(
+        skill_service, concurrency=2
+    )
+    await async_db_session.commit()
+
+    assert processed == 5
+    assert in_flight["max"] == 2
+    assert llm_client.generate_json.call_count == 5
+    links = (await async_db_session.scalars(select(JobSkill))).all()
+    assert len(links) == 10
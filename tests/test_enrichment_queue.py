@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.ai.llm_client import LLMClient
+from src.config import settings
+from src.database.models import EnrichmentTask, Job
+from src.database.timestamps import utc_now
+from src.services.enrichment_queue import DONE, FAILED, PENDING, EnrichmentQueue
+from src.services.job_service import JobService
+from src.services.skill_service import SkillService
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _add_jobs(db_session, count: int, description: str | None = "Python work.") -> list[int]:
+    job_service = JobService(db_session)
+    jobs = [
+        job_service.upsert_job(
+            {
+                "company": "Acme Corp",
+                "title": f"Engineer {index}",
+                "url": f"https://jobs.example.com/acme/queue-{index}-{description}",
+                "description": description,
+            }
+        )
+        for index in range(count)
+    ]
+    db_session.flush()
+    # Tasks created now; make them due for the fixed test clock.
+    db_session.query(EnrichmentTask).update({"next_attempt_at": NOW})
+    return [job.id for job in jobs]
+
+
+def _task(db_session, job_id: int) -> EnrichmentTask:
+    db_session.expire_all()
+    return db_session.get(EnrichmentTask, job_id)
+
+
+def test_new_jobs_are_queued_and_claimed_once(db_session):
+    job_ids = _add_jobs(db_session, 3)
+    queue = EnrichmentQueue(db_session, lease_seconds=60)
+
+    first = queue.claim(limit=2, worker="a", now=NOW)
+    second = queue.claim(limit=10, worker="b", now=NOW)
+
+    assert first == job_ids[:2]
+    assert second == job_ids[2:]
+    assert queue.claim(limit=10, now=NOW) == []
+    task = _task(db_session, job_ids[0])
+    assert (task.status, task.attempts, task.leased_by) == ("in_progress", 1, "a")
+
+
+def test_expired_leases_are_reclaimed(db_session):
+    (job_id,) = _add_jobs(db_session, 1)
+    queue = EnrichmentQueue(db_session, lease_seconds=60, max_attempts=2)
+
+    assert queue.claim(now=NOW) == [job_id]
+    assert queue.claim(now=NOW + timedelta(seconds=30)) == []
+    assert queue.claim(now=NOW + timedelta(seconds=61)) == [job_id]
+    assert _task(db_session, job_id).attempts == 2
+
+    # Out of attempts: an expired lease fails instead of being claimed again.
+    assert queue.claim(now=NOW + timedelta(seconds=200)) == []
+    task = _task(db_session, job_id)
+    assert (task.status, task.last_error) == (FAILED, "lease expired")
+
+
+def test_release_backs_off_then_fails(db_session):
+    (job_id,) = _add_jobs(db_session, 1)
+    queue = EnrichmentQueue(db_session, max_attempts=2, retry_base_seconds=100)
+
+    queue.claim(now=NOW)
+    assert queue.release([job_id], "no skills extracted", now=NOW) == 1
+    task = _task(db_session, job_id)
+    assert task.status == PENDING
+    assert task.next_attempt_at == NOW + timedelta(seconds=100)
+    assert queue.claim(now=NOW + timedelta(seconds=99)) == []
+
+    assert queue.claim(now=NOW + timedelta(seconds=100)) == [job_id]
+    queue.release([job_id], "no skills extracted", now=NOW)
+    assert _task(db_session, job_id).status == FAILED
+    assert queue.stats() == (0, 0, 0, 1)
+
+
+def test_processing_marks_done_and_fails_jobs_without_description(db_session):
+    described = _add_jobs(db_session, 2)
+    (empty,) = _add_jobs(db_session, 1, description=None)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python"]}
+    skill_service = SkillService(db_session, llm_client)
+    job_service = JobService(db_session)
+
+    assert job_service.process_new_jobs_with_ai(skill_service) == 3
+
+    assert {_task(db_session, job_id).status for job_id in described} == {DONE}
+    task = _task(db_session, empty)
+    assert (task.status, task.last_error) == (FAILED, "missing description")
+    assert job_service.process_new_jobs_with_ai(skill_service) == 0
+
+    job = db_session.get(Job, empty)
+    job_service.upsert_job({"url": job.url, "description": "Now with Python."})
+    db_session.flush()
+    assert _task(db_session, empty).status == PENDING
+
+
+def test_llm_failures_are_retried_later(db_session):
+    (job_id,) = _add_jobs(db_session, 1)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = None
+    job_service = JobService(db_session)
+
+    job_service.process_new_jobs_with_ai(SkillService(db_session, llm_client))
+
+    task = _task(db_session, job_id)
+    assert (task.status, task.attempts, task.last_error) == (
+        PENDING,
+        1,
+        "no skills extracted",
+    )
+    assert task.next_attempt_at > utc_now()
+
+
+def test_one_failing_job_does_not_strand_the_batch(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "llm_batch_max_jobs", 1)
+    (saved,) = _add_jobs(db_session, 1, "Python work.")
+    (llm_error,) = _add_jobs(db_session, 1, "Crash the model.")
+    (save_error,) = _add_jobs(db_session, 1, "Break the save.")
+
+    def generate_json(prompt, prompt_version="", validate=None, **options):
+        if "Crash" in prompt:
+            raise RuntimeError("model crashed")
+        return {"skills": ["Python"]}
+
+    save_extracted_skills = SkillService.save_extracted_skills
+
+    def failing_save(self, job_id, response):
+        if job_id == save_error:
+            raise RuntimeError("save failed")
+        return save_extracted_skills(self, job_id, response)
+
+    monkeypatch.setattr(SkillService, "save_extracted_skills", failing_save)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = generate_json
+
+    processed = JobService(db_session).process_new_jobs_with_ai(
+        SkillService(db_session, llm_client)
+    )
+
+    assert processed == 3
+    assert _task(db_session, saved).status == DONE
+    assert {_task(db_session, job_id).status for job_id in (llm_error, save_error)} == {
+        PENDING
+    }
+
+
+def test_claim_is_committed_before_llm_calls(db_session, monkeypatch):
+    _add_jobs(db_session, 1)
+    events = []
+    commit = db_session.commit
+
+    def recording_commit():
+        events.append("commit")
+        commit()
+
+    def generate_json(prompt, prompt_version="", validate=None, **options):
+        events.append("llm")
+        return {"skills": ["Python"]}
+
+    monkeypatch.setattr(db_session, "commit", recording_commit)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = generate_json
+
+    JobService(db_session).process_new_jobs_with_ai(
+        SkillService(db_session, llm_client)
+    )
+
+    # Claim, pre-LLM writes and the result each commit on their own, so no
+    # write transaction is open while the model runs.
+    assert events == ["commit", "commit", "llm", "commit"]
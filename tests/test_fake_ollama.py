@@ -0,0 +1,63 @@
+import ollama
+
+from scripts.fake_ollama import FakeOllamaServer, fake_reply
+from src.ai.circuit_breaker import OPEN, CircuitBreaker
+from src.ai.llm_client import LLMClient
+from src.database.models import EnrichmentTask, Job
+from src.services.job_service import JobService
+from src.services.skill_service import SkillService, build_batch_skill_prompt
+
+
+def _client(server, **kwargs):
+    return LLMClient(
+        models=["fake"],
+        client=ollama.Client(host=server.url, timeout=5),
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+        **kwargs,
+    )
+
+
+def test_fake_reply_is_deterministic_per_job():
+    prompt = build_batch_skill_prompt({1: "We use Python and Kafka.", 2: "Rust."})
+
+    reply = fake_reply(prompt)
+
+    assert reply == fake_reply(prompt)
+    assert reply["1"]["skills"][:2] == ["python", "kafka"]
+    assert reply["2"]["skills"][0] == "rust"
+    assert all(len(job["skills"]) >= 3 for job in reply.values())
+
+
+def test_enrichment_runs_end_to_end_against_fake_server(db_session):
+    jobs = [
+        Job(
+            company="Acme Corp",
+            title=f"Engineer {index}",
+            url=f"https://jobs.example.com/acme/fake-{index}",
+            description=f"Engineer {index} needs Python, SQL and Docker.",
+        )
+        for index in range(5)
+    ]
+    for job in jobs:
+        job.enrichment_task = EnrichmentTask()
+    db_session.add_all(jobs)
+    db_session.flush()
+
+    with FakeOllamaServer(max_concurrency=2) as server:
+        skill_service = SkillService(db_session, _client(server))
+        assert JobService(db_session).process_new_jobs_with_ai(skill_service) == 5
+
+    assert server.requests >= 1
+    assert server.max_in_flight <= 2
+    for job in jobs:
+        db_session.refresh(job)
+        assert {"python", "sql", "docker"} <= {skill.skill_name for skill in job.skills}
+
+
+def test_server_errors_trip_the_circuit_breaker():
+    with FakeOllamaServer(error_rate=1.0) as server:
+        client = _client(server, max_retries=3, retry_base_seconds=0)
+        assert client.generate_json("prompt") is None
+
+    assert server.requests == 2
+    assert client.circuit_breaker.state == OPEN
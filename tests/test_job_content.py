@@ -0,0 +1,77 @@
+import zlib
+
+import pytest
+from sqlalchemy import text
+
+from src.config import settings
+from src.database import compression
+from src.database.models import Job, JobContent
+
+
+def test_compress_round_trip_for_available_codecs():
+    value = "Senior Python Engineer " * 50
+
+    for codec in compression.available_codecs():
+        data = compression.compress_text(value, codec)
+        assert compression.decompress_text(data, codec) == value
+
+    assert compression.compress_text(None, compression.ZLIB) is None
+    assert compression.resolve_codec("bogus") == compression.ZLIB
+    with pytest.raises(ValueError):
+        compression.compress_text(value, "bogus")
+
+
+def test_job_content_is_stored_compressed_in_side_table(db_session):
+    html = "<html>" + "<div>Python</div>" * 200 + "</html>"
+    job = Job(
+        company="Acme Corp",
+        title="Data Engineer",
+        url="https://jobs.example.com/acme/content",
+        description="Build pipelines",
+        raw_html=html,
+    )
+    db_session.add(job)
+    db_session.flush()
+
+    stored = db_session.execute(
+        text("SELECT codec, raw_html FROM job_content WHERE job_id = :job_id"),
+        {"job_id": job.id},
+    ).one()
+    assert stored.codec == "zlib"
+    assert len(stored.raw_html) < len(html)
+    assert zlib.decompress(stored.raw_html).decode("utf-8") == html
+
+    db_session.expunge_all()
+    reloaded = db_session.query(Job).filter(Job.id == job.id).one()
+    assert reloaded.description == "Build pipelines"
+    assert reloaded.raw_html == html
+
+
+def test_job_without_content_has_no_side_row(db_session):
+    job = Job(company="Acme Corp", title="Data Engineer")
+    db_session.add(job)
+    db_session.flush()
+
+    assert job.description is None
+    assert job.raw_html is None
+    assert db_session.query(JobContent).count() == 0
+
+
+def test_job_content_recodes_when_codec_setting_changes(db_session, monkeypatch):
+    job = Job(
+        company="Acme Corp",
+        title="Data Engineer",
+        description="Build pipelines",
+        raw_html="<html></html>",
+    )
+    db_session.add(job)
+    db_session.flush()
+
+    monkeypatch.setattr(settings, "content_codec", compression.IDENTITY)
+    job.description = "Maintain pipelines"
+    db_session.flush()
+
+    assert job.content.codec == compression.IDENTITY
+    assert job.content.raw_html_data == b"<html></html>"
+    assert job.description == "Maintain pipelines"
+    assert job.raw_html == "<html></html>"
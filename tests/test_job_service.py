@@ -1,6 +1,9 @@
 from datetime import date, datetime
 
+from sqlalchemy import inspect as sa_inspect
+
 from src.database.models import Job
+from src.database.read_models import JobListRow
 from src.services.job_service import JobService
 
 
@@ -109,3 +112,71 @@ def test_get_active_jobs_returns_ordered_and_limited(db_session):
         "https://jobs.example.com/acme/engineer-2",
         "https://jobs.example.com/acme/engineer-3",
     ]
+
+
+def test_list_active_jobs_returns_slim_rows(db_session):
+    service = JobService(db_session)
+
+    db_session.add_all(
+        [
+            Job(
+                company="Acme Corp",
+                title="Engineer I",
+                location="Brisbane",
+                url="https://jobs.example.com/acme/engineer-1",
+                source_platform="linkedin",
+                description="Long description",
+                raw_html="<html>...</html>",
+                scraped_at=datetime(2024, 1, 1, 9, 0, 0),
+            ),
+            Job(
+                company="Acme Corp",
+                title="Engineer II",
+                url="https://jobs.example.com/acme/engineer-2",
+                source_platform="seek",
+                scraped_at=datetime(2024, 1, 2, 9, 0, 0),
+            ),
+            Job(
+                company="Acme Corp",
+                title="Engineer III",
+                url="https://jobs.example.com/acme/engineer-3",
+                status="archived",
+                scraped_at=datetime(2024, 1, 3, 9, 0, 0),
+            ),
+        ]
+    )
+    db_session.flush()
+
+    rows = service.list_active_jobs()
+
+    assert all(isinstance(row, JobListRow) for row in rows)
+    assert [row.title for row in rows] == ["Engineer II", "Engineer I"]
+    assert rows[1].location == "Brisbane"
+    assert not hasattr(rows[1], "description")
+    assert [row.title for row in service.list_active_jobs(offset=1)] == [
+        "Engineer I"
+    ]
+    assert [
+        row.title for row in service.list_active_jobs(source_platform="linkedin")
+    ] == ["Engineer I"]
+
+
+def test_job_heavy_columns_are_deferred(db_session):
+    service = JobService(db_session)
+    job = service.upsert_job(
+        {
+            "company": "Acme Corp",
+            "title": "Data Engineer",
+            "url": "https://jobs.example.com/acme/deferred",
+            "description": "Build pipelines",
+            "raw_html": "<html>...</html>",
+        }
+    )
+    db_session.flush()
+    db_session.expunge_all()
+
+    loaded = service.get_job_by_id(job.id)
+
+    unloaded = sa_inspect(loaded).unloaded
+    assert {"content", "skills_raw"} <= unloaded
+    assert loaded.description == "Build pipelines"
@@ -0,0 +1,120 @@
+from datetime import date
+
+from sqlalchemy import delete, update
+
+from src.database.compression import compress_text
+from src.database.models import Job, JobContent
+from src.services.job_service import JobService, build_fts_query
+
+
+def _add_jobs(db_session) -> None:
+    db_session.add_all(
+        [
+            Job(
+                company="Acme Corp",
+                title="Python Developer",
+                location="Brisbane, Australia",
+                description="Build APIs with FastAPI and PostgreSQL.",
+                url="https://jobs.example.com/acme/python",
+                posted_date=date(2024, 1, 10),
+            ),
+            Job(
+                company="Globex",
+                title="Data Engineer",
+                location="Sydney, Australia",
+                description="Maintain Spark pipelines written in Python.",
+                url="https://jobs.example.com/globex/data",
+            ),
+            Job(
+                company="Initech",
+                title="Java Engineer",
+                location="Remote - US",
+                description="Spring services.",
+                url="https://jobs.example.com/initech/java",
+            ),
+            Job(
+                company="Hooli",
+                title="Python Lead",
+                location="Perth, Australia",
+                description="Archived role.",
+                url="https://jobs.example.com/hooli/python",
+                status="archived",
+            ),
+        ]
+    )
+    db_session.flush()
+
+
+def test_build_fts_query_quotes_tokens_as_prefixes():
+    assert build_fts_query('C++ "python" OR sql*') == '"c"* "python"* "or"* "sql"*'
+    assert build_fts_query("  ") == ""
+
+
+def test_search_ranks_title_matches_and_highlights(db_session):
+    _add_jobs(db_session)
+    service = JobService(db_session)
+
+    page = service.search("python")
+
+    assert [hit.title for hit in page.hits] == ["Python Developer", "Data Engineer"]
+    assert page.next_cursor is None
+    assert page.hits[0].posted_date == date(2024, 1, 10)
+    assert "**Python**" in page.hits[1].snippet
+
+
+def test_search_covers_description_and_location(db_session):
+    _add_jobs(db_session)
+    service = JobService(db_session)
+
+    assert [hit.company for hit in service.search("spark").hits] == ["Globex"]
+    assert [hit.company for hit in service.search("remote").hits] == ["Initech"]
+    all_statuses = service.search("pyth", status=None).hits
+    assert {hit.company for hit in all_statuses} == {"Acme Corp", "Hooli", "Globex"}
+
+
+def test_search_paginates_with_cursor(db_session):
+    _add_jobs(db_session)
+    service = JobService(db_session)
+
+    first = service.search("australia", limit=1)
+    second = service.search("australia", limit=1, cursor=first.next_cursor)
+
+    assert len(first.hits) == len(second.hits) == 1
+    assert first.next_cursor is not None
+    assert first.hits[0].rank <= second.hits[0].rank
+    assert first.hits[0].id != second.hits[0].id
+    assert second.next_cursor is None
+
+
+def test_search_index_follows_updates_and_deletes(db_session):
+    _add_jobs(db_session)
+    service = JobService(db_session)
+
+    job = db_session.query(Job).filter(Job.company == "Initech").one()
+    job.title = "Kotlin Engineer"
+    db_session.flush()
+
+    assert service.search("java").hits == []
+    assert [hit.id for hit in service.search("kotlin").hits] == [job.id]
+
+    service.delete_job(job.id)
+    assert service.search("kotlin").hits == []
+
+
+def test_search_index_follows_core_writes_to_job_content(db_session):
+    _add_jobs(db_session)
+    service = JobService(db_session)
+    job = db_session.query(Job).filter(Job.company == "Initech").one()
+    content = job.content
+
+    db_session.execute(
+        update(JobContent)
+        .where(JobContent.job_id == job.id)
+        .values(description_data=compress_text("Kotlin microservices.", content.codec))
+    )
+
+    assert service.search("spring").hits == []
+    assert [hit.id for hit in service.search("kotlin").hits] == [job.id]
+
+    db_session.execute(delete(JobContent).where(JobContent.job_id == job.id))
+    assert service.search("kotlin").hits == []
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from src.ai.json_stream import JSONStreamValidator, MalformedJSONError
+
+
+def _feed(text, max_items=None, step=3):
+    validator = JSONStreamValidator(max_items=max_items)
+    for start in range(0, len(text), step):
+        if validator.feed(text[start : start + step]):
+            break
+    return validator
+
+
+def test_complete_document_is_passed_through():
+    text = '{"12": {"skills": ["c++", "say \\"hi\\""]}, "13": {"skills": []}}'
+    validator = _feed(text)
+
+    assert validator.done and not validator.truncated
+    assert json.loads(validator.text) == json.loads(text)
+
+
+def test_stops_at_max_items_with_a_closed_prefix():
+    validator = _feed('{"skills": ["python", "sql", "go", "rust"], "x": 1}', 2)
+
+    assert validator.truncated
+    assert json.loads(validator.text) == {"skills": ["python", "sql"]}
+    assert json.loads(_feed('{"n": [1, 22, 333]}', 2).text) == {"n": [1, 22]}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'Sure! Here are the skills: {"skills": []}',
+        '{"skills": ["python",, "sql"]}',
+        '{"skills": tru}',
+        '{"skills" ["python"]}',
+        "{" + "\n" * 100,
+    ],
+)
+def test_malformed_output_is_rejected_early(text):
+    with pytest.raises(MalformedJSONError):
+        _feed(text)
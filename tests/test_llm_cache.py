@@ -0,0 +1,128 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.ai.llm_client import MODEL_KEY, LLMClient
+from src.ai.response_cache import LLMResponseCache, cache_key
+
+
+def test_cache_key_normalizes_whitespace_and_separates_model_and_version():
+    key = cache_key("llama3", "1", "Extract skills:\n  Python   and SQL ")
+    assert key == cache_key("llama3", "1", "Extract skills: Python and SQL")
+    assert key != cache_key("mistral", "1", "Extract skills: Python and SQL")
+    assert key != cache_key("llama3", "2", "Extract skills: Python and SQL")
+    assert key != cache_key("llama3", "1", "Extract skills: Python and SQL", {})
+    assert key != cache_key("llama3", "1", "Extract skills: Python and SQL", None, 5)
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "llm_cache.db"
+    cache = LLMResponseCache(path)
+    cache.put("a", {"skills": ["python"]})
+    cache.close()
+
+    reopened = LLMResponseCache(path)
+    assert reopened.get("a") == {"skills": ["python"]}
+    assert reopened.get("missing") is None
+
+
+def test_cache_evicts_expired_and_least_recently_used(tmp_path, monkeypatch):
+    cache = LLMResponseCache(tmp_path / "llm_cache.db", max_entries=2, max_age_days=1)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now - 2 * 86_400)
+    cache.put("stale", {"skills": []})
+    monkeypatch.setattr(time, "time", lambda: now)
+    assert cache.get("stale") is None
+
+    cache.put("a", {"skills": ["a"]})
+    monkeypatch.setattr(time, "time", lambda: now + 1)
+    cache.put("b", {"skills": ["b"]})
+    monkeypatch.setattr(time, "time", lambda: now + 2)
+    cache.get("a")
+    monkeypatch.setattr(time, "time", lambda: now + 3)
+    cache.put("c", {"skills": ["c"]})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"skills": ["a"]}
+
+
+def test_concurrent_identical_requests_share_one_call(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm_cache.db")
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"skills": ["python"]}
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_compute("key", compute))
+        )
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"skills": ["python"]}] * 4
+
+
+def test_failed_responses_are_not_cached(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm_cache.db")
+
+    assert cache.get_or_compute("key", lambda: None) is None
+    assert cache.get_or_compute("key", lambda: {"skills": []}) == {"skills": []}
+
+
+def test_llm_client_answers_duplicate_prompts_from_cache(tmp_path):
+    calls = []
+
+    def chat(model, messages, format, stream, keep_alive=None):
+        calls.append(messages[0]["content"])
+        return iter([{"message": {"content": '{"skills": ["Python"]}'}}])
+
+    client = LLMClient(
+        "llama3",
+        cache=LLMResponseCache(tmp_path / "llm_cache.db"),
+        client=SimpleNamespace(chat=chat),
+    )
+
+    expected = {"skills": ["Python"], MODEL_KEY: "llama3"}
+    assert client.generate_json("We need Python.", "1") == expected
+    assert client.generate_json("We  need\nPython.", "1") == expected
+    assert len(calls) == 1
+    client.generate_json("We need Python.", "2")
+    assert len(calls) == 2
+
+
+def test_llm_client_caches_only_validated_responses_per_constraints(tmp_path):
+    calls = []
+
+    def chat(model, messages, format, stream, keep_alive=None):
+        calls.append(format)
+        return iter([{"message": {"content": '{"skills": ["Python"]}'}}])
+
+    client = LLMClient(
+        "llama3",
+        cache=LLMResponseCache(tmp_path / "llm_cache.db"),
+        client=SimpleNamespace(chat=chat),
+    )
+
+    client.generate_json("We need Python.", "1", validate=lambda reply: False)
+    client.generate_json("We need Python.", "1", validate=lambda reply: False)
+    assert len(calls) == 2
+
+    schema = {"type": "object"}
+    client.generate_json("We need Python.", "1", schema=schema)
+    client.generate_json("We need Python.", "1", schema=schema, max_items=5)
+    client.generate_json("We need Python.", "1", schema=schema)
+    assert calls[2:] == [schema, schema]
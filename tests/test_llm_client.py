@@ -0,0 +1,218 @@
+import json
+
+from src.ai.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.ai.llm_client import MODEL_KEY, LLMClient
+from src.config import settings
+from src.database.models import EnrichmentTask, Job
+from src.services.job_service import JobService
+from src.services.skill_service import SkillService, is_confident_skill_response
+
+
+class _FakeOllama:
+    def __init__(self, replies, calls):
+        self.replies = replies
+        self.calls = calls
+
+    def chat(self, model, messages, format, stream, keep_alive=None):
+        self.calls.append(model)
+        reply = self.replies[model]
+        if isinstance(reply, Exception):
+            raise reply
+        text = reply if isinstance(reply, str) else json.dumps(reply)
+        # Streamed a few characters at a time, like Ollama.
+        for start in range(0, len(text), 4):
+            yield {"message": {"content": text[start : start + 4]}}
+        yield {"message": {"content": ""}, "done": True}
+
+
+def test_cascade_keeps_cheap_answer_when_it_validates():
+    calls = []
+    replies = {"small": {"skills": ["python", "sql"]}, "large": {"skills": ["x"]}}
+    client = LLMClient(models=["small", "large"], client=_FakeOllama(replies, calls))
+
+    response = client.generate_json("prompt", validate=is_confident_skill_response)
+
+    assert response == {"skills": ["python", "sql"], MODEL_KEY: "small"}
+    assert calls == ["small"]
+
+
+def test_cascade_escalates_on_low_confidence_or_errors():
+    calls = []
+    replies = {
+        "tiny": RuntimeError("model not loaded"),
+        "small": {"skills": ["python"]},
+        "large": {"skills": ["python", "django"]},
+    }
+    client = LLMClient(
+        models=["tiny", "small", "large"], client=_FakeOllama(replies, calls)
+    )
+
+    response = client.generate_json("prompt", validate=is_confident_skill_response)
+
+    assert response[MODEL_KEY] == "large"
+    assert calls == ["tiny", "small", "large"]
+
+
+def test_cascade_falls_back_to_last_answer():
+    replies = {"small": {"skills": []}, "large": {"skills": ["python"]}}
+    client = LLMClient(models=["small", "large"], client=_FakeOllama(replies, []))
+
+    response = client.generate_json("prompt", validate=is_confident_skill_response)
+
+    assert response == {"skills": ["python"], MODEL_KEY: "large"}
+
+
+def test_confident_response_rejects_copied_sentences():
+    assert is_confident_skill_response({"skills": ["python", "sql"]})
+    assert not is_confident_skill_response({"skills": ["python"]})
+    assert not is_confident_skill_response(
+        {"skills": ["python", "you will work closely with stakeholders " * 3]}
+    )
+    assert not is_confident_skill_response({"skills": "python"})
+
+
+def test_serving_tier_is_recorded_per_job(db_session):
+    replies = {"small": {"skills": ["python"]}, "large": {"skills": ["python", "sql"]}}
+    job = Job(
+        company="Acme Corp",
+        title="Data Engineer",
+        url="https://jobs.example.com/acme/tiers",
+        description="We need Python and SQL.",
+    )
+    job.enrichment_task = EnrichmentTask()
+    db_session.add(job)
+    db_session.flush()
+
+    client = LLMClient(models=["small", "large"], client=_FakeOllama(replies, []))
+    SkillService(db_session, client).extract_and_save_skills(job.id)
+
+    db_session.refresh(job.enrichment_task)
+    assert job.enrichment_task.served_by == "large"
+    assert sorted(skill.skill_name for skill in job.skills) == ["python", "sql"]
+
+
+def test_transient_failures_are_retried(monkeypatch):
+    calls = []
+    attempts = iter([ConnectionError("refused"), {"skills": ["python", "sql"]}])
+
+    class Flaky(_FakeOllama):
+        def chat(self, model, messages, format, stream, keep_alive=None):
+            self.replies[model] = next(attempts)
+            return super().chat(model, messages, format, stream, keep_alive)
+
+    monkeypatch.setattr("src.ai.llm_client.time.sleep", lambda seconds: None)
+    client = LLMClient(
+        models=["small"], client=Flaky({}, calls), max_retries=2, retry_base_seconds=0
+    )
+
+    assert client.generate_json("prompt")["skills"] == ["python", "sql"]
+    assert calls == ["small", "small"]
+    assert client.circuit_breaker.state == CLOSED
+
+
+def test_open_circuit_fails_fast_and_pauses_enrichment(db_session):
+    calls = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    client = LLMClient(
+        models=["small", "large"],
+        client=_FakeOllama({"small": TimeoutError("timed out")}, calls),
+        circuit_breaker=breaker,
+        max_retries=5,
+        retry_base_seconds=0,
+    )
+
+    assert client.generate_json("prompt") is None
+    assert calls == ["small", "small"]
+    assert breaker.state == OPEN
+    assert not client.available()
+
+    job = Job(
+        company="Acme Corp",
+        title="Data Engineer",
+        url="https://jobs.example.com/acme/paused",
+        description="We need Python.",
+    )
+    job.enrichment_task = EnrichmentTask()
+    db_session.add(job)
+    db_session.flush()
+    skill_service = SkillService(db_session, client)
+
+    assert JobService(db_session).process_new_jobs_with_ai(skill_service) == 0
+    assert job.enrichment_task.attempts == 0
+
+
+def test_circuit_half_opens_after_reset():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_non_transient_error_settles_half_open_probe():
+    class Rejecting(_FakeOllama):
+        def generate(self, model, keep_alive=None):
+            raise ValueError("bad request")
+
+        def embed(self, model, input, keep_alive=None):
+            raise ValueError("bad request")
+
+    for call in ("warm_up", "embed"):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        client = LLMClient(
+            models=["small"], client=Rejecting({}, []), circuit_breaker=breaker
+        )
+
+        if call == "warm_up":
+            assert not client.warm_up()
+        else:
+            assert client.embed(["text"]) is None
+        assert breaker.state == CLOSED
+
+
+def test_warm_up_loads_first_model_with_keep_alive(monkeypatch):
+    loads = []
+
+    class Loader(_FakeOllama):
+        def generate(self, model, keep_alive=None):
+            loads.append((model, keep_alive))
+
+    monkeypatch.setattr(settings, "llm_keep_alive", "15m")
+    client = LLMClient(models=["small", "large"], client=Loader({}, []))
+
+    assert client.warm_up()
+    assert loads == [("small", "15m")]
+
+
+def test_streamed_reply_is_cut_off_at_max_items(monkeypatch):
+    chunks = []
+
+    class Counting(_FakeOllama):
+        def chat(self, model, messages, format, stream, keep_alive=None):
+            assert format == {"type": "object"} and stream
+            for chunk in super().chat(model, messages, format, stream, keep_alive):
+                chunks.append(chunk)
+                yield chunk
+
+    skills = [f"skill{number}" for number in range(50)]
+    client = LLMClient(
+        models=["small"], client=Counting({"small": {"skills": skills}}, [])
+    )
+
+    response = client.generate_json("prompt", schema={"type": "object"}, max_items=3)
+
+    assert response["skills"] == ["skill0", "skill1", "skill2"]
+    assert len(chunks) < len(json.dumps({"skills": skills})) // 4
+
+
+def test_malformed_stream_is_aborted_and_escalated():
+    calls = []
+    replies = {"small": "I think the skills are python", "large": {"skills": ["go"]}}
+    client = LLMClient(models=["small", "large"], client=_FakeOllama(replies, calls))
+
+    assert client.generate_json("prompt") == {"skills": ["go"], MODEL_KEY: "large"}
+    assert calls == ["small", "large"]
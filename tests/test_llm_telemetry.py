@@ -0,0 +1,135 @@
+import json
+
+import ollama
+from sqlalchemy import select
+
+from src.ai import telemetry
+from src.ai.circuit_breaker import CircuitBreaker
+from src.ai.llm_client import LLMClient
+from src.ai.response_cache import LLMResponseCache
+from src.ai.telemetry import LLMCallRecord, LLMTelemetry, classify_error
+from src.database.models import LLMCall
+
+
+class _FakeOllama:
+    def __init__(self, replies):
+        self.replies = replies
+
+    def chat(self, model, messages, format, stream, keep_alive=None):
+        reply = self.replies[model]
+        if isinstance(reply, Exception):
+            raise reply
+        yield {"message": {"content": reply}}
+        yield {
+            "message": {"content": ""},
+            "done": True,
+            "load_duration": 5_000_000,
+            "prompt_eval_count": 120,
+            "prompt_eval_duration": 40_000_000,
+            "eval_count": 30,
+            "eval_duration": 300_000_000,
+        }
+
+
+def test_records_latency_tokens_and_outcomes_per_model():
+    replies = {
+        "small": json.dumps({"skills": []}),
+        "large": json.dumps({"skills": ["python"]}),
+    }
+    recorder = LLMTelemetry(persist=False)
+    client = LLMClient(
+        models=["small", "large"], telemetry=recorder, client=_FakeOllama(replies)
+    )
+
+    client.generate_json("prompt", validate=lambda response: bool(response["skills"]))
+
+    stats = recorder.snapshot()
+    assert stats["small"].outcomes == {telemetry.VALIDATION_FAILED: 1}
+    assert stats["large"].outcomes == {telemetry.OK: 1}
+    assert stats["large"].prompt_tokens == 120
+    assert stats["large"].completion_tokens == 30
+    assert stats["large"].mean_load_ms == 5
+    assert stats["large"].completion_tokens_per_second == 100
+    assert sum(stats["large"].latency_histogram.values()) == 1
+    assert stats["large"].prompt_token_histogram["<=128"] == 1
+
+
+def test_metrics_are_read_past_padding_after_the_document():
+    class Padded(_FakeOllama):
+        def chat(self, model, messages, format, stream, keep_alive=None):
+            chunks = list(super().chat(model, messages, format, stream, keep_alive))
+            padding = [{"message": {"content": "\n"}}] * 5
+            return iter([chunks[0], *padding, chunks[-1]])
+
+    recorder = LLMTelemetry(persist=False)
+    client = LLMClient(
+        models=["small"],
+        telemetry=recorder,
+        client=Padded({"small": json.dumps({"skills": ["python"]})}),
+    )
+
+    assert client.generate_json("prompt")["skills"] == ["python"]
+    assert recorder.snapshot()["small"].completion_tokens == 30
+
+
+def test_failures_are_classified():
+    replies = {
+        "missing": ollama.ResponseError("model not found", 404),
+        "broken": ollama.ResponseError("internal error", 500),
+        "down": ConnectionError("connection refused"),
+        "garbled": "{not json",
+    }
+    recorder = LLMTelemetry(persist=False)
+    client = LLMClient(
+        models=list(replies),
+        telemetry=recorder,
+        client=_FakeOllama(replies),
+        circuit_breaker=CircuitBreaker(failure_threshold=10),
+        max_retries=0,
+    )
+
+    assert client.generate_json("prompt") is None
+
+    outcomes = {model: stats.outcomes for model, stats in recorder.snapshot().items()}
+    assert outcomes == {
+        "missing": {telemetry.MODEL_NOT_FOUND: 1},
+        "broken": {telemetry.SERVER_ERROR: 1},
+        "down": {telemetry.CONNECTION_ERROR: 1},
+        "garbled": {telemetry.INVALID_JSON: 1},
+    }
+    assert classify_error(TimeoutError("slow")) == telemetry.TIMEOUT
+
+
+def test_cache_hits_are_recorded(tmp_path):
+    recorder = LLMTelemetry(persist=False)
+    cache = LLMResponseCache(str(tmp_path / "cache.db"))
+    client = LLMClient(
+        models=["small"],
+        cache=cache,
+        telemetry=recorder,
+        client=_FakeOllama({"small": json.dumps({"skills": ["go"]})}),
+    )
+
+    client.generate_json("prompt")
+    client.generate_json("prompt")
+    cache.close()
+
+    assert recorder.snapshot()["small"].outcomes == {
+        telemetry.OK: 1,
+        telemetry.CACHE_HIT: 1,
+    }
+
+
+def test_flush_persists_buffered_calls(db_session):
+    recorder = LLMTelemetry(persist=True)
+    recorder.record(LLMCallRecord("small", telemetry.OK, 12.5, prompt_tokens=10))
+    recorder.record(LLMCallRecord("small", telemetry.TIMEOUT, 30_000.0))
+
+    assert recorder.flush(db_session) == 2
+    assert recorder.flush(db_session) == 0
+    rows = db_session.scalars(select(LLMCall).order_by(LLMCall.id)).all()
+    assert [(row.outcome, row.prompt_tokens) for row in rows] == [
+        (telemetry.OK, 10),
+        (telemetry.TIMEOUT, None),
+    ]
+    assert recorder.snapshot()["small"].calls == 2
@@ -0,0 +1,122 @@
+import pytest
+
+from src.database.models import Job, Location
+from src.services.job_service import JobService
+from src.services.location_service import (
+    LocationService,
+    ParsedLocation,
+    parse_location,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Brisbane QLD 4000", ("Brisbane", "Queensland", "Australia", False)),
+        (
+            "Brisbane, Queensland, Australia",
+            ("Brisbane", "Queensland", "Australia", False),
+        ),
+        ("Greater Brisbane Area", ("Brisbane", "Queensland", "Australia", False)),
+        (
+            "Perth, Western Australia, Australia",
+            ("Perth", "Western Australia", "Australia", False),
+        ),
+        ("Sydney NSW (Remote)", ("Sydney", "New South Wales", "Australia", True)),
+        ("Remote - US", ("", "", "United States", True)),
+        ("Seattle, WA", ("Seattle", "WA", "", False)),
+        ("Australia", ("", "", "Australia", False)),
+    ],
+)
+def test_parse_location_normalizes_variants(raw, expected):
+    assert parse_location(raw) == ParsedLocation(*expected)
+
+
+def test_parse_location_ignores_blank_values():
+    assert parse_location(None) is None
+    assert parse_location("   ") is None
+
+
+def test_resolve_id_shares_rows_and_only_caches_committed_ids(db_session):
+    service = LocationService(db_session)
+
+    first = service.resolve_id("Brisbane QLD")
+    assert service.resolve_id("Brisbane, Queensland, Australia") == first
+    db_session.rollback()
+
+    assert db_session.query(Location).count() == 0
+    second = service.resolve_id("Brisbane")
+    db_session.commit()
+
+    assert db_session.get(Location, second).label == "Brisbane, Queensland, Australia"
+    assert service.resolve_id("Remote - US") != second
+    assert db_session.query(Location).count() == 2
+
+
+def test_upsert_assigns_location_and_filters_use_it(db_session):
+    service = JobService(db_session)
+    for index, location in enumerate(
+        ["Brisbane QLD", "Sydney, Australia", "Remote - US", None]
+    ):
+        service.upsert_job(
+            {
+                "company": "Acme Corp",
+                "title": f"Engineer {index}",
+                "url": f"https://jobs.example.com/acme/{index}",
+                "location": location,
+            }
+        )
+    db_session.flush()
+
+    locations = LocationService(db_session)
+    australia = locations.matching_ids("Australia")
+    queensland = locations.matching_ids("QLD")
+
+    assert {row.title for row in service.list_active_jobs(location_ids=australia)} == {
+        "Engineer 0",
+        "Engineer 1",
+    }
+    assert [
+        row.title for row in service.list_active_jobs(location_ids=queensland)
+    ] == ["Engineer 0"]
+    assert locations.matching_ids("Mars") == []
+
+    service.upsert_job(
+        {"url": "https://jobs.example.com/acme/0", "location": "Remote - US"}
+    )
+    db_session.flush()
+    assert service.list_active_jobs(location_ids=queensland) == []
+
+
+def test_cleanup_backfills_and_keeps_location_variants(db_session):
+    db_session.add_all(
+        [
+            Job(company="Acme Corp", title="Brisbane", location="Brisbane QLD"),
+            Job(company="Acme Corp", title="Perth", location="Perth WA 6000"),
+            Job(company="Acme Corp", title="Seattle", location="Seattle, WA"),
+            Job(company="Acme Corp", title="Nowhere", location=None),
+        ]
+    )
+    db_session.flush()
+
+    deleted = JobService(db_session).cleanup_jobs(location_filter="Australia")
+
+    assert deleted == 2
+    remaining = db_session.query(Job).order_by(Job.title).all()
+    assert [job.title for job in remaining] == ["Brisbane", "Perth"]
+    assert all(job.location_id is not None for job in remaining)
+
+
+def test_cleanup_keeps_everything_when_no_location_matches(db_session):
+    db_session.add_all(
+        [
+            Job(company="Acme Corp", title="Brisbane", location="Brisbane QLD"),
+            Job(company="Acme Corp", title="Nowhere", location=None),
+        ]
+    )
+    db_session.flush()
+
+    deleted = JobService(db_session).cleanup_jobs(location_filter="Atlantis")
+
+    assert deleted == 0
+    assert db_session.query(Job).count() == 2
@@ -0,0 +1,73 @@
+from src.ai.preprocessing import chunk_description, clean_description, estimate_tokens
+
+DESCRIPTION = """
+About the role
+We are hiring a   Data Engineer to build pipelines.
+
+Requirements:
+- Python and SQL
+- Airflow
+- Python and SQL
+
+Benefits
+- Free lunch
+- Gym membership
+
+What you'll do
+Own our AWS data platform.
+
+Acme is an equal opportunity employer and values diversity.
+"""
+
+
+def test_clean_description_strips_boilerplate_and_duplicates():
+    assert clean_description(DESCRIPTION) == (
+        "About the role\n"
+        "We are hiring a Data Engineer to build pipelines.\n"
+        "Requirements:\n"
+        "- Python and SQL\n"
+        "- Airflow\n"
+        "What you'll do\n"
+        "Own our AWS data platform."
+    )
+    assert clean_description(None) == ""
+
+
+def test_boilerplate_section_ends_at_blank_line_or_heading():
+    text = (
+        "Salary\n"
+        "\n"
+        "$120k plus super\n"
+        "\n"
+        "You will write Python and Terraform every day.\n"
+        "Benefits\n"
+        "- Free lunch\n"
+        "Kubernetes experience essential\n"
+        "Experience with dbt is a plus."
+    )
+
+    assert clean_description(text) == (
+        "You will write Python and Terraform every day.\n"
+        "Kubernetes experience essential\n"
+        "Experience with dbt is a plus."
+    )
+
+
+def test_chunk_description_respects_budget():
+    text = "\n".join(f"Line {index} mentions Python and SQL." for index in range(100))
+
+    chunks = chunk_description(text, token_budget=100)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 101 for chunk in chunks)
+    assert "\n".join(chunks) == text
+    assert chunk_description("short", token_budget=100) == ["short"]
+
+
+def test_chunk_description_splits_long_lines_on_words():
+    text = " ".join(["kubernetes"] * 200)
+
+    chunks = chunk_description(text, token_budget=50)
+
+    assert len(chunks) > 1
+    assert " ".join(chunks) == text
@@ -0,0 +1,189 @@
+import math
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+
+from src.ai.llm_client import LLMClient
+from src.database.models import Job
+from src.services.job_service import JobService
+from src.services.relevance_index import SKILL_PREFIX, RelevanceIndex, tokenize
+from src.services.skill_service import SkillService
+
+_CORPUS = {
+    1: ("Data Engineer", "Python and SQL pipelines. Python every day.", ["Python"]),
+    2: ("Backend Engineer", "Go services with some Python.", ["Go"]),
+    3: ("Analyst", "SQL reporting for the sales team.", []),
+    4: ("Sales Lead", "Grow sales across the region.", []),
+}
+
+
+def _brute_force_bm25(query: list[str], k1: float = 1.2, b: float = 0.75):
+    docs = {
+        job_id: Counter(
+            tokenize(title)
+            + tokenize(description)
+            + [SKILL_PREFIX + name.lower() for name in skills]
+        )
+        for job_id, (title, description, skills) in _CORPUS.items()
+    }
+    average = sum(doc.total() for doc in docs.values()) / len(docs)
+    scores = {}
+    for job_id, doc in docs.items():
+        score = 0.0
+        for term in query:
+            tf = doc[term]
+            if not tf:
+                continue
+            df = sum(term in other for other in docs.values())
+            idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+            norm = k1 * (1 - b + b * doc.total() / average)
+            score += idf * tf * (k1 + 1) / (tf + norm)
+        if score:
+            scores[job_id] = score
+    return scores
+
+
+def _index(path=None) -> RelevanceIndex:
+    index = RelevanceIndex(path, k1=1.2, b=0.75)
+    for job_id, (title, description, skills) in _CORPUS.items():
+        index.add_job(job_id, title, description, skills)
+    return index
+
+
+def test_scores_match_brute_force_bm25_with_contributions():
+    index = _index()
+
+    matches = index.score("python sql", k=10)
+
+    expected = _brute_force_bm25(
+        ["python", SKILL_PREFIX + "python", "sql", SKILL_PREFIX + "sql"]
+    )
+    assert {match.job_id: match.score for match in matches} == pytest.approx(expected)
+    assert [match.job_id for match in matches] == sorted(
+        expected, key=lambda job_id: -expected[job_id]
+    )
+    top = matches[0]
+    assert top.job_id == 1
+    assert set(top.contributions) == {"python", SKILL_PREFIX + "python", "sql"}
+    assert sum(top.contributions.values()) == pytest.approx(top.score)
+    assert list(top.contributions.values()) == sorted(
+        top.contributions.values(), reverse=True
+    )
+
+
+def test_score_limits_candidates_and_top_k():
+    index = _index()
+
+    assert [match.job_id for match in index.score("sql", k=1)] == [3]
+    assert [match.job_id for match in index.score("sql", job_ids=[1, 4])] == [1]
+    assert [match.job_id for match in index.score(skills=["Go"])] == [2]
+    assert index.score("kubernetes") == []
+
+
+def test_remove_jobs_and_reopen(tmp_path):
+    path = tmp_path / "relevance.npz"
+    index = _index(path)
+    index.remove_jobs([1])
+    index.add_job(3, "Analyst", "SQL and Python reporting.", ["SQL"])
+    index.add_job(5, "Data Analyst", "Python, SQL and sales data.", [])
+    index.save()
+
+    reopened = RelevanceIndex(path)
+
+    assert reopened.job_ids() == {2, 3, 4, 5}
+    assert [match.job_id for match in reopened.score("go")] == [2]
+    # The postings rebuilt on load agree with the incrementally merged ones.
+    for query in ("python", "sql sales", "engineer data", "grow region"):
+        assert reopened.score(query) == pytest.approx(index.score(query))
+
+
+def _add_job(db_session, title: str, description: str) -> Job:
+    job = Job(
+        company="Acme Corp",
+        title=title,
+        url=f"https://jobs.example.com/acme/{title.lower().replace(' ', '-')}",
+        description=description,
+    )
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def test_refresh_catches_up_incrementally(db_session, tmp_path):
+    path = tmp_path / "relevance.npz"
+    engineer = _add_job(db_session, "Data Engineer", "Pipelines in Python.")
+    analyst = _add_job(db_session, "Analyst", "Reporting in SQL.")
+    index = RelevanceIndex(path)
+    index.refresh(db_session)
+    assert index.job_ids() == {engineer.id, analyst.id}
+
+    backend = _add_job(db_session, "Backend Engineer", "APIs and services.")
+    analyst.status = "archived"
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Kubernetes"]}
+    SkillService(db_session, llm_client).extract_and_save_skills(backend.id)
+    db_session.flush()
+    index.refresh(db_session)
+
+    assert index.job_ids() == {engineer.id, backend.id}
+    (match,) = index.score(skills=["kubernetes"])
+    assert match.job_id == backend.id
+    assert list(match.contributions) == [SKILL_PREFIX + "kubernetes"]
+    assert RelevanceIndex(path).job_ids() == {engineer.id, backend.id}
+
+
+def test_rank_jobs_by_relevance_returns_rows(db_session, tmp_path):
+    engineer = _add_job(db_session, "Data Engineer", "Python and SQL.")
+    scientist = _add_job(db_session, "Data Scientist", "Python models.")
+    _add_job(db_session, "Office Manager", "Keeps the office running.")
+    service = JobService(db_session)
+    index = RelevanceIndex(tmp_path / "relevance.npz")
+
+    ranked = service.rank_jobs_by_relevance("python sql", index=index)
+
+    assert [job.id for job in ranked] == [engineer.id, scientist.id]
+    assert ranked[0].title == "Data Engineer"
+    assert set(ranked[0].contributions) == {"python", "sql"}
+    limited = service.rank_jobs_by_relevance(
+        "python", job_ids=[scientist.id], index=index
+    )
+    assert [job.id for job in limited] == [scientist.id]
+
+
+def test_refresh_skips_the_scan_while_the_probe_is_unchanged(db_session, tmp_path):
+    _add_job(db_session, "Data Engineer", "Pipelines in Python.")
+    index = RelevanceIndex(tmp_path / "relevance.npz")
+    index.refresh(db_session)
+    statements = []
+
+    @event.listens_for(db_session.bind, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    try:
+        index.refresh(db_session)
+        assert len(statements) == 2
+        analyst = _add_job(db_session, "Analyst", "Reporting in SQL.")
+        statements.clear()
+        index.refresh(db_session)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", count)
+
+    assert len(statements) > 2
+    assert analyst.id in index.job_ids()
+
+
+def test_refresh_reindexes_edited_descriptions(db_session, tmp_path):
+    engineer = _add_job(db_session, "Data Engineer", "Pipelines in Python.")
+    index = RelevanceIndex(tmp_path / "relevance.npz")
+    index.refresh(db_session)
+    assert [match.job_id for match in index.score("python")] == [engineer.id]
+
+    engineer.description = "Pipelines in Rust."
+    db_session.flush()
+    index.refresh(db_session)
+
+    assert index.score("python") == []
+    assert [match.job_id for match in index.score("rust")] == [engineer.id]
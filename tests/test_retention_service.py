@@ -0,0 +1,176 @@
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from src.database.models import Application, Job, JobContent, JobSkill, Skill
+from src.services.retention_service import RetentionPolicy, RetentionService
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def _add_job(db_session, title: str, **fields) -> Job:
+    fields.setdefault("scraped_at", datetime(2024, 5, 30, 9, 0, 0))
+    job = Job(
+        company="Acme Corp",
+        title=title,
+        url=f"https://jobs.example.com/acme/{title.lower().replace(' ', '-')}",
+        **fields,
+    )
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def _titles(db_session) -> set[str]:
+    return {job.title for job in db_session.query(Job).all()}
+
+
+def test_policy_rules_select_matching_jobs(db_session):
+    _add_job(db_session, "Fresh")
+    _add_job(db_session, "Old", scraped_at=datetime(2024, 1, 1, 9, 0, 0))
+    _add_job(db_session, "Expired", deadline=date(2024, 5, 1))
+    _add_job(db_session, "Archived", status="archived")
+    _add_job(db_session, "Overseas", location="Remote - US")
+    _add_job(db_session, "Local", location="Brisbane, Australia")
+
+    policy = RetentionPolicy(
+        max_age_days=90,
+        drop_past_deadline=True,
+        statuses=("archived",),
+    )
+    result = RetentionService(db_session, chunk_size=2).run(policy, now=NOW)
+
+    assert result.deleted == 3
+    assert result.chunks == 2
+    assert _titles(db_session) == {"Fresh", "Overseas", "Local"}
+
+    location_policy = RetentionPolicy(keep_location="Australia")
+    RetentionService(db_session).run(location_policy, now=NOW)
+
+    assert _titles(db_session) == {"Local"}
+
+
+def test_policy_without_rules_is_a_no_op(db_session):
+    _add_job(db_session, "Fresh")
+
+    result = RetentionService(db_session).run(RetentionPolicy(), now=NOW)
+
+    assert result == (0, 0, 0)
+    assert _titles(db_session) == {"Fresh"}
+
+
+def test_retention_removes_child_rows_and_protects_applications(db_session):
+    skill = Skill(skill_name="python")
+    old = _add_job(
+        db_session,
+        "Old",
+        scraped_at=datetime(2024, 1, 1, 9, 0, 0),
+        description="Old description",
+    )
+    tracked = _add_job(db_session, "Tracked", scraped_at=datetime(2024, 1, 1, 9, 0, 0))
+    db_session.add_all(
+        [
+            skill,
+            JobSkill(job=old, skill=skill),
+            Application(job_id=tracked.id, status="applied"),
+        ]
+    )
+    db_session.flush()
+
+    RetentionService(db_session).run(RetentionPolicy(max_age_days=30), now=NOW)
+
+    assert _titles(db_session) == {"Tracked"}
+    assert db_session.query(JobSkill).count() == 0
+    assert db_session.query(JobContent).count() == 0
+    assert db_session.query(Application).count() == 1
+    assert db_session.query(Skill).count() == 1
+
+    unprotected = RetentionPolicy(max_age_days=30, protect_applications=False)
+    RetentionService(db_session).run(unprotected, now=NOW)
+
+    assert _titles(db_session) == set()
+    assert db_session.query(Application).count() == 0
+
+
+def test_retention_copies_chunks_to_archive_database(db_session, tmp_path):
+    archive_path = tmp_path / "archive.db"
+    skill = Skill(skill_name="python")
+    old = _add_job(
+        db_session,
+        "Old",
+        scraped_at=datetime(2024, 1, 1, 9, 0, 0),
+        description="Old description",
+    )
+    _add_job(db_session, "Fresh")
+    db_session.add_all([skill, JobSkill(job=old, skill=skill)])
+    db_session.flush()
+
+    service = RetentionService(db_session, archive_path=str(archive_path))
+    result = service.run(RetentionPolicy(max_age_days=30), now=NOW)
+
+    assert result.deleted == 1
+    assert result.archived == 1
+    assert _titles(db_session) == {"Fresh"}
+
+    with sqlite3.connect(archive_path) as archive:
+        assert archive.execute("SELECT title FROM jobs").fetchall() == [("Old",)]
+        assert archive.execute("SELECT count(*) FROM job_content").fetchone() == (1,)
+        assert archive.execute("SELECT skill_name FROM skills").fetchall() == [
+            ("python",)
+        ]
+        assert archive.execute("SELECT count(*) FROM job_skills").fetchone() == (1,)
+
+
+def test_retention_replaces_archived_rows_under_a_reused_id(db_session, tmp_path):
+    archive_path = tmp_path / "archive.db"
+    old = _add_job(db_session, "Old", scraped_at=datetime(2024, 1, 1, 9, 0, 0))
+    db_session.commit()
+    service = RetentionService(db_session, archive_path=str(archive_path))
+    service._prepare_archive()
+    with sqlite3.connect(archive_path) as archive:
+        archive.execute(
+            "INSERT INTO jobs (id, company, title, url, status) "
+            "VALUES (?, 'Initech', 'Retired earlier', 'https://example.com/1', 'new')",
+            (old.id,),
+        )
+        archive.execute(
+            "INSERT INTO job_content (job_id, codec) VALUES (?, 'zlib')", (old.id,)
+        )
+
+    result = service.run(RetentionPolicy(max_age_days=30), now=NOW)
+
+    assert result.deleted == 1
+    assert result.archived == 1
+    with sqlite3.connect(archive_path) as archive:
+        assert archive.execute("SELECT title FROM jobs").fetchall() == [("Old",)]
+        assert archive.execute("SELECT count(*) FROM job_content").fetchone() == (0,)
+        tables = {
+            row[0]
+            for row in archive.execute("SELECT name FROM sqlite_master")
+            if row[0].startswith("jobs_fts")
+        }
+        assert tables == set()
+
+
+def test_deleted_job_ids_are_not_reused(db_session):
+    old = _add_job(db_session, "Old", scraped_at=datetime(2024, 1, 1, 9, 0, 0))
+    old_id = old.id
+    RetentionService(db_session).run(RetentionPolicy(max_age_days=30), now=NOW)
+
+    assert _add_job(db_session, "New").id > old_id
+
+
+def test_failed_chunk_is_rolled_back_and_raised(db_session, tmp_path, monkeypatch):
+    _add_job(db_session, "Old", scraped_at=datetime(2024, 1, 1, 9, 0, 0))
+    db_session.commit()
+    service = RetentionService(db_session, archive_path=str(tmp_path / "archive.db"))
+
+    def fail(job_ids):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(service, "_copy_to_archive", fail)
+
+    with pytest.raises(sqlite3.OperationalError):
+        service.run(RetentionPolicy(max_age_days=30), now=NOW)
+    assert _titles(db_session) == {"Old"}
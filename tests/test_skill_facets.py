@@ -0,0 +1,182 @@
+from unittest.mock import Mock
+
+from sqlalchemy import event
+
+from src.ai.llm_client import LLMClient
+from src.database.models import CacheVersion, Job, Skill, SkillAlias
+from src.services.job_service import JobService
+from src.services.skill_facet_index import SkillFacetIndex
+from src.services.skill_service import SkillService
+from src.services.skill_taxonomy import TAXONOMY_CACHE, clear_alias_cache
+
+
+def _add_job(db_session, title: str, skills: list[str]) -> Job:
+    job = Job(
+        company="Acme Corp",
+        title=title,
+        url=f"https://jobs.example.com/acme/{title.lower().replace(' ', '-')}",
+        description=f"{title} role",
+    )
+    db_session.add(job)
+    db_session.flush()
+    if skills:
+        llm_client = Mock(spec=LLMClient)
+        llm_client.generate_json.return_value = {"skills": skills}
+        SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+        db_session.flush()
+    return job
+
+
+def _seed(db_session) -> dict[str, Job]:
+    return {
+        job.title: job
+        for job in (
+            _add_job(db_session, "Data Engineer", ["Python", "SQL", "Airflow"]),
+            _add_job(db_session, "Backend Engineer", ["Python", "Go"]),
+            _add_job(db_session, "Analyst", ["SQL"]),
+            _add_job(db_session, "Manager", []),
+        )
+    }
+
+
+def test_find_jobs_by_skills_combines_filters(db_session):
+    _seed(db_session)
+    service = JobService(db_session)
+
+    def titles(**filters) -> set[str]:
+        return {row.title for row in service.find_jobs_by_skills(**filters)}
+
+    assert titles(all_of=["python", "SQL"]) == {"Data Engineer"}
+    assert titles(any_of=["go", "airflow"]) == {"Data Engineer", "Backend Engineer"}
+    assert titles(none_of=["python"]) == {"Analyst", "Manager"}
+    assert titles(all_of=["sql"], none_of=["airflow"]) == {"Analyst"}
+    assert titles(all_of=["rust"]) == set()
+    assert len(titles()) == 4
+
+
+def test_find_jobs_by_skills_resolves_aliases(db_session):
+    _seed(db_session)
+    go = db_session.query(Skill).filter(Skill.skill_name == "go").one()
+    db_session.add(SkillAlias(alias="golang", skill_id=go.id))
+    db_session.flush()
+    clear_alias_cache()
+
+    rows = JobService(db_session).find_jobs_by_skills(all_of=["Golang"])
+
+    assert [row.title for row in rows] == ["Backend Engineer"]
+
+
+def test_facet_index_matches_and_counts(db_session):
+    jobs = _seed(db_session)
+    index = SkillFacetIndex()
+    index.refresh(db_session)
+
+    matched = index.match(all_of=["Python"])
+    assert index.job_ids(matched) == [
+        jobs["Backend Engineer"].id,
+        jobs["Data Engineer"].id,
+    ]
+    assert index.facet_counts(matched) == {
+        "python": 2,
+        "airflow": 1,
+        "go": 1,
+        "sql": 1,
+    }
+
+    everything = index.match()
+    assert everything.bit_count() == 4
+    assert index.facet_counts(everything, limit=2) == {"python": 2, "sql": 2}
+    assert index.job_ids(index.match(none_of=["python", "sql"])) == [jobs["Manager"].id]
+
+
+def test_facet_index_refresh_follows_database_changes(db_session):
+    jobs = _seed(db_session)
+    index = SkillFacetIndex()
+    index.refresh(db_session)
+
+    pending = _add_job(db_session, "Platform Engineer", [])
+    index.refresh(db_session)
+    assert index.match().bit_count() == 5
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Go", "Kubernetes"]}
+    SkillService(db_session, llm_client).extract_and_save_skills(pending.id)
+    db_session.flush()
+    index.refresh(db_session)
+    assert index.facet_counts(index.match(all_of=["go"])) == {
+        "go": 2,
+        "kubernetes": 1,
+        "python": 1,
+    }
+
+    service = JobService(db_session)
+    service.archive_job(jobs["Backend Engineer"].id)
+    service.delete_job(jobs["Analyst"].id)
+    index.refresh(db_session)
+
+    assert index.job_ids(index.match(any_of=["go", "sql"])) == [
+        pending.id,
+        jobs["Data Engineer"].id,
+    ]
+
+
+def test_facet_index_rebuilds_after_taxonomy_sync(db_session):
+    _seed(db_session)
+    index = SkillFacetIndex()
+    index.refresh(db_session)
+
+    go = db_session.query(Skill).filter(Skill.skill_name == "go").one()
+    go.skill_name = "golang"
+    db_session.add(CacheVersion(name=TAXONOMY_CACHE, version=1))
+    db_session.flush()
+    index.refresh(db_session)
+
+    assert index.facet_counts(index.match(any_of=["golang"])) == {
+        "golang": 1,
+        "python": 1,
+    }
+    assert index.match(any_of=["go"]) == 0
+
+
+def test_facet_index_uses_dense_positions_for_sparse_ids(db_session):
+    job = Job(
+        id=1_000_000,
+        company="Acme Corp",
+        title="Sparse Engineer",
+        url="https://jobs.example.com/acme/sparse",
+        description="Sparse role",
+    )
+    db_session.add(job)
+    db_session.flush()
+    newest = _add_job(db_session, "Data Engineer", ["Python"])
+    index = SkillFacetIndex()
+    index.refresh(db_session)
+
+    everything = index.match()
+    assert everything.bit_length() == 2
+    assert index.job_ids(everything) == [newest.id, job.id]
+    assert index.job_ids(index.match(all_of=["python"])) == [newest.id]
+
+
+def test_unchanged_index_refresh_skips_count_scans(db_session):
+    _seed(db_session)
+    index = SkillFacetIndex()
+    index.refresh(db_session)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        index.refresh(db_session)
+        assert len(statements) == 1
+
+        _add_job(db_session, "Platform Engineer", ["Go"])
+        statements.clear()
+        index.refresh(db_session)
+        assert len(statements) > 1
+        assert index.facet_counts(index.match(all_of=["go"])) == {"go": 2, "python": 1}
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,105 @@
+from unittest.mock import Mock
+
+from src.ai.llm_client import LLMClient
+from src.database.models import Job, JobSkill
+from src.services.skill_matcher import SkillMatcher
+from src.services.skill_service import SkillService
+from src.services.skill_taxonomy import SkillTaxonomyService
+
+MATCHER = SkillMatcher(
+    {
+        "python": "python",
+        "py": "python",
+        "sql": "sql",
+        "mysql": "mysql",
+        "sql server": "sql server",
+        "c++": "c++",
+        ".net": ".net",
+        "asp.net": ".net",
+        "go": "go",
+        "golang": "go",
+        "node.js": "node.js",
+    }
+)
+
+
+def test_matcher_finds_terms_on_word_boundaries():
+    matches = MATCHER.match("Python, MySQL and C++ on ASP.NET with Node.js.")
+
+    assert matches == {
+        "python": 1.0,
+        "mysql": 1.0,
+        "c++": 1.0,
+        ".net": 0.9,
+        "node.js": 1.0,
+    }
+    assert MATCHER.match("pythonic spy sqlite") == {}
+
+
+def test_matcher_finds_overlapping_terms():
+    assert MATCHER.match("Microsoft SQL Server") == {"sql server": 1.0, "sql": 1.0}
+
+
+def test_matcher_scores_ambiguous_terms_low_until_repeated():
+    assert MATCHER.match("A go-getter attitude") == {"go": 0.5}
+    assert MATCHER.match("Go services, go tooling, go modules") == {"go": 0.6}
+    assert MATCHER.match("Golang") == {"go": 0.9}
+
+
+def _create_job(db_session, description: str) -> Job:
+    job = Job(
+        company="Acme Corp",
+        title="Data Engineer",
+        url="https://jobs.example.com/acme/data-engineer",
+        description=description,
+    )
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def test_dictionary_matches_skip_the_llm(db_session):
+    SkillTaxonomyService(db_session).sync()
+    job = _create_job(db_session, "Build Python APIs on AWS with Postgres and Docker.")
+    llm_client = Mock(spec=LLMClient)
+
+    result = SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+
+    llm_client.generate_json.assert_not_called()
+    assert sorted(result) == ["aws", "docker", "postgresql", "python"]
+    confidences = {
+        link.skill.skill_name: link.confidence_score
+        for link in db_session.query(JobSkill).filter(JobSkill.job_id == job.id)
+    }
+    assert confidences == {
+        "python": 1.0,
+        "aws": 1.0,
+        "postgresql": 0.9,
+        "docker": 1.0,
+    }
+
+
+def test_few_dictionary_matches_fall_back_to_the_llm(db_session):
+    SkillTaxonomyService(db_session).sync()
+    job = _create_job(db_session, "Python and a go-getter attitude.")
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python", "Communication"]}
+
+    result = SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+
+    llm_client.generate_json.assert_called_once()
+    assert result == ["python", "communication"]
+    assert [link.confidence_score for link in db_session.query(JobSkill)] == [
+        None,
+        None,
+    ]
+
+
+def test_small_vocabulary_always_uses_the_llm(db_session):
+    job = _create_job(db_session, "Python, SQL, AWS and Docker.")
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python"]}
+
+    SkillService(db_session, llm_client).extract_and_save_many([job.id])
+
+    llm_client.generate_json.assert_called_once()
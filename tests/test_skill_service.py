@@ -1,9 +1,19 @@
 import json
+import threading
+import time
 from unittest.mock import Mock
 
+from sqlalchemy import event
+
 from src.ai.llm_client import LLMClient
+from src.config import settings
 from src.database.models import Job, JobSkill, Skill
-from src.services.skill_service import SkillService
+from src.services.skill_service import (
+    SKILL_SCHEMA,
+    SkillService,
+    batch_skill_schema,
+    pack_descriptions,
+)
 
 
 def _create_job(db_session, description: str) -> Job:
@@ -61,3 +71,230 @@ def test_extract_and_save_skills_uses_existing_skills(db_session):
         for link in db_session.query(JobSkill).filter(JobSkill.job_id == job.id).all()
     }
     assert job_skill_ids == {python_skill.id, sql_skill.id}
+
+
+def test_save_extracted_skills_uses_a_constant_number_of_statements(db_session):
+    first = _create_job(db_session, "First")
+    second = Job(company="Acme Corp", title="Second", description="Second")
+    db_session.add(second)
+    db_session.commit()
+    skill_names = [f"Skill {index}" for index in range(20)]
+    response = {"skills": skill_names}
+    service = SkillService(db_session, Mock(spec=LLMClient))
+
+    statements: list[str] = []
+
+    def count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        assert service.save_extracted_skills(first.id, response) == [
+            name.lower() for name in skill_names
+        ]
+        db_session.commit()
+        cold = len(statements)
+
+        statements.clear()
+        service.save_extracted_skills(second.id, response)
+        db_session.commit()
+        warm = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert cold <= 10
+    assert warm < cold
+    assert not any(
+        statement.lstrip().startswith("INSERT INTO skills") for statement in statements
+    )
+    assert db_session.query(Skill).count() == 20
+    assert db_session.query(JobSkill).count() == 40
+
+
+def test_rolled_back_skills_are_not_cached(db_session):
+    job = _create_job(db_session, "We need Rust.")
+    db_session.commit()
+    service = SkillService(db_session, Mock(spec=LLMClient))
+
+    service.save_extracted_skills(job.id, {"skills": ["Rust"]})
+    db_session.rollback()
+    service.save_extracted_skills(job.id, {"skills": ["Rust"]})
+    db_session.commit()
+
+    rust = db_session.query(Skill).one()
+    assert rust.skill_name == "rust"
+    assert [link.skill_id for link in db_session.query(JobSkill)] == [rust.id]
+    assert rust.frequency == 1
+
+
+class _SlowLLM:
+    """Records how many ``generate_json`` calls overlap."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate_json(
+        self, prompt: str, prompt_version: str = "", validate=None, **options
+    ) -> dict:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return {"skills": ["Python", "SQL"]}
+
+
+def test_extract_and_save_many_bounds_concurrent_llm_calls(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "llm_batch_max_jobs", 1)
+    jobs = [
+        Job(
+            company="Acme Corp",
+            title=f"Engineer {index}",
+            url=f"https://jobs.example.com/acme/{index}",
+            description="We need Python and SQL.",
+        )
+        for index in range(6)
+    ]
+    db_session.add_all(jobs)
+    db_session.add(Job(company="Acme Corp", title="No Description"))
+    db_session.flush()
+    llm_client = _SlowLLM()
+
+    saved = SkillService(db_session, llm_client).extract_and_save_many(
+        [job.id for job in jobs], concurrency=3
+    )
+    db_session.commit()
+
+    assert saved == 6
+    assert llm_client.max_in_flight == 3
+    assert db_session.query(JobSkill).count() == 12
+    assert {skill.skill_name: skill.frequency for skill in db_session.query(Skill)} == {
+        "python": 6,
+        "sql": 6,
+    }
+
+
+def test_pack_descriptions_respects_job_and_token_limits():
+    descriptions = {1: "a" * 40, 2: "b" * 40, 3: "c" * 40, 4: "d" * 4000}
+
+    assert [list(batch) for batch in pack_descriptions(descriptions, 10_000, 2)] == [
+        [1, 2],
+        [3, 4],
+    ]
+    assert [list(batch) for batch in pack_descriptions(descriptions, 60, 8)] == [
+        [1],
+        [2],
+        [3],
+        [4],
+    ]
+
+
+def test_batch_extraction_retries_only_missing_jobs(db_session):
+    jobs = [
+        Job(
+            company="Acme Corp",
+            title=f"Engineer {index}",
+            url=f"https://jobs.example.com/acme/batch-{index}",
+            description=f"Role {index} needs skill {index}.",
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(jobs)
+    db_session.flush()
+    first, second, third = (job.id for job in jobs)
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = [
+        {
+            str(first): {"skills": ["Python"]},
+            str(second): ["SQL"],
+            str(third): "not a skill list",
+        },
+        {"skills": ["Rust"]},
+    ]
+
+    saved = SkillService(db_session, llm_client).extract_and_save_many(
+        [first, second, third]
+    )
+
+    assert saved == 3
+    assert llm_client.generate_json.call_count == 2
+    batch_prompt, retry_prompt = (
+        call.args[0] for call in llm_client.generate_json.call_args_list
+    )
+    assert all(f"Job {job_id}:" in batch_prompt for job_id in (first, second, third))
+    assert "Role 2 needs skill 2." in retry_prompt
+    assert "Role 0" not in retry_prompt
+    batch_call, retry_call = llm_client.generate_json.call_args_list
+    assert batch_call.kwargs["schema"] == batch_skill_schema([first, second, third])
+    assert retry_call.kwargs["schema"] == SKILL_SCHEMA
+    assert retry_call.kwargs["max_items"] == settings.llm_max_skills
+    skills = {
+        job.id: sorted(skill.skill_name for skill in job.skills) for job in jobs
+    }
+    assert skills == {first: ["python"], second: ["sql"], third: ["rust"]}
+
+
+def test_long_descriptions_are_chunked_and_merged(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "llm_description_token_budget", 50)
+    lines = [f"Section {index}: we use tool{index} every day." for index in range(20)]
+    job = _create_job(db_session, "\n".join(lines))
+
+    def generate_json(prompt, prompt_version="", validate=None, **options):
+        tools = sorted(
+            {word.rstrip(".") for word in prompt.split() if word.startswith("tool")}
+        )
+        return {"skills": ["Python", *tools]}
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = generate_json
+
+    result = SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+
+    assert llm_client.generate_json.call_count > 1
+    assert result[0] == "python"
+    assert sorted(result[1:]) == sorted(f"tool{index}" for index in range(20))
+    assert json.loads(job.skills_raw)["chunks"] == llm_client.generate_json.call_count
+
+
+def test_extract_and_save_many_merges_chunks_of_long_descriptions(
+    db_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "llm_description_token_budget", 50)
+    long_job = Job(
+        company="Acme Corp",
+        title="Platform Engineer",
+        url="https://jobs.example.com/acme/platform",
+        description="\n".join(f"Run service {index} on Kubernetes." for index in range(20)),
+    )
+    short_job = Job(
+        company="Acme Corp",
+        title="Analyst",
+        url="https://jobs.example.com/acme/analyst",
+        description="Excel reporting.",
+    )
+    db_session.add_all([long_job, short_job])
+    db_session.flush()
+
+    def generate_json(prompt, prompt_version="", validate=None, **options):
+        if "Kubernetes" in prompt:
+            return {"skills": ["Kubernetes", "Linux"]}
+        return {"skills": ["Excel"]}
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.side_effect = generate_json
+
+    saved = SkillService(db_session, llm_client).extract_and_save_many(
+        [long_job.id, short_job.id]
+    )
+
+    assert saved == 2
+    assert sorted(skill.skill_name for skill in long_job.skills) == [
+        "kubernetes",
+        "linux",
+    ]
+    assert [skill.skill_name for skill in short_job.skills] == ["excel"]
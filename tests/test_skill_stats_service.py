@@ -0,0 +1,189 @@
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+from src.ai.llm_client import LLMClient
+from src.database.models import Job, Skill, SkillDemandDaily
+from src.services.job_service import JobService
+from src.services.skill_service import SkillService
+from src.services.skill_stats_service import SkillGrowth, SkillStatsService
+
+
+def _extract(db_session, title: str, skills: list[str], **fields) -> Job:
+    job = Job(
+        company="Acme Corp",
+        title=title,
+        url=f"https://jobs.example.com/acme/{title.lower().replace(' ', '-')}",
+        description=f"{title} role",
+        **fields,
+    )
+    db_session.add(job)
+    db_session.flush()
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": skills}
+    SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+    db_session.flush()
+    return job
+
+
+def _frequencies(db_session) -> dict[str, int]:
+    return {
+        skill.skill_name: skill.frequency
+        for skill in db_session.query(Skill).populate_existing()
+    }
+
+
+def test_extraction_increments_counters_once_per_job(db_session):
+    job = _extract(db_session, "Data Engineer", ["Python", "SQL", "python"])
+    _extract(db_session, "Backend Engineer", ["Python"])
+    _extract(db_session, "Old Role", ["Go"], status="archived")
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python", "SQL"]}
+    SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+    db_session.flush()
+
+    assert _frequencies(db_session) == {"python": 2, "sql": 1, "go": 0}
+    assert SkillStatsService(db_session).get_top_skills(limit=2) == [
+        ("python", 2),
+        ("sql", 1),
+    ]
+
+
+def test_archive_delete_and_reactivation_adjust_counters(db_session):
+    service = JobService(db_session)
+    first = _extract(db_session, "Data Engineer", ["Python", "SQL"])
+    second = _extract(db_session, "Backend Engineer", ["Python"])
+
+    assert service.archive_job(first.id) is True
+    assert _frequencies(db_session) == {"python": 1, "sql": 0}
+
+    service.upsert_job({"url": first.url, "status": "active"})
+    db_session.flush()
+    assert _frequencies(db_session) == {"python": 2, "sql": 1}
+
+    assert service.delete_job(second.id) is True
+    assert _frequencies(db_session) == {"python": 1, "sql": 1}
+
+    # The filter must match a known location before anything is removed.
+    _extract(db_session, "Analyst", [], location="Brisbane QLD")
+    service.cleanup_jobs("Australia")
+    assert _frequencies(db_session) == {"python": 0, "sql": 0}
+    assert SkillStatsService(db_session).get_top_skills() == []
+
+
+def test_reconcile_repairs_drifted_counters(db_session):
+    _extract(db_session, "Data Engineer", ["Python", "SQL"])
+    db_session.query(Skill).update({Skill.frequency: 7})
+    db_session.flush()
+
+    stats = SkillStatsService(db_session)
+    assert stats.reconcile_frequencies() == 2
+    assert _frequencies(db_session) == {"python": 1, "sql": 1}
+    assert stats.reconcile_frequencies() == 0
+
+
+def _rollup(db_session) -> set[tuple]:
+    rows = db_session.query(
+        SkillDemandDaily.day,
+        Skill.skill_name,
+        SkillDemandDaily.source_platform,
+        SkillDemandDaily.count,
+    ).join(Skill, Skill.id == SkillDemandDaily.skill_id)
+    return set(rows)
+
+
+def test_extraction_updates_daily_demand_rollup(db_session):
+    day = date(2024, 5, 30)
+    job = _extract(
+        db_session,
+        "Data Engineer",
+        ["Python", "SQL"],
+        posted_date=day,
+        source_platform="linkedin",
+    )
+    _extract(db_session, "Backend Engineer", ["Python"], posted_date=day)
+    _extract(
+        db_session,
+        "Platform Engineer",
+        ["Python"],
+        posted_date=day,
+        source_platform="linkedin",
+    )
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": ["Python"]}
+    SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+    db_session.flush()
+
+    expected = {
+        (day, "python", "linkedin", 2),
+        (day, "sql", "linkedin", 1),
+        (day, "python", "", 1),
+    }
+    assert _rollup(db_session) == expected
+
+    db_session.query(SkillDemandDaily).delete()
+    stats = SkillStatsService(db_session)
+    assert stats.backfill_demand() == 3
+    assert _rollup(db_session) == expected
+
+    JobService(db_session).delete_job(job.id)
+    assert stats.backfill_demand(start=day + timedelta(days=1)) == 0
+    assert _rollup(db_session) == expected
+
+
+def test_demand_trends_and_growth_read_the_rollup(db_session):
+    today = date(2024, 6, 30)
+    python = Skill(skill_name="python")
+    rust = Skill(skill_name="rust")
+    sql = Skill(skill_name="sql")
+    db_session.add_all([python, rust, sql])
+    db_session.flush()
+    db_session.add_all(
+        [
+            SkillDemandDaily(day=today, skill_id=python.id, count=3),
+            SkillDemandDaily(
+                day=today, skill_id=python.id, source_platform="seek", count=1
+            ),
+            SkillDemandDaily(
+                day=today - timedelta(days=2), skill_id=python.id, count=2
+            ),
+            SkillDemandDaily(
+                day=today - timedelta(days=10), skill_id=python.id, count=4
+            ),
+            SkillDemandDaily(day=today, skill_id=rust.id, count=1),
+            SkillDemandDaily(
+                day=today - timedelta(days=1), skill_id=sql.id, count=1
+            ),
+            SkillDemandDaily(
+                day=today - timedelta(days=8), skill_id=sql.id, count=2
+            ),
+        ]
+    )
+    db_session.flush()
+
+    stats = SkillStatsService(db_session)
+    trends = stats.get_demand_trends(["python", "go"], days=3, today=today)
+
+    assert trends["python"] == [
+        (today - timedelta(days=2), 2),
+        (today - timedelta(days=1), 0),
+        (today, 4),
+    ]
+    assert [point.count for point in trends["go"]] == [0, 0, 0]
+    seek_only = stats.get_demand_trends(
+        ["python"], days=1, source_platform="seek", today=today
+    )
+    assert seek_only == {"python": [(today, 1)]}
+
+    growth = stats.get_demand_growth(window_days=7, today=today)
+
+    assert growth == [
+        SkillGrowth("rust", 1, 0, None),
+        SkillGrowth("python", 6, 4, 0.5),
+        SkillGrowth("sql", 1, 2, -0.5),
+    ]
+    assert stats.get_demand_growth(window_days=7, min_count=2, today=today) == [
+        SkillGrowth("python", 6, 4, 0.5)
+    ]
@@ -0,0 +1,128 @@
+from datetime import date
+from unittest.mock import Mock
+
+from src.ai.llm_client import LLMClient
+from src.database.models import (
+    Job,
+    JobSkill,
+    Skill,
+    SkillCategory,
+    SkillCategoryClosure,
+    SkillDemandDaily,
+)
+from src.services import skill_taxonomy
+from src.services.skill_service import SkillService
+from src.services.skill_taxonomy import SkillTaxonomyService, get_skill_id_cache
+
+CATEGORIES = {
+    "Programming Languages": None,
+    "Data": None,
+    "Databases": "Data",
+    "Relational": "Databases",
+}
+SKILLS = {
+    "python": ("Programming Languages", ("py", "python3")),
+    "go": ("Programming Languages", ("golang",)),
+    "postgresql": ("Relational", ("postgres",)),
+    "mongodb": ("Databases", ("mongo",)),
+}
+
+
+def _extract(db_session, title: str, skills: list[str]) -> Job:
+    job = Job(
+        company="Acme Corp",
+        title=title,
+        url=f"https://jobs.example.com/acme/{title.lower().replace(' ', '-')}",
+        description=f"{title} role",
+        posted_date=date(2024, 5, 30),
+    )
+    db_session.add(job)
+    db_session.flush()
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_json.return_value = {"skills": skills}
+    SkillService(db_session, llm_client).extract_and_save_skills(job.id)
+    db_session.flush()
+    return job
+
+
+def test_sync_builds_closure_and_is_idempotent(db_session):
+    service = SkillTaxonomyService(db_session)
+    first = service.sync(CATEGORIES, SKILLS)
+    second = service.sync(CATEGORIES, SKILLS)
+
+    assert first == second == (4, 4, 5, 0)
+    ids = {
+        category.name: category.id for category in db_session.query(SkillCategory)
+    }
+    ancestors = {
+        (row.ancestor_id, row.depth)
+        for row in db_session.query(SkillCategoryClosure).filter(
+            SkillCategoryClosure.descendant_id == ids["Relational"]
+        )
+    }
+    assert ancestors == {
+        (ids["Relational"], 0),
+        (ids["Databases"], 1),
+        (ids["Data"], 2),
+    }
+    assert db_session.query(SkillCategoryClosure).count() == 7
+
+
+def test_extraction_canonicalizes_aliases(db_session):
+    SkillTaxonomyService(db_session).sync(CATEGORIES, SKILLS)
+
+    job = _extract(db_session, "Data Engineer", ["Py", "python3", "Golang", "Spark"])
+
+    assert [skill.skill_name for skill in job.skills] == ["python", "go", "spark"]
+    assert db_session.query(Skill).count() == 5
+
+
+def test_sync_merges_existing_alias_skills(db_session):
+    job = _extract(db_session, "Data Engineer", ["py", "python"])
+    other = _extract(db_session, "Backend Engineer", ["postgres"])
+
+    result = SkillTaxonomyService(db_session).sync(CATEGORIES, SKILLS)
+
+    assert result.merged == 2
+    names = {skill.skill_name: skill for skill in db_session.query(Skill)}
+    assert "py" not in names and "postgres" not in names
+    assert names["python"].frequency == 1
+    assert names["postgresql"].frequency == 1
+    assert {link.job_id for link in names["postgresql"].job_skills} == {other.id}
+    assert db_session.query(JobSkill).filter(JobSkill.job_id == job.id).count() == 1
+    demand = {
+        (row.skill_id, row.count) for row in db_session.query(SkillDemandDaily)
+    }
+    assert demand == {(names["python"].id, 2), (names["postgresql"].id, 1)}
+
+
+def test_merge_in_another_process_invalidates_cached_ids(db_session, monkeypatch):
+    _extract(db_session, "Backend Engineer", ["postgres"])
+    db_session.commit()
+    assert get_skill_id_cache().get(db_session, "postgres") is not None
+
+    # As if the sync ran elsewhere: this process's caches are not cleared.
+    monkeypatch.setattr(skill_taxonomy, "_clear_caches", lambda _session: None)
+    SkillTaxonomyService(db_session).sync(CATEGORIES, SKILLS)
+    db_session.commit()
+
+    job = _extract(db_session, "Data Engineer", ["postgres", "py"])
+    db_session.commit()
+
+    assert {skill.skill_name for skill in job.skills} == {"postgresql", "python"}
+    assert get_skill_id_cache().get(db_session, "postgres") is None
+
+
+def test_demand_by_category_rolls_up_through_closure(db_session):
+    service = SkillTaxonomyService(db_session)
+    service.sync(CATEGORIES, SKILLS)
+    _extract(db_session, "Data Engineer", ["python", "postgres", "mongo"])
+    _extract(db_session, "DBA", ["postgresql"])
+    _extract(db_session, "Backend Engineer", ["go", "python"])
+
+    assert service.demand_by_category() == [
+        ("Data", 2),
+        ("Programming Languages", 2),
+    ]
+    assert service.demand_by_category("Data") == [("Databases", 2)]
+    assert service.demand_by_category("Databases") == [("Relational", 2)]
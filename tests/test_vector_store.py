@@ -0,0 +1,124 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.ai.llm_client import LLMClient
+from src.config import settings
+from src.database.models import Job
+from src.services.embedding_service import EmbeddingService
+from src.services.job_service import JobService
+from src.services.vector_store import JobVectorStore
+
+
+def test_search_matches_brute_force_cosine_and_survives_reopen(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(3000, 16)).astype(np.float32)
+    store = JobVectorStore(tmp_path / "vectors")
+    store.add(list(range(1, 1001)), vectors[:1000])
+    store.add(list(range(1001, 3001)), vectors[1000:])
+    query = rng.normal(size=16)
+
+    hits = store.search(query, 5)
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(unit @ (query / np.linalg.norm(query)))[::-1][:5] + 1
+    assert [job_id for job_id, _score in hits] == expected.tolist()
+    assert hits[0][1] >= hits[-1][1]
+
+    reopened = JobVectorStore(tmp_path / "vectors")
+    assert len(reopened) == 3000
+    assert reopened.search(query, 5) == pytest.approx(hits)
+
+
+def test_remove_and_overwrite(tmp_path):
+    store = JobVectorStore(tmp_path / "vectors")
+    store.add([1, 2, 3], [[1, 0], [0, 1], [1, 1]])
+
+    store.remove([1])
+    store.add([2], [[1, 0.1]])
+
+    assert [job_id for job_id, _score in store.search([1, 0], 3)] == [2, 3]
+    assert 1 not in JobVectorStore(tmp_path / "vectors")
+    with pytest.raises(ValueError):
+        store.add([4], [[1, 0, 0]])
+
+
+def test_reader_sees_rows_written_by_another_store(tmp_path):
+    reader = JobVectorStore(tmp_path / "vectors")
+    writer = JobVectorStore(tmp_path / "vectors")
+    writer.add([1], [[1, 0]])
+
+    assert reader.search([1, 0], 1) == [(1, pytest.approx(1.0))]
+
+    writer.add(list(range(2, 2002)), np.tile([0.0, 1.0], (2000, 1)))
+    writer.remove([1])
+
+    assert len(reader.search([0, 1], 5000)) == 2000
+    assert 1 not in reader.job_ids()
+
+
+def _add_jobs(db_session, descriptions, status="active"):
+    jobs = [
+        Job(
+            company="Acme Corp",
+            title=f"Engineer {index}",
+            url=f"https://jobs.example.com/acme/vector-{status}-{index}",
+            description=description,
+            status=status,
+        )
+        for index, description in enumerate(descriptions)
+    ]
+    db_session.add_all(jobs)
+    db_session.flush()
+    return jobs
+
+
+def test_jobs_are_embedded_once_and_ranked(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "embedding_batch_size", 2)
+    python, rust, _sales = _add_jobs(
+        db_session, ["Python and Django.", "Rust services.", "Sales targets."]
+    )
+    (archived,) = _add_jobs(db_session, ["Python too."], status="archived")
+    axes = {"Python": [1, 0, 0], "Rust": [0, 1, 0], "Sales": [0, 0, 1]}
+    llm_client = Mock(spec=LLMClient)
+    llm_client.embed.side_effect = lambda texts, model=None: [
+        next(axis for word, axis in axes.items() if word in text) for text in texts
+    ]
+    store = JobVectorStore(tmp_path / "vectors")
+    service = EmbeddingService(db_session, llm_client, store)
+
+    assert service.embed_new_jobs() == 3
+    assert service.embed_new_jobs() == 0
+    assert llm_client.embed.call_count == 2
+    assert archived.id not in store
+
+    ranked = JobService(db_session).rank_jobs([0.9, 0.3, 0], k=2, store=store)
+
+    assert [job.id for job in ranked] == [python.id, rust.id]
+    assert ranked[0].score == pytest.approx(0.9 / np.hypot(0.9, 0.3))
+
+    JobService(db_session).delete_jobs([rust.id])
+    service.embed_new_jobs()
+    assert rust.id not in store
+
+
+def test_edited_jobs_are_embedded_again(db_session, tmp_path):
+    python, rust = _add_jobs(db_session, ["Python and Django.", "Rust services."])
+    axes = {"Python": [1, 0], "Rust": [0, 1]}
+    llm_client = Mock(spec=LLMClient)
+    llm_client.embed.side_effect = lambda texts, model=None: [
+        next(axis for word, axis in axes.items() if word in text) for text in texts
+    ]
+    store = JobVectorStore(tmp_path / "vectors")
+    service = EmbeddingService(db_session, llm_client, store)
+    assert service.embed_new_jobs() == 2
+
+    python.description = "Now Rust as well."
+    db_session.flush()
+
+    assert service.embed_new_jobs() == 1
+    assert service.embed_new_jobs() == 0
+    scores = dict(store.search([0, 1], k=2))
+    assert scores[python.id] == pytest.approx(1.0)
+    assert scores[rust.id] == pytest.approx(1.0)
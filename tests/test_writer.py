@@ -0,0 +1,117 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.config import settings
+from src.database.models import Base, Job, JobSkill
+from src.database.session import configure_sqlite_engine
+from src.database.writer import WriteCoordinator
+
+
+@pytest.fixture()
+def file_session_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_busy_timeout_ms", 10)
+    database_path = tmp_path / "writer.db"
+    engine = create_engine(f"sqlite:///{database_path}")
+    configure_sqlite_engine(engine)
+    Base.metadata.create_all(engine)
+    try:
+        yield sessionmaker(bind=engine, autoflush=False), database_path
+    finally:
+        engine.dispose()
+
+
+def _add_job(title: str):
+    def write(session):
+        job = Job(company="Acme Corp", title=title)
+        session.add(job)
+        session.flush()
+        return job.id
+
+    return write
+
+
+def _fail(_session):
+    raise ValueError("boom")
+
+
+def test_writer_groups_requests_and_isolates_failures(file_session_factory):
+    session_factory, _ = file_session_factory
+    writer = WriteCoordinator(session_factory, batch_window=0.05)
+
+    try:
+        futures = [writer.submit(_add_job(f"Role {index}")) for index in range(5)]
+        failed = writer.submit(_fail)
+        results = [future.result(timeout=5) for future in futures]
+
+        with pytest.raises(ValueError):
+            failed.result(timeout=5)
+    finally:
+        writer.stop(timeout=5)
+
+    assert len(set(results)) == 5
+    with session_factory() as session:
+        assert session.query(Job).count() == 5
+
+    stats = writer.stats()
+    assert stats.requests == 6
+    assert stats.failures == 1
+    assert stats.batches < 6
+    assert stats.p95_ms >= stats.p50_ms > 0
+
+
+def test_writer_retries_when_database_is_locked(file_session_factory):
+    session_factory, database_path = file_session_factory
+    writer = WriteCoordinator(
+        session_factory,
+        retry_base_delay=0.05,
+        retry_max_delay=0.1,
+        max_retries=20,
+    )
+    blocker = sqlite3.connect(
+        database_path, isolation_level=None, check_same_thread=False
+    )
+    blocker.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.2, blocker.rollback)
+
+    try:
+        release.start()
+        started = time.perf_counter()
+        job_id = writer.execute(_add_job("Locked"), timeout=10)
+        elapsed = time.perf_counter() - started
+    finally:
+        release.cancel()
+        blocker.close()
+        writer.stop(timeout=5)
+
+    assert job_id is not None
+    assert elapsed >= 0.15
+    assert writer.stats().retries >= 1
+
+
+@pytest.mark.asyncio
+async def test_writer_execute_async(file_session_factory):
+    session_factory, _ = file_session_factory
+    writer = WriteCoordinator(session_factory)
+
+    try:
+        job_id = await writer.execute_async(_add_job("Async"))
+    finally:
+        writer.stop(timeout=5)
+
+    with session_factory() as session:
+        assert session.get(Job, job_id).title == "Async"
+
+
+def test_sqlite_engine_enforces_foreign_keys(file_session_factory):
+    session_factory, _ = file_session_factory
+
+    with session_factory() as session:
+        session.add(JobSkill(job_id=999, skill_id=999))
+        with pytest.raises(IntegrityError):
+            session.commit()